@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for Tara Person Following System
+
+This script measures the throughput and latency of the detection loop on
+recorded or synthetic footage, so changes can be compared on the target
+board without a camera or a robot.
+
+Usage:
+    python benchmark.py multiprocess --source synthetic:300
+    python benchmark.py profiles --source hallway.mp4
+    python benchmark.py batch --source frames/
+    python benchmark.py startup
+    python benchmark.py warmup
+    python benchmark.py tracking --people 60
+    python benchmark.py detections --persons 20
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import subprocess
+import tracemalloc
+from typing import Dict, List
+
+import numpy as np
+
+from tara_follow_system.capture import ThreadedFrameCapture, FrameDropPolicy, TimestampedFrame
+from tara_follow_system.detections import DetectionArray, PersonBoundingBox, persons_from_array, match_detections
+from tara_follow_system.frame_source import create_frame_source
+from tara_follow_system.inference_profiles import list_inference_profiles
+from tara_follow_system.shared_frame_transport import InferenceProcess
+from tara_follow_system.tracking import create_tracker, list_trackers
+
+# Suppress YOLO verbose output
+os.environ['YOLO_VERBOSE'] = 'False'
+
+def open_source(args):
+    """
+    Open the benchmark frame source for a fast replay
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Opened FrameSource
+    """
+    source = create_frame_source(args.source, width=args.width, height=args.height,
+                                 replay_mode="fast")
+    if not source.open():
+        raise RuntimeError(f"Failed to open frame source {args.source}")
+    return source
+
+def load_frames(args, max_frames: int) -> List[np.ndarray]:
+    """
+    Read frames into memory so only inference is timed
+
+    Args:
+        args: Parsed command line arguments
+        max_frames: Maximum number of frames to read
+
+    Returns:
+        List of frames
+    """
+    source = open_source(args)
+    frames = []
+    while len(frames) < max_frames:
+        ret, frame = source.read()
+        if not ret:
+            break
+        frames.append(frame)
+    source.release()
+    return frames
+
+def summarize(name: str, frames: int, elapsed: float, latencies: List[float]) -> Dict[str, float]:
+    """
+    Build a result row from frame latencies
+
+    Args:
+        name: Name of the benchmarked variant
+        frames: Number of processed frames
+        elapsed: Wall time of the run in seconds
+        latencies: Capture-to-result latency of each frame in seconds
+
+    Returns:
+        Dictionary with FPS and latency percentiles in milliseconds
+    """
+    latencies_ms = np.array(latencies) * 1000.0 if latencies else np.zeros(1)
+    return {
+        "name": name,
+        "frames": frames,
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+        "latency_mean_ms": float(latencies_ms.mean()),
+        "latency_p95_ms": float(np.percentile(latencies_ms, 95))
+    }
+
+def print_results(results: List[Dict[str, float]]):
+    """Print benchmark rows as a table"""
+    print(f"{'variant':<16} {'frames':>7} {'fps':>8} {'mean ms':>9} {'p95 ms':>9}")
+    for row in results:
+        print(f"{row['name']:<16} {row['frames']:>7} {row['fps']:>8.1f} "
+              f"{row['latency_mean_ms']:>9.1f} {row['latency_p95_ms']:>9.1f}")
+
+def run_single_process(args) -> Dict[str, float]:
+    """
+    Capture thread plus detection and tracking in one process
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Result row
+    """
+    # Imported here so the tracking and detection benchmarks run without torch
+    from tara_follow_system.person_detector import PersonDetector
+
+    detector = PersonDetector(confidence_threshold=args.confidence)
+    capture = ThreadedFrameCapture(open_source(args), drop_policy=FrameDropPolicy.BLOCK)
+    latencies = []
+
+    capture.start()
+    started = time.monotonic()
+    while True:
+        packet = capture.read(timeout=1.0)
+        if packet is None:
+            break
+        persons = detector.detect_persons(packet.frame)
+        detector.track_persons(packet.frame, persons, packet.frame_id)
+        latencies.append(time.monotonic() - packet.capture_time)
+    elapsed = time.monotonic() - started
+
+    capture.release()
+    detector.cleanup()
+    return summarize("single-process", len(latencies), elapsed, latencies)
+
+def run_multiprocess(args) -> Dict[str, float]:
+    """
+    Capture and tracking in this process, detection in a child process
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Result row
+    """
+    from tara_follow_system.person_detector import PersonDetector
+
+    tracker = PersonDetector(load_model=False)
+    source = open_source(args)
+    width, height = source.frame_size
+    inference = InferenceProcess((height, width, 3), num_slots=args.slots,
+                                 detector_kwargs={"confidence_threshold": args.confidence})
+    if not inference.start():
+        raise RuntimeError("Inference process failed to start")
+
+    capture = ThreadedFrameCapture(source, drop_policy=FrameDropPolicy.BLOCK)
+    in_flight: Dict[int, TimestampedFrame] = {}
+    latencies = []
+    capture_done = False
+
+    capture.start()
+    started = time.monotonic()
+    while not capture_done or in_flight:
+        if not capture_done and len(in_flight) < args.slots:
+            packet = capture.read(timeout=1.0)
+            if packet is None:
+                capture_done = True
+            elif inference.submit(packet.frame, packet.frame_id, packet.capture_time, timeout=1.0):
+                in_flight[packet.frame_id] = packet
+
+        timeout = 0.0 if not capture_done and len(in_flight) < args.slots else 1.0
+        record = inference.get_result(timeout=timeout)
+        while record is not None:
+            packet = in_flight.pop(record.frame_id)
+            tracker.track_persons(packet.frame, persons_from_array(record.boxes), packet.frame_id)
+            latencies.append(time.monotonic() - packet.capture_time)
+            record = inference.get_result()
+    elapsed = time.monotonic() - started
+
+    capture.release()
+    inference.stop()
+    tracker.cleanup()
+    return summarize(f"multiprocess/{args.slots}", len(latencies), elapsed, latencies)
+
+def benchmark_profiles(args):
+    """Print FPS and recall of every inference profile"""
+    from tara_follow_system.person_detector import PersonDetector
+
+    frames = load_frames(args, args.frames)
+    if not frames:
+        raise RuntimeError(f"No frames read from {args.source}")
+
+    # Recall is measured against the model at its default settings
+    reference_detector = PersonDetector(confidence_threshold=args.confidence)
+    reference = [reference_detector.detect_persons_array(frame) for frame in frames]
+    reference_detector.cleanup()
+
+    print(f"{'profile':<12} {'imgsz':>6} {'fps':>8} {'ms/frame':>9} {'recall':>7}")
+    for name in list_inference_profiles():
+        detector = PersonDetector(confidence_threshold=args.confidence, profile=name)
+        detector.detect_persons_array(frames[0])  # Exclude model warm-up from the timing
+
+        started = time.monotonic()
+        detections = [detector.detect_persons_array(frame) for frame in frames]
+        elapsed = time.monotonic() - started
+        detector.cleanup()
+
+        profile_recall, _ = match_detections(reference, detections)
+        recall_text = f"{profile_recall:.2f}" if profile_recall is not None else "n/a"
+        print(f"{name:<12} {detector.profile.image_size:>6} {len(frames) / elapsed:>8.1f} "
+              f"{elapsed / len(frames) * 1000.0:>9.1f} {recall_text:>7}")
+
+def benchmark_batch(args):
+    """Compare per-frame detection with batched detection throughput"""
+    from tara_follow_system.person_detector import PersonDetector
+
+    frames = load_frames(args, args.frames)
+    if not frames:
+        raise RuntimeError(f"No frames read from {args.source}")
+
+    detector = PersonDetector(confidence_threshold=args.confidence, profile=args.profile)
+    detector.detect_persons_array(frames[0])  # Exclude model warm-up from the timing
+
+    print(f"{'variant':<12} {'batch':>6} {'fps':>8} {'ms/frame':>9}")
+
+    started = time.monotonic()
+    for frame in frames:
+        detector.detect_persons_array(frame)
+    elapsed = time.monotonic() - started
+    print(f"{'per-frame':<12} {1:>6} {len(frames) / elapsed:>8.1f} {elapsed / len(frames) * 1000.0:>9.1f}")
+
+    for batch_size in [None] + args.batch_sizes:
+        started = time.monotonic()
+        detector.detect_persons_batch_array(frames, batch_size=batch_size)
+        elapsed = time.monotonic() - started
+        name = "auto" if batch_size is None else "fixed"
+        size = batch_size or detector.get_auto_batch_size()
+        print(f"{name:<12} {size:>6} {len(frames) / elapsed:>8.1f} {elapsed / len(frames) * 1000.0:>9.1f}")
+
+    detector.cleanup()
+
+# Run in a fresh interpreter so imports and peak RSS are measured from scratch
+STARTUP_PROBE = '''
+import resource, time
+import numpy as np
+started = time.monotonic()
+from tara_follow_system.person_detector import PersonDetector
+detector = PersonDetector(pose_enabled={pose})
+if {pose}:
+    detector.detect_pose_keypoints(np.zeros((480, 640, 3), dtype=np.uint8))
+print(time.monotonic() - started, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+'''
+
+def measure_startup(pose: bool) -> Dict[str, float]:
+    """
+    Measure PersonDetector startup in a fresh process
+
+    Args:
+        pose: Whether MediaPipe pose is built, as before it became lazy
+
+    Returns:
+        Dictionary with startup seconds and peak RSS in MB
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", STARTUP_PROBE.format(pose=pose)],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+    # ru_maxrss is reported in kilobytes on Linux
+    return {"startup_s": float(output[-2]), "rss_mb": int(output[-1]) / 1024.0}
+
+def benchmark_startup(args):
+    """Compare PersonDetector startup with and without MediaPipe pose"""
+    results = {"lazy pose": measure_startup(False), "eager pose": measure_startup(True)}
+
+    print(f"{'variant':<12} {'startup s':>10} {'peak RSS MB':>12}")
+    for name, row in results.items():
+        print(f"{name:<12} {row['startup_s']:>10.2f} {row['rss_mb']:>12.1f}")
+    saved_time = results["eager pose"]["startup_s"] - results["lazy pose"]["startup_s"]
+    saved_rss = results["eager pose"]["rss_mb"] - results["lazy pose"]["rss_mb"]
+    print(f"{'saved':<12} {saved_time:>10.2f} {saved_rss:>12.1f}")
+
+def benchmark_warmup(args):
+    """Print the latency of the first detector calls on a cold detector"""
+    from tara_follow_system.person_detector import PersonDetector
+
+    detector = PersonDetector(confidence_threshold=args.confidence, profile=args.profile)
+    frame = np.random.default_rng(0).integers(0, 256, (args.height, args.width, 3), dtype=np.uint8)
+
+    latencies = []
+    for _ in range(args.calls):
+        started = time.monotonic()
+        detector.detect_persons_array(frame)
+        latencies.append((time.monotonic() - started) * 1000.0)
+    detector.cleanup()
+
+    print(f"{'call':>5} {'ms':>9}")
+    for index, latency in enumerate(latencies, 1):
+        print(f"{index:>5} {latency:>9.1f}")
+    steady = float(np.median(latencies[len(latencies) // 2:]))
+    print(f"cold {latencies[0]:.1f} ms, steady state {steady:.1f} ms "
+          f"({latencies[0] / steady:.1f}x)")
+
+def simulate_crowd(people: int, frames: int, width: int, height: int, seed: int = 0) -> list:
+    """
+    Simulate detections of a walking crowd
+
+    Persons walk with constant velocity and bounce off the frame edges.
+    Boxes jitter by a few pixels, some detections are missed, and the
+    detection order is shuffled every frame, as with a real detector.
+
+    Args:
+        people: Number of simultaneous persons
+        frames: Number of frames
+        width: Frame width in pixels
+        height: Frame height in pixels
+        seed: Random seed
+
+    Returns:
+        List per frame of (person indices, (N, 4) boxes)
+    """
+    rng = np.random.default_rng(seed)
+    heights = rng.uniform(60, 300, people)
+    widths = heights * 0.4
+    centers = rng.uniform((0, 0), (width, height), (people, 2))
+    velocities = rng.normal(0.0, 3.0, (people, 2))
+
+    sequence = []
+    for _ in range(frames):
+        centers += velocities
+        for axis, limit in ((0, width), (1, height)):
+            outside = (centers[:, axis] < 0) | (centers[:, axis] > limit)
+            velocities[outside, axis] *= -1
+            centers[:, axis] = np.clip(centers[:, axis], 0, limit)
+
+        visible = np.flatnonzero(rng.random(people) > 0.05)
+        rng.shuffle(visible)
+        jitter = rng.normal(0.0, 2.0, (len(visible), 4))
+        half = np.stack([widths[visible], heights[visible]], axis=1) / 2
+        boxes = np.concatenate([centers[visible] - half, centers[visible] + half], axis=1) + jitter
+        sequence.append((visible, boxes))
+    return sequence
+
+def benchmark_tracking(args):
+    """Compare tracker speed and ID consistency on a simulated crowd"""
+    sequence = simulate_crowd(args.people, args.frames, args.width * 3, args.height * 3)
+
+    print(f"{args.people} persons, {args.frames} frames")
+    print(f"{'tracker':<12} {'ms/frame':>9} {'ID switches':>12} {'duplicate IDs':>14}")
+    for name in list_trackers():
+        tracker = create_tracker(name)
+        assigned: Dict[int, int] = {}  # simulated person -> last track ID
+        switches = 0
+        duplicates = 0
+        elapsed = 0.0
+
+        for frame_index, (visible, boxes) in enumerate(sequence):
+            persons = [PersonBoundingBox(int(x1), int(y1), int(x2), int(y2), 0.9)
+                       for x1, y1, x2, y2 in boxes.tolist()]
+            started = time.perf_counter()
+            tracker.update(persons, frame_index)
+            elapsed += time.perf_counter() - started
+
+            ids = [person.person_id for person in persons]
+            duplicates += len(ids) - len(set(ids))
+            for index, person_id in zip(visible.tolist(), ids):
+                if index in assigned and assigned[index] != person_id:
+                    switches += 1
+                assigned[index] = person_id
+
+        print(f"{name:<12} {elapsed / len(sequence) * 1000.0:>9.2f} {switches:>12} {duplicates:>14}")
+
+def benchmark_detections(args):
+    """Compare per-person dataclass boxes with the DetectionArray column container"""
+    rng = np.random.default_rng(0)
+    frames = []
+    for _ in range(args.frames):
+        corners = rng.uniform(0, (args.width, args.height), (args.persons, 2))
+        sizes = rng.uniform(20, 200, (args.persons, 2))
+        confidences = rng.uniform(0.3, 1.0, (args.persons, 1))
+        frames.append(np.hstack([corners, corners + sizes, confidences]).astype(np.float32))
+
+    print(f"{args.persons} persons x {args.frames} frames, {args.accesses} property reads per person")
+    print(f"{'variant':<12} {'build us':>9} {'access us':>10} {'largest us':>11} "
+          f"{'bytes/person':>13} {'blocks/frame':>13}")
+    for name, unpack in (("dataclass", persons_from_array), ("columns", DetectionArray)):
+        started = time.perf_counter()
+        unpacked = [unpack(records) for records in frames]
+        build = time.perf_counter() - started
+
+        # Distance estimation and control read these properties many times per frame
+        started = time.perf_counter()
+        for persons in unpacked:
+            for person in persons:
+                for _ in range(args.accesses):
+                    person.center, person.width, person.height, person.area
+        access = time.perf_counter() - started
+
+        # Target selection, as in PersonDetector.get_largest_person
+        started = time.perf_counter()
+        for persons in unpacked:
+            if isinstance(persons, DetectionArray):
+                persons.largest()
+            else:
+                max(persons, key=lambda p: p.area)
+        largest = time.perf_counter() - started
+        del unpacked
+
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        kept = [unpack(records) for records in frames]
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        stats = after.compare_to(before, 'filename')
+        allocated = sum(stat.size_diff for stat in stats)
+        blocks = sum(stat.count_diff for stat in stats)
+        del kept
+
+        print(f"{name:<12} {build / args.frames * 1e6:>9.1f} {access / args.frames * 1e6:>10.1f} "
+              f"{largest / args.frames * 1e6:>11.1f} {allocated / (args.frames * args.persons):>13.0f} {blocks / args.frames:>13.1f}")
+
+def benchmark_multiprocess(args):
+    """Compare the single-process loop with shared-memory multiprocess inference"""
+    results = [run_single_process(args), run_multiprocess(args)]
+    print_results(results)
+
+def main():
+    """Main function to run a benchmark"""
+    parser = argparse.ArgumentParser(description='Tara Person Following System benchmarks')
+    parser.add_argument('--source', type=str, default='synthetic:300', help='Frame source: video file, image directory or "synthetic[:N]" (default: synthetic:300)')
+    parser.add_argument('--width', type=int, default=640, help='Frame width (default: 640)')
+    parser.add_argument('--height', type=int, default=480, help='Frame height (default: 480)')
+    parser.add_argument('--confidence', type=float, default=0.3, help='Detection confidence threshold (default: 0.3)')
+    parser.add_argument('--log-level', type=str, default='WARNING', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], help='Logging level')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    multiprocess = subparsers.add_parser('multiprocess', help='Single-process loop vs. shared-memory inference process')
+    multiprocess.add_argument('--slots', type=int, default=3, help='Shared frame buffers (default: 3)')
+    multiprocess.set_defaults(run=benchmark_multiprocess)
+
+    profiles = subparsers.add_parser('profiles', help='FPS and recall of each inference profile')
+    profiles.add_argument('--frames', type=int, default=100, help='Number of frames to evaluate (default: 100)')
+    profiles.set_defaults(run=benchmark_profiles)
+
+    batch = subparsers.add_parser('batch', help='Per-frame vs. batched detection throughput')
+    batch.add_argument('--frames', type=int, default=64, help='Number of frames to detect on (default: 64)')
+    batch.add_argument('--batch-sizes', type=int, nargs='*', default=[2, 4, 8], help='Fixed batch sizes to compare (default: 2 4 8)')
+    batch.add_argument('--profile', type=str, default=None, choices=list_inference_profiles(), help='Inference profile (default: model defaults)')
+    batch.set_defaults(run=benchmark_batch)
+
+    startup = subparsers.add_parser('startup', help='PersonDetector startup time and RSS with and without pose')
+    startup.set_defaults(run=benchmark_startup)
+
+    warmup = subparsers.add_parser('warmup', help='Cold vs. steady-state detector latency')
+    warmup.add_argument('--calls', type=int, default=10, help='Number of detector calls (default: 10)')
+    warmup.add_argument('--profile', type=str, default=None, choices=list_inference_profiles(), help='Inference profile (default: model defaults)')
+    warmup.set_defaults(run=benchmark_warmup)
+
+    tracking = subparsers.add_parser('tracking', help='Tracker speed and ID consistency on a simulated crowd')
+    tracking.add_argument('--people', type=int, default=60, help='Simultaneous persons (default: 60)')
+    tracking.add_argument('--frames', type=int, default=300, help='Number of frames (default: 300)')
+    tracking.set_defaults(run=benchmark_tracking)
+
+    detections = subparsers.add_parser('detections', help='Dataclass boxes vs. array-backed person views')
+    detections.add_argument('--persons', type=int, default=20, help='Persons per frame (default: 20)')
+    detections.add_argument('--frames', type=int, default=2000, help='Number of frames (default: 2000)')
+    detections.add_argument('--accesses', type=int, default=10, help='Reads of each derived property per person (default: 10)')
+    detections.set_defaults(run=benchmark_detections)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=getattr(logging, args.log_level.upper()), stream=sys.stdout)
+    args.run(args)
+
+if __name__ == "__main__":
+    main()
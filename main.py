@@ -11,6 +11,9 @@ import logging
 import argparse
 import os
 from tara_follow_system.follow_task import FollowPersonTask, FollowTaskConfig
+from tara_follow_system.inference_profiles import list_inference_profiles
+from tara_follow_system.detector_backends import list_detector_backends
+from tara_follow_system.tracking import list_trackers
 
 # Suppress YOLO verbose output
 os.environ['YOLO_VERBOSE'] = 'False'
@@ -31,19 +34,72 @@ def setup_logging(log_level: str = "INFO"):
         ]
     )
 
+def parse_weights(pairs):
+    """
+    Parse SCORE=WEIGHT command line pairs
+    
+    Args:
+        pairs: List of 'name=value' strings, or None
+        
+    Returns:
+        Dictionary of weights, or None if no pairs were given
+    """
+    if not pairs:
+        return None
+    weights = {}
+    for pair in pairs:
+        name, _, value = pair.partition('=')
+        weights[name] = float(value)
+    return weights
+
 def main():
     """Main function to run the Tara follow person task"""
     parser = argparse.ArgumentParser(description='Tara Person Following System')
     parser.add_argument('--camera', type=int, default=0, help='Camera ID (default: 0)')
+    parser.add_argument('--cameras', type=int, nargs='+', default=None, help='Several camera IDs processed as one batch; the first faces forward')
+    parser.add_argument('--camera-yaws', type=float, nargs='+', default=None, help='Yaw of each camera in degrees relative to forward (e.g. 0 180)')
+    parser.add_argument('--source', type=str, default=None, help='Frame source: camera index, video file, image directory or "synthetic" (default: --camera)')
+    parser.add_argument('--replay-mode', type=str, default='realtime', choices=['realtime', 'fast'], help='Replay timing for recorded sources (default: realtime)')
+    parser.add_argument('--loop', action='store_true', help='Restart recorded sources when they reach the end')
     parser.add_argument('--width', type=int, default=640, help='Frame width (default: 640)')
     parser.add_argument('--height', type=int, default=480, help='Frame height (default: 480)')
     parser.add_argument('--fps', type=int, default=30, help='Target FPS (default: 30)')
     parser.add_argument('--confidence', type=float, default=0.5, help='Detection confidence threshold (default: 0.5)')
+    parser.add_argument('--profile', type=str, default=None, choices=list_inference_profiles(), help='Detection inference profile (default: model defaults)')
+    parser.add_argument('--backend', type=str, default='pytorch', choices=list_detector_backends(), help='Detector inference backend (default: pytorch)')
+    parser.add_argument('--tracker', type=str, default='centroid', choices=list_trackers(), help='Tracker: greedy centroid, optimal Hungarian assignment or Kalman filter (default: centroid)')
+    parser.add_argument('--target-lock', action='store_true', help='Keep the followed person by track ID instead of re-picking the largest person')
+    parser.add_argument('--target-weights', type=str, nargs='+', default=None, metavar='SCORE=WEIGHT', help='Scores that pick a new target when the lock is lost, e.g. size=1 centrality=0.5 track_age=0.25 appearance=1')
+    parser.add_argument('--target-coast', type=int, default=10, help='Frames a locked target missed by the detector is held on its predicted box (default: 10)')
+    parser.add_argument('--reid', action='store_true', help='Recognize the followed person by appearance after their track is lost')
+    parser.add_argument('--reid-ttl', type=float, default=10.0, help='Seconds a track\'s appearance is remembered after it was last seen (default: 10)')
+    parser.add_argument('--reid-threshold', type=float, default=0.6, help='Minimum appearance similarity to re-identify the target (default: 0.6)')
+    parser.add_argument('--warmup', type=int, default=3, help='Synthetic detector passes before the loop starts, 0 disables (default: 3)')
+    parser.add_argument('--background-warmup', action='store_true', help='Warm up the detector on a background thread instead of delaying startup')
+    parser.add_argument('--adaptive-detection', action='store_true', help='Run YOLO every N frames and propagate boxes in between')
+    parser.add_argument('--max-stride', type=int, default=6, help='Maximum detection stride for adaptive detection (default: 6)')
+    parser.add_argument('--optical-flow', action='store_true', help='Propagate boxes with optical flow instead of the motion model')
+    parser.add_argument('--roi', action='store_true', help='While following, detect only in a window around the target')
+    parser.add_argument('--roi-full-interval', type=int, default=15, help='Detector passes between full-frame checks in ROI mode (default: 15)')
+    parser.add_argument('--motion-gate', action='store_true', help='Skip the detector and reuse the last detections while the scene is static')
+    parser.add_argument('--motion-threshold', type=float, default=0.005, help='Changed pixel fraction that counts as motion (default: 0.005)')
+    parser.add_argument('--motion-pixel-threshold', type=int, default=20, help='Gray level difference that counts as a changed pixel (default: 20)')
+    parser.add_argument('--motion-refresh', type=int, default=30, help='Maximum skipped frames before a forced detector pass (default: 30)')
+    parser.add_argument('--dynamic-resolution', action='store_true', help='Choose the detector input size per frame from the target size')
+    parser.add_argument('--min-imgsz', type=int, default=320, help='Smallest input size for dynamic resolution (default: 320)')
+    parser.add_argument('--max-imgsz', type=int, default=960, help='Largest input size for dynamic resolution (default: 960)')
+    parser.add_argument('--latency-budget', type=float, default=0.0, help='Seconds per detector pass that cap the dynamic input size, 0 disables (default: 0)')
     parser.add_argument('--safe-distance', type=float, default=1.0, help='Safe following distance in meters (default: 1.0)')
+    parser.add_argument('--control-rate', type=float, default=0.0, help='Run movement control on its own thread at this rate in Hz (default: once per frame)')
     parser.add_argument('--no-voice', action='store_true', help='Disable voice commands')
     parser.add_argument('--no-display', action='store_true', help='Disable video display')
     parser.add_argument('--save-video', action='store_true', help='Save output video')
     parser.add_argument('--video-filename', type=str, default='follow_output.avi', help='Output video filename')
+    parser.add_argument('--video-drop-policy', type=str, default='drop_oldest', choices=['drop_oldest', 'drop_newest', 'block'], help='Policy when the recorder falls behind (default: drop_oldest)')
+    parser.add_argument('--video-every', type=int, default=1, help='Record every Nth frame (default: 1)')
+    parser.add_argument('--pipelined', action='store_true', help='Run processing stages on separate worker threads')
+    parser.add_argument('--multiprocess', action='store_true', help='Run YOLO inference in a separate process fed through shared memory')
+    parser.add_argument('--inference-slots', type=int, default=3, help='Shared frame buffers for multiprocess inference (default: 3)')
     parser.add_argument('--log-level', type=str, default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], help='Logging level')
     
     args = parser.parse_args()
@@ -58,15 +114,50 @@ def main():
         # Create configuration
         config = FollowTaskConfig(
             camera_id=args.camera,
+            camera_ids=args.cameras,
+            camera_yaw_offsets=args.camera_yaws,
+            source=args.source,
+            replay_mode=args.replay_mode,
+            replay_loop=args.loop,
             frame_width=args.width,
             frame_height=args.height,
             fps=args.fps,
             confidence_threshold=args.confidence,
+            inference_profile=args.profile,
+            detector_backend=args.backend,
+            tracker_type=args.tracker,
+            target_lock=args.target_lock,
+            target_score_weights=parse_weights(args.target_weights),
+            target_coast_frames=args.target_coast,
+            reidentification=args.reid,
+            reid_ttl=args.reid_ttl,
+            reid_threshold=args.reid_threshold,
+            warmup_frames=args.warmup,
+            background_warmup=args.background_warmup,
+            adaptive_detection=args.adaptive_detection,
+            max_detection_stride=args.max_stride,
+            optical_flow_propagation=args.optical_flow,
+            roi_detection=args.roi,
+            roi_full_frame_interval=args.roi_full_interval,
+            motion_gating=args.motion_gate,
+            motion_threshold=args.motion_threshold,
+            motion_pixel_threshold=args.motion_pixel_threshold,
+            motion_refresh_interval=args.motion_refresh,
+            dynamic_resolution=args.dynamic_resolution,
+            min_image_size=args.min_imgsz,
+            max_image_size=args.max_imgsz,
+            detection_latency_budget=args.latency_budget,
             safe_distance=args.safe_distance,
+            control_rate_hz=args.control_rate,
             voice_enabled=not args.no_voice,
             show_display=not args.no_display,
             save_video=args.save_video,
-            video_filename=args.video_filename
+            video_filename=args.video_filename,
+            video_drop_policy=args.video_drop_policy,
+            video_record_every=args.video_every,
+            pipelined=args.pipelined,
+            multiprocess_inference=args.multiprocess,
+            inference_slots=args.inference_slots
         )
         
         # Create and run follow task
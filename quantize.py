@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+INT8 Quantization Script for Tara Person Following System
+
+This script quantizes the person detector from a directory of calibration
+frames and prints a validation report against the FP32 model, so INT8
+inference (--backend onnxruntime-int8) is only enabled when the data
+supports it.
+
+Usage:
+    python quantize.py --calibration calib_frames/ --replay hallway.mp4
+"""
+
+import os
+import sys
+import logging
+import argparse
+
+from tara_follow_system.frame_source import create_frame_source
+from tara_follow_system.inference_profiles import get_inference_profile, list_inference_profiles
+from tara_follow_system.person_detector import DEFAULT_IMAGE_SIZE
+from tara_follow_system.quantization import quantize_detector, validate_quantized_model
+
+# Suppress YOLO verbose output
+os.environ['YOLO_VERBOSE'] = 'False'
+
+def load_replay_frames(source: str, max_frames: int) -> list:
+    """
+    Read validation frames from a recorded source
+
+    Args:
+        source: Video file or image directory
+        max_frames: Maximum number of frames to read
+
+    Returns:
+        List of frames
+    """
+    replay = create_frame_source(source, replay_mode="fast")
+    if not replay.open():
+        raise RuntimeError(f"Failed to open replay source {source}")
+    frames = []
+    while len(frames) < max_frames:
+        ret, frame = replay.read()
+        if not ret:
+            break
+        frames.append(frame)
+    replay.release()
+    return frames
+
+def print_report(report: dict):
+    """Print the validation report"""
+    def percent(value):
+        return f"{value:.1%}" if value is not None else "n/a (no detections)"
+
+    print(f"Validation on {report['frames']} frames (FP32 detections as reference)")
+    print(f"  FP32 latency:     {report['fp32_ms']:.1f} ms/frame")
+    print(f"  INT8 latency:     {report['int8_ms']:.1f} ms/frame ({report['speedup']:.2f}x)")
+    print(f"  Person recall:    {percent(report['recall'])}")
+    print(f"  Person precision: {percent(report['precision'])}")
+
+def main():
+    """Main function to quantize and validate the detector"""
+    parser = argparse.ArgumentParser(description='Quantize the Tara person detector to INT8')
+    parser.add_argument('--calibration', type=str, required=True, help='Directory of calibration frames')
+    parser.add_argument('--model', type=str, default='yolov8n.pt', help='PyTorch YOLO weights (default: yolov8n.pt)')
+    parser.add_argument('--profile', type=str, default=None, choices=list_inference_profiles(), help='Inference profile whose input size is quantized (default: model defaults)')
+    parser.add_argument('--max-frames', type=int, default=200, help='Maximum calibration frames (default: 200)')
+    parser.add_argument('--replay', type=str, default=None, help='Video file or image directory for the validation report')
+    parser.add_argument('--replay-frames', type=int, default=200, help='Maximum validation frames (default: 200)')
+    parser.add_argument('--reference-backend', type=str, default='onnxruntime', choices=['pytorch', 'onnxruntime'], help='Backend running the FP32 reference (default: onnxruntime)')
+    parser.add_argument('--log-level', type=str, default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], help='Logging level')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper()), stream=sys.stdout)
+
+    image_size = get_inference_profile(args.profile).image_size if args.profile else DEFAULT_IMAGE_SIZE
+    int8_path = quantize_detector(args.calibration, args.model, image_size, args.max_frames)
+    print(f"INT8 model: {int8_path}")
+
+    if not args.replay:
+        print("No --replay set given, skipping validation")
+        return
+
+    frames = load_replay_frames(args.replay, args.replay_frames)
+    if not frames:
+        raise RuntimeError(f"No frames read from {args.replay}")
+    report = validate_quantized_model(frames, args.model, args.profile, args.reference_backend)
+    print_report(report)
+
+if __name__ == "__main__":
+    main()
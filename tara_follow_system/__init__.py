@@ -8,16 +8,36 @@ using voice commands, computer vision, and intelligent movement control.
 __version__ = "1.0.0"
 __author__ = "Tara Development Team"
 
-from .person_detector import PersonDetector
-from .distance_estimator import DistanceEstimator
-from .voice_handler import VoiceCommandHandler
-from .movement_controller import MovementController
-from .follow_task import FollowPersonTask
-
-__all__ = [
-    'PersonDetector',
-    'DistanceEstimator', 
-    'VoiceCommandHandler',
-    'MovementController',
-    'FollowPersonTask'
-]
+import importlib
+
+# Public names and their modules; modules are imported on first access so
+# that importing the package does not load ultralytics or speech_recognition
+_LAZY_IMPORTS = {
+    'PersonDetector': '.person_detector',
+    'DistanceEstimator': '.distance_estimator',
+    'VoiceCommandHandler': '.voice_handler',
+    'MovementController': '.movement_controller',
+    'FollowPersonTask': '.follow_task',
+    'ThreadedFrameCapture': '.capture',
+    'FrameSource': '.frame_source',
+    'CameraSource': '.frame_source',
+    'VideoFileSource': '.frame_source',
+    'ImageDirectorySource': '.frame_source',
+    'SyntheticSource': '.frame_source',
+    'create_frame_source': '.frame_source'
+}
+
+__all__ = list(_LAZY_IMPORTS.keys())
+
+def __getattr__(name: str):
+    """Import public names on first access (PEP 562)"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals().keys()) + __all__)
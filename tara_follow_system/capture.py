@@ -0,0 +1,309 @@
+"""
+Threaded Frame Capture for Tara Robot
+
+This module reads camera frames on a dedicated thread so that slow
+inference never blocks the sensor. Only the newest frames are kept in a
+small ring buffer and every frame is stamped with its capture time.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Optional
+
+import numpy as np
+
+class FrameDropPolicy(Enum):
+    """Enumeration of policies applied when a frame buffer is full"""
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest buffered frame
+    DROP_NEWEST = "drop_newest"  # Discard the incoming frame
+    BLOCK = "block"              # Wait until the consumer makes room
+
+@dataclass
+class TimestampedFrame:
+    """Data class for a captured frame and its capture metadata"""
+    frame: np.ndarray
+    frame_id: int
+    capture_time: float  # time.monotonic() when the frame was read
+
+    @property
+    def age(self) -> float:
+        """Get seconds elapsed since the frame was captured"""
+        return time.monotonic() - self.capture_time
+
+class ThreadedFrameCapture:
+    """
+    Background frame capture with a latest-frame ring buffer
+
+    This class provides methods to:
+    1. Read frames from a capture device on its own thread
+    2. Keep only the newest frames according to a drop policy
+    3. Stamp each frame with its capture time
+    4. Report dropped-frame and queue-depth statistics
+    """
+
+    def __init__(self,
+                 capture,
+                 buffer_size: int = 2,
+                 drop_policy: FrameDropPolicy = FrameDropPolicy.DROP_OLDEST,
+                 max_read_failures: int = 10):
+        """
+        Initialize threaded frame capture
+
+        Args:
+            capture: Opened capture object exposing read() and release()
+            buffer_size: Number of frames kept in the ring buffer
+            drop_policy: Policy applied when the buffer is full
+            max_read_failures: Consecutive read failures before capture stops
+        """
+        self.capture = capture
+        self.buffer_size = max(1, buffer_size)
+        self.drop_policy = FrameDropPolicy(drop_policy)
+        self.max_read_failures = max_read_failures
+
+        # Ring buffer guarded by a condition variable
+        self._buffer = deque()
+        self._condition = threading.Condition()
+
+        # Threading and control
+        self.is_running = False
+        self.capture_thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.frames_delivered = 0
+        self.read_failures = 0
+        self.max_queue_depth = 0
+        self._next_frame_id = 0
+
+    def start(self):
+        """Start the background capture thread"""
+        if self.is_running:
+            logging.warning("Frame capture is already running")
+            return
+
+        self.is_running = True
+        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.capture_thread.start()
+
+        logging.info(f"Threaded frame capture started (buffer={self.buffer_size}, "
+                     f"policy={self.drop_policy.value})")
+
+    def stop(self):
+        """Stop the background capture thread"""
+        if not self.is_running:
+            return
+
+        with self._condition:
+            self.is_running = False
+            self._condition.notify_all()
+
+        if self.capture_thread and self.capture_thread.is_alive():
+            self.capture_thread.join(timeout=2.0)
+
+        logging.info("Threaded frame capture stopped")
+
+    def _capture_loop(self):
+        """Main capture loop running in separate thread"""
+        consecutive_failures = 0
+
+        while self.is_running:
+            ret, frame = self.capture.read()
+            capture_time = time.monotonic()
+
+            if not ret:
+                # Recorded sources signal a clean end of stream
+                if getattr(self.capture, 'exhausted', False):
+                    logging.info("Frame source exhausted, stopping frame capture")
+                    break
+                self.read_failures += 1
+                consecutive_failures += 1
+                if consecutive_failures > self.max_read_failures:
+                    logging.error("Too many capture errors, stopping frame capture")
+                    break
+                time.sleep(0.01)
+                continue
+
+            consecutive_failures = 0
+            self._push(TimestampedFrame(frame, self._next_frame_id, capture_time))
+            self._next_frame_id += 1
+
+        with self._condition:
+            self.is_running = False
+            self._condition.notify_all()
+
+    def _push(self, packet: TimestampedFrame):
+        """
+        Add a frame to the ring buffer, applying the drop policy
+
+        Args:
+            packet: Newly captured frame
+        """
+        with self._condition:
+            self.frames_captured += 1
+
+            if len(self._buffer) >= self.buffer_size:
+                if self.drop_policy == FrameDropPolicy.DROP_NEWEST:
+                    self.frames_dropped += 1
+                    return
+                elif self.drop_policy == FrameDropPolicy.BLOCK:
+                    while len(self._buffer) >= self.buffer_size and self.is_running:
+                        self._condition.wait(timeout=0.1)
+                    if not self.is_running:
+                        return
+                else:
+                    self._buffer.popleft()
+                    self.frames_dropped += 1
+
+            self._buffer.append(packet)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._buffer))
+            self._condition.notify_all()
+
+    def read(self, timeout: float = 1.0) -> Optional[TimestampedFrame]:
+        """
+        Get the next frame to process
+
+        With the DROP_OLDEST policy the newest buffered frame is returned and
+        any older frames are discarded, so consumers always see the freshest
+        image. Other policies return frames in capture order.
+
+        Args:
+            timeout: Maximum time to wait for a frame in seconds
+
+        Returns:
+            TimestampedFrame or None if no frame arrived in time
+        """
+        with self._condition:
+            if not self._buffer:
+                self._condition.wait_for(
+                    lambda: self._buffer or not self.is_running, timeout=timeout
+                )
+            if not self._buffer:
+                return None
+
+            if self.drop_policy == FrameDropPolicy.DROP_OLDEST:
+                packet = self._buffer.pop()
+                self.frames_dropped += len(self._buffer)
+                self._buffer.clear()
+            else:
+                packet = self._buffer.popleft()
+
+            self.frames_delivered += 1
+            self._condition.notify_all()
+            return packet
+
+    @property
+    def queue_depth(self) -> int:
+        """Get the number of frames currently buffered"""
+        return len(self._buffer)
+
+    def get_stats(self) -> dict:
+        """
+        Get capture statistics
+
+        Returns:
+            Dictionary with capture counters
+        """
+        return {
+            "frames_captured": self.frames_captured,
+            "frames_delivered": self.frames_delivered,
+            "frames_dropped": self.frames_dropped,
+            "read_failures": self.read_failures,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth
+        }
+
+    def release(self):
+        """Stop capture and release the underlying device"""
+        self.stop()
+        self.capture.release()
+
+class MultiCameraCapture:
+    """
+    Synchronized latest-frame capture from several cameras
+
+    Each camera runs its own ThreadedFrameCapture. Reads return the newest
+    frame of every camera whose capture time lies within a sync window of
+    the newest frame overall, so frames taken around the same time can be
+    processed together as one batch.
+    """
+
+    def __init__(self,
+                 captures: Dict[int, ThreadedFrameCapture],
+                 sync_window: float = 0.05):
+        """
+        Initialize multi-camera capture
+
+        Args:
+            captures: Mapping of camera ID to its threaded capture
+            sync_window: Maximum capture time spread of a frame group in seconds
+        """
+        self.captures = captures
+        self.sync_window = sync_window
+
+        # Statistics
+        self.groups_delivered = 0
+        self.frames_out_of_sync = 0
+
+    def start(self):
+        """Start all camera capture threads"""
+        for capture in self.captures.values():
+            capture.start()
+
+    def read(self, timeout: float = 1.0) -> Dict[int, TimestampedFrame]:
+        """
+        Get a group of frames captured around the same time
+
+        Args:
+            timeout: Maximum time to wait for the first frame in seconds
+
+        Returns:
+            Mapping of camera ID to frame; empty if no camera delivered a frame
+        """
+        deadline = time.monotonic() + timeout
+        latest: Dict[int, TimestampedFrame] = {}
+        for camera_id, capture in self.captures.items():
+            # Wait fully for the first frame, then only a sync window for the rest
+            remaining = max(0.0, deadline - time.monotonic())
+            wait = min(remaining, self.sync_window) if latest else remaining
+            packet = capture.read(timeout=wait)
+            if packet is not None:
+                latest[camera_id] = packet
+
+        if not latest:
+            return {}
+
+        newest = max(packet.capture_time for packet in latest.values())
+        group = {}
+        for camera_id, packet in latest.items():
+            if newest - packet.capture_time <= self.sync_window:
+                group[camera_id] = packet
+            else:
+                # Too old to pair with the others; the camera's next frame replaces it
+                self.frames_out_of_sync += 1
+
+        self.groups_delivered += 1
+        return group
+
+    def get_stats(self) -> dict:
+        """
+        Get capture statistics for every camera
+
+        Returns:
+            Dictionary with per-camera counters and synchronization counters
+        """
+        return {
+            "cameras": {camera_id: capture.get_stats()
+                        for camera_id, capture in self.captures.items()},
+            "groups_delivered": self.groups_delivered,
+            "frames_out_of_sync": self.frames_out_of_sync
+        }
+
+    def release(self):
+        """Stop all capture threads and release the cameras"""
+        for capture in self.captures.values():
+            capture.release()
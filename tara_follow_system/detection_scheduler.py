@@ -0,0 +1,565 @@
+"""
+Detection Scheduling for Tara Robot
+
+This module decides on which frames the person detector is run, and on
+which part of the frame. Between detector passes, boxes are propagated by
+the tracker, which keeps the frame rate high on CPUs where YOLO inference
+is the main cost. A motion gate skips the detector entirely while the
+scene is static, and a resolution controller picks the input size from
+the target's size.
+"""
+
+import math
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .detections import PersonBoundingBox
+
+class AdaptiveStrideScheduler:
+    """
+    Runs detection every N frames with N adapted to latency and motion
+
+    This class provides methods to:
+    1. Decide whether the detector runs on the current frame
+    2. Measure inference latency and frame interval
+    3. Shrink the stride when the target moves fast
+    4. Report the current stride and detection hit rate
+    """
+
+    def __init__(self,
+                 min_stride: int = 1,
+                 max_stride: int = 6,
+                 inference_budget: float = 0.5,
+                 fast_motion: float = 0.15,
+                 smoothing: float = 0.2):
+        """
+        Initialize adaptive stride scheduler
+
+        Args:
+            min_stride: Smallest allowed stride (1 = detect every frame)
+            max_stride: Largest allowed stride
+            inference_budget: Fraction of the frame interval inference may use
+            fast_motion: Target speed (fraction of box width per frame) at
+                which the stride drops to min_stride
+            smoothing: Exponential smoothing factor for latency measurements
+        """
+        self.min_stride = max(1, min_stride)
+        self.max_stride = max(self.min_stride, max_stride)
+        self.inference_budget = inference_budget
+        self.fast_motion = fast_motion
+        self.smoothing = smoothing
+
+        self.stride = self.min_stride
+        self.frames_since_detection = self.stride  # Detect on the first frame
+
+        # Measurements
+        self.inference_latency: Optional[float] = None  # seconds
+        self.frame_interval: Optional[float] = None  # seconds
+        self.target_speed = 0.0  # fraction of box width per frame
+        self._last_capture_time: Optional[float] = None
+
+        # Statistics
+        self.frames_total = 0
+        self.frames_detected = 0
+
+    def should_detect(self, capture_time: Optional[float] = None) -> bool:
+        """
+        Decide whether to run the detector on the current frame
+
+        Args:
+            capture_time: Monotonic capture time of the frame
+
+        Returns:
+            True if the detector should run
+        """
+        if capture_time is not None:
+            if self._last_capture_time is not None and capture_time > self._last_capture_time:
+                self.frame_interval = self._smooth(self.frame_interval,
+                                                   capture_time - self._last_capture_time)
+            self._last_capture_time = capture_time
+
+        self.frames_total += 1
+        if self.frames_since_detection >= self.stride:
+            self.frames_since_detection = 1
+            self.frames_detected += 1
+            return True
+
+        self.frames_since_detection += 1
+        return False
+
+    def record_inference(self, latency: float):
+        """
+        Record the latency of a detector pass
+
+        Args:
+            latency: Inference time in seconds
+        """
+        self.inference_latency = self._smooth(self.inference_latency, latency)
+        self._update_stride()
+
+    def update_motion(self, speed_px: float, box_width: float):
+        """
+        Update the target speed used to limit the stride
+
+        Args:
+            speed_px: Target speed in pixels per frame
+            box_width: Target box width in pixels
+        """
+        self.target_speed = speed_px / box_width if box_width > 0 else 0.0
+        self._update_stride()
+
+    def _update_stride(self):
+        """Recompute the stride from latency and target motion"""
+        # Stride needed so inference fits in its share of the frame time
+        latency_stride = self.min_stride
+        if self.inference_latency and self.frame_interval:
+            budget = self.frame_interval * self.inference_budget
+            latency_stride = math.ceil(self.inference_latency / budget)
+
+        # Fast targets need frequent detections; slow ones tolerate propagation
+        motion_ratio = min(1.0, self.target_speed / self.fast_motion) if self.fast_motion > 0 else 0.0
+        motion_cap = round(self.max_stride - (self.max_stride - self.min_stride) * motion_ratio)
+
+        new_stride = max(self.min_stride, min(latency_stride, motion_cap, self.max_stride))
+        if new_stride != self.stride:
+            logging.debug(f"Detection stride {self.stride} -> {new_stride} "
+                          f"(latency={self.inference_latency}, speed={self.target_speed:.3f})")
+            self.stride = new_stride
+
+    def _smooth(self, current: Optional[float], sample: float) -> float:
+        """Exponentially smooth a measurement"""
+        if current is None:
+            return sample
+        return (1.0 - self.smoothing) * current + self.smoothing * sample
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of frames on which the detector ran"""
+        return self.frames_detected / self.frames_total if self.frames_total else 0.0
+
+    def get_stats(self) -> dict:
+        """
+        Get scheduler statistics
+
+        Returns:
+            Dictionary with the current stride and detector hit rate
+        """
+        return {
+            "stride": self.stride,
+            "hit_rate": self.hit_rate,
+            "inference_ms": self.inference_latency * 1000.0 if self.inference_latency else None,
+            "target_speed": self.target_speed
+        }
+
+class RoiPlanner:
+    """
+    Plans region-of-interest detection around the followed target
+
+    This class provides methods to:
+    1. Predict the target box forward by its motion
+    2. Expand it into a crop window for the detector
+    3. Fall back to full-frame passes periodically, when confidence drops,
+       or when the target was not found in its window
+    4. Report ROI and full-frame pass counts
+    """
+
+    def __init__(self,
+                 expansion: float = 0.5,
+                 min_size: int = 160,
+                 full_frame_interval: int = 15,
+                 min_confidence: float = 0.5,
+                 max_area_fraction: float = 0.6):
+        """
+        Initialize ROI planner
+
+        Args:
+            expansion: Margin added on each side, as a fraction of the box size
+            min_size: Minimum crop width and height in pixels
+            full_frame_interval: Detector passes between full-frame re-verifications
+            min_confidence: Target confidence below which the next pass is full-frame
+            max_area_fraction: Crops larger than this fraction of the frame
+                run full-frame instead, as they save little
+        """
+        self.expansion = expansion
+        self.min_size = min_size
+        self.full_frame_interval = max(1, full_frame_interval)
+        self.min_confidence = min_confidence
+        self.max_area_fraction = max_area_fraction
+
+        # Target state from the last tracked frame
+        self.target: Optional[PersonBoundingBox] = None
+        self.target_frame: Optional[int] = None
+        self.velocity = (0.0, 0.0)  # pixels per frame
+        self.passes_since_full = 0
+        self.force_full = True
+        self.last_roi: Optional[Tuple[int, int, int, int]] = None
+
+        # Statistics
+        self.roi_passes = 0
+        self.full_passes = 0
+        self.target_misses = 0  # ROI passes that lost the target
+
+    def plan(self, frame_id: int, frame_shape: Tuple[int, ...]) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Choose the detection window for a frame
+
+        Args:
+            frame_id: Index of the frame to detect on
+            frame_shape: Shape of the frame
+
+        Returns:
+            (x1, y1, x2, y2) crop window, or None for a full-frame pass
+        """
+        self.last_roi = None
+        if (self.force_full or self.target is None or
+                self.passes_since_full >= self.full_frame_interval):
+            return self._full_pass()
+
+        # Move the last box forward by the frames elapsed since it was seen
+        frames = frame_id - self.target_frame
+        center_x, center_y = self.target.center
+        center_x += self.velocity[0] * frames
+        center_y += self.velocity[1] * frames
+
+        # Widen the margin with the distance the target may have moved
+        height, width = frame_shape[:2]
+        motion = abs(self.velocity[0] * frames), abs(self.velocity[1] * frames)
+        half_width = max(self.min_size, self.target.width * (1 + 2 * self.expansion) + 2 * motion[0]) / 2
+        half_height = max(self.min_size, self.target.height * (1 + 2 * self.expansion) + 2 * motion[1]) / 2
+
+        x1 = int(max(0, center_x - half_width))
+        y1 = int(max(0, center_y - half_height))
+        x2 = int(min(width, center_x + half_width))
+        y2 = int(min(height, center_y + half_height))
+        if x2 <= x1 or y2 <= y1:
+            # The prediction left the frame
+            return self._full_pass()
+        if (x2 - x1) * (y2 - y1) > self.max_area_fraction * width * height:
+            return self._full_pass()
+
+        self.passes_since_full += 1
+        self.roi_passes += 1
+        self.last_roi = (x1, y1, x2, y2)
+        return self.last_roi
+
+    def _full_pass(self) -> None:
+        """Record a full-frame pass"""
+        self.passes_since_full = 0
+        self.force_full = False
+        self.full_passes += 1
+        return None
+
+    def update(self,
+               target: Optional[PersonBoundingBox],
+               frame_id: int,
+               velocity: Tuple[float, float] = (0.0, 0.0)):
+        """
+        Update the target after a detector pass has been tracked
+
+        Args:
+            target: Target person found on the frame (None if not found)
+            frame_id: Index of the frame
+            velocity: Target velocity in pixels per frame
+        """
+        if target is None:
+            if self.last_roi is not None:
+                # Lost in its window; search the whole frame next time
+                self.target_misses += 1
+            self.force_full = True
+            return
+
+        self.target = target
+        self.target_frame = frame_id
+        self.velocity = velocity
+        if target.confidence < self.min_confidence:
+            self.force_full = True
+
+    def reset(self):
+        """Forget the target so the next pass is full-frame"""
+        self.target = None
+        self.target_frame = None
+        self.force_full = True
+        self.last_roi = None
+
+    def get_stats(self) -> dict:
+        """
+        Get ROI planner statistics
+
+        Returns:
+            Dictionary with pass counts and the ROI share of detector passes
+        """
+        passes = self.roi_passes + self.full_passes
+        return {
+            "roi_passes": self.roi_passes,
+            "full_passes": self.full_passes,
+            "roi_fraction": self.roi_passes / passes if passes else 0.0,
+            "target_misses": self.target_misses,
+            "last_roi": self.last_roi
+        }
+
+class MotionGate:
+    """
+    Skips detection on frames where nothing in view has moved
+
+    This class provides methods to:
+    1. Measure the changed pixel fraction against the last detected frame
+       on a small, blurred grayscale copy
+    2. Decide whether the detector runs or the last detections are reused
+    3. Force a refresh after a maximum number of skipped frames
+    4. Report how many frames were skipped
+    """
+
+    def __init__(self,
+                 width: int = 160,
+                 pixel_threshold: int = 20,
+                 motion_threshold: float = 0.005,
+                 refresh_interval: int = 30):
+        """
+        Initialize motion gate
+
+        Args:
+            width: Width in pixels of the downscaled comparison frame
+            pixel_threshold: Gray level difference at which a pixel counts as changed
+            motion_threshold: Changed pixel fraction at which the detector runs
+            refresh_interval: Maximum consecutive skipped frames before a forced pass
+        """
+        self.width = width
+        self.pixel_threshold = pixel_threshold
+        self.motion_threshold = motion_threshold
+        self.refresh_interval = max(1, refresh_interval)
+
+        # Downscaled frame the detections were computed on
+        self.reference: Optional[np.ndarray] = None
+        self.frames_since_detection = 0
+        self.last_motion = 0.0
+
+        # Statistics
+        self.frames_total = 0
+        self.frames_skipped = 0
+        self.forced_refreshes = 0
+
+    def should_detect(self, frame: np.ndarray) -> bool:
+        """
+        Decide whether to run the detector on a frame
+
+        Motion is measured against the last frame the detector ran on, so
+        slow changes accumulate until they cross the threshold.
+
+        Args:
+            frame: Input frame (BGR format)
+
+        Returns:
+            True if the detector should run, False to reuse the last detections
+        """
+        self.frames_total += 1
+        small = self._downscale(frame)
+
+        if self.reference is None or self.reference.shape != small.shape:
+            return self._detect(small)
+
+        changed = cv2.absdiff(small, self.reference) > self.pixel_threshold
+        self.last_motion = float(np.count_nonzero(changed)) / changed.size
+        if self.last_motion >= self.motion_threshold:
+            return self._detect(small)
+
+        if self.frames_since_detection >= self.refresh_interval:
+            self.forced_refreshes += 1
+            return self._detect(small)
+
+        self.frames_since_detection += 1
+        self.frames_skipped += 1
+        return False
+
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        """Get a small blurred grayscale copy of a frame"""
+        height, width = frame.shape[:2]
+        size = (self.width, max(1, round(height * self.width / width)))
+        small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        # Suppress sensor noise so it does not count as motion
+        return cv2.GaussianBlur(small, (5, 5), 0)
+
+    def _detect(self, small: np.ndarray) -> bool:
+        """Make a frame the new reference for a detector pass"""
+        self.reference = small
+        self.frames_since_detection = 0
+        return True
+
+    def reset(self):
+        """Forget the reference so the next frame is detected"""
+        self.reference = None
+        self.frames_since_detection = 0
+
+    @property
+    def skip_rate(self) -> float:
+        """Get the fraction of frames on which the detector was skipped"""
+        return self.frames_skipped / self.frames_total if self.frames_total else 0.0
+
+    def get_stats(self) -> dict:
+        """
+        Get motion gate statistics
+
+        Returns:
+            Dictionary with skipped frame counts and the last measured motion
+        """
+        return {
+            "frames_skipped": self.frames_skipped,
+            "skip_rate": self.skip_rate,
+            "forced_refreshes": self.forced_refreshes,
+            "last_motion": self.last_motion
+        }
+
+class ResolutionController:
+    """
+    Chooses the detector input size from the target's size and latency
+
+    This class provides methods to:
+    1. Pick the smallest input size at which the target stays detectable
+    2. Cap the size by the measured inference latency budget
+    3. Apply hysteresis so the size does not switch back and forth
+    4. Report the current size and the latency measured per size
+    """
+
+    def __init__(self,
+                 min_size: int = 320,
+                 max_size: int = 960,
+                 step: int = 64,
+                 search_size: int = 640,
+                 target_input_height: float = 96.0,
+                 latency_budget: Optional[float] = None,
+                 hysteresis: float = 0.3,
+                 patience: int = 10,
+                 smoothing: float = 0.2):
+        """
+        Initialize resolution controller
+
+        Args:
+            min_size: Smallest input size in pixels
+            max_size: Largest input size in pixels
+            step: Spacing of the candidate sizes (a multiple of the model stride)
+            search_size: Input size used while no target is tracked
+            target_input_height: Target height in input pixels needed for
+                reliable detection
+            latency_budget: Maximum inference time per pass in seconds (None = no cap)
+            hysteresis: Extra height margin, as a fraction, required before
+                switching to a smaller size
+            patience: Consecutive frames a smaller size must be chosen before
+                switching down
+            smoothing: Exponential smoothing factor for latency measurements
+        """
+        self.sizes: List[int] = list(range(min_size, max_size + 1, step))
+        if self.sizes[-1] != max_size:
+            self.sizes.append(max_size)
+        self.search_size = self._snap(search_size)
+        self.target_input_height = target_input_height
+        self.latency_budget = latency_budget
+        self.hysteresis = hysteresis
+        self.patience = max(1, patience)
+        self.smoothing = smoothing
+
+        self.image_size = self.search_size
+        self.latencies: Dict[int, float] = {}  # input size -> smoothed seconds
+        self._shrink_frames = 0
+
+        # Statistics
+        self.switches = 0
+
+    def select(self, target_height: Optional[float], frame_shape: Tuple[int, ...]) -> int:
+        """
+        Choose the input size for the next detector pass
+
+        Larger sizes are taken at once, so a shrinking target is not
+        missed; smaller sizes only after patience frames with margin.
+
+        Args:
+            target_height: Height of the tracked target in frame pixels (None if no target)
+            frame_shape: Shape of the frame
+
+        Returns:
+            Input size in pixels
+        """
+        if target_height:
+            # Letterboxing scales the longest frame side to the input size
+            scale = target_height / max(frame_shape[:2])
+            grow_size = self._size_for(self.target_input_height / scale)
+            shrink_size = self._size_for(self.target_input_height * (1 + self.hysteresis) / scale)
+        else:
+            grow_size = shrink_size = self.search_size
+
+        latency_cap = self._latency_cap()
+        grow_size = min(grow_size, latency_cap)
+        shrink_size = min(shrink_size, latency_cap)
+
+        if grow_size > self.image_size:
+            self._switch(grow_size)
+        elif shrink_size < self.image_size:
+            self._shrink_frames += 1
+            if self._shrink_frames >= self.patience:
+                self._switch(shrink_size)
+        else:
+            self._shrink_frames = 0
+        return self.image_size
+
+    def record_latency(self, image_size: int, latency: float):
+        """
+        Record the latency of a detector pass
+
+        Args:
+            image_size: Input size of the pass
+            latency: Inference time in seconds
+        """
+        current = self.latencies.get(image_size)
+        if current is None:
+            self.latencies[image_size] = latency
+        else:
+            self.latencies[image_size] = (1.0 - self.smoothing) * current + self.smoothing * latency
+
+    def _size_for(self, input_size: float) -> int:
+        """Get the smallest candidate size of at least input_size"""
+        for size in self.sizes:
+            if size >= input_size:
+                return size
+        return self.sizes[-1]
+
+    def _snap(self, size: int) -> int:
+        """Get the candidate size closest to size"""
+        return min(self.sizes, key=lambda candidate: abs(candidate - size))
+
+    def _latency_cap(self) -> int:
+        """Get the largest size predicted to fit the latency budget"""
+        if not self.latency_budget or not self.latencies:
+            return self.sizes[-1]
+        allowed = [size for size in self.sizes if self._predict_latency(size) <= self.latency_budget]
+        return allowed[-1] if allowed else self.sizes[0]
+
+    def _predict_latency(self, size: int) -> float:
+        """Predict inference latency at a size from the nearest measured size"""
+        if size in self.latencies:
+            return self.latencies[size]
+        # Inference cost grows with the input area
+        measured = min(self.latencies, key=lambda candidate: abs(candidate - size))
+        return self.latencies[measured] * (size / measured) ** 2
+
+    def _switch(self, image_size: int):
+        """Change the input size"""
+        logging.info(f"Detector input size {self.image_size} -> {image_size}")
+        self.image_size = image_size
+        self._shrink_frames = 0
+        self.switches += 1
+
+    def get_stats(self) -> dict:
+        """
+        Get resolution controller statistics
+
+        Returns:
+            Dictionary with the current input size, switch count and latency per size
+        """
+        return {
+            "image_size": self.image_size,
+            "switches": self.switches,
+            "latency_ms": {size: latency * 1000.0 for size, latency in sorted(self.latencies.items())}
+        }
@@ -0,0 +1,280 @@
+"""
+Detection Data Types for Tara Robot
+
+This module defines the bounding box type shared by detection, tracking,
+distance estimation and movement control, and a struct-of-arrays
+container for crowded frames that builds per-person views on demand.
+"""
+
+from typing import Iterator, List, Optional, Tuple, Union
+from dataclasses import dataclass
+
+import numpy as np
+
+@dataclass
+class PersonBoundingBox:
+    """Data class for person bounding box information"""
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+    confidence: float
+    person_id: Optional[int] = None
+    camera_id: Optional[int] = None
+    coasting: bool = False  # Predicted by the tracker after the detector missed the person
+    
+    @property
+    def center(self) -> Tuple[int, int]:
+        """Get center point of bounding box"""
+        return ((self.x1 + self.x2) // 2, (self.y1 + self.y2) // 2)
+    
+    @property
+    def width(self) -> int:
+        """Get width of bounding box"""
+        return self.x2 - self.x1
+    
+    @property
+    def height(self) -> int:
+        """Get height of bounding box"""
+        return self.y2 - self.y1
+    
+    @property
+    def area(self) -> int:
+        """Get area of bounding box"""
+        return self.width * self.height
+
+def persons_to_array(persons: Union[List[PersonBoundingBox], "DetectionArray"]) -> np.ndarray:
+    """
+    Pack boxes into a compact detection record array
+    
+    Args:
+        persons: Detected persons, or a DetectionArray whose columns are used directly
+        
+    Returns:
+        (N, 5) float32 array of x1, y1, x2, y2, confidence
+    """
+    if isinstance(persons, DetectionArray):
+        return np.hstack([persons.boxes, persons.confidences[:, None]]).astype(np.float32)
+    if not persons:
+        return np.empty((0, 5), dtype=np.float32)
+    return np.array([(p.x1, p.y1, p.x2, p.y2, p.confidence) for p in persons], dtype=np.float32)
+
+def persons_from_array(records: np.ndarray) -> List[PersonBoundingBox]:
+    """
+    Unpack a detection record array into boxes
+    
+    Args:
+        records: (N, 5) array of x1, y1, x2, y2, confidence
+        
+    Returns:
+        List of PersonBoundingBox objects without IDs
+    """
+    return [
+        PersonBoundingBox(x1=int(x1), y1=int(y1), x2=int(x2), y2=int(y2), confidence=float(confidence))
+        for x1, y1, x2, y2, confidence in records.tolist()
+    ]
+
+class DetectionArray:
+    """
+    Struct-of-arrays container for the persons detected on one frame
+    
+    This class provides methods to:
+    1. Hold box coordinates and confidences as NumPy columns
+    2. Compute centers, sizes and areas for all boxes in one vectorized step
+    3. Find the largest person without a Python loop
+    4. Build PersonView objects on demand, only for the rows that are used
+    
+    Building it costs more than a few dataclasses, so it pays off for
+    crowded frames where whole columns are processed at once; the
+    detector's default output stays one PersonBoundingBox per person.
+    """
+    
+    def __init__(self, records: np.ndarray):
+        """
+        Initialize detection array
+        
+        Args:
+            records: (N, 5) array of x1, y1, x2, y2, confidence
+        """
+        records = np.asarray(records, dtype=np.float32).reshape(-1, 5)
+        self.boxes = records[:, :4].astype(np.int32)
+        self.confidences = records[:, 4].copy()
+        
+        # Derived columns, computed once per frame
+        self.centers = (self.boxes[:, :2] + self.boxes[:, 2:]) // 2
+        self.widths = self.boxes[:, 2] - self.boxes[:, 0]
+        self.heights = self.boxes[:, 3] - self.boxes[:, 1]
+        self.areas = self.widths * self.heights
+        
+        # Track and camera IDs are assigned later, per view
+        self.person_ids: List[Optional[int]] = [None] * len(records)
+        self.camera_ids: List[Optional[int]] = [None] * len(records)
+    
+    def __len__(self) -> int:
+        return len(self.boxes)
+    
+    def __getitem__(self, index: int) -> "PersonView":
+        if not -len(self) <= index < len(self):
+            raise IndexError("detection index out of range")
+        return PersonView(self, index % len(self))
+    
+    def __iter__(self) -> Iterator["PersonView"]:
+        return (PersonView(self, index) for index in range(len(self)))
+    
+    def largest(self) -> Optional["PersonView"]:
+        """Get the person with the largest box, or None if there are none"""
+        if not len(self):
+            return None
+        return PersonView(self, int(np.argmax(self.areas)))
+
+class PersonView:
+    """
+    Lightweight view of one person in a DetectionArray
+    
+    Exposes the PersonBoundingBox attributes and properties, read from the
+    array's columns. Coordinates are read-only, while confidence, person_id
+    and camera_id can be set as on PersonBoundingBox. copy.copy() returns a
+    detached PersonBoundingBox.
+    """
+    
+    __slots__ = ("_detections", "_index")
+    
+    def __init__(self, detections: DetectionArray, index: int):
+        self._detections = detections
+        self._index = index
+    
+    @property
+    def x1(self) -> int:
+        return int(self._detections.boxes[self._index, 0])
+    
+    @property
+    def y1(self) -> int:
+        return int(self._detections.boxes[self._index, 1])
+    
+    @property
+    def x2(self) -> int:
+        return int(self._detections.boxes[self._index, 2])
+    
+    @property
+    def y2(self) -> int:
+        return int(self._detections.boxes[self._index, 3])
+    
+    @property
+    def confidence(self) -> float:
+        return float(self._detections.confidences[self._index])
+    
+    @confidence.setter
+    def confidence(self, value: float):
+        self._detections.confidences[self._index] = value
+    
+    @property
+    def person_id(self) -> Optional[int]:
+        return self._detections.person_ids[self._index]
+    
+    @person_id.setter
+    def person_id(self, value: Optional[int]):
+        self._detections.person_ids[self._index] = value
+    
+    @property
+    def camera_id(self) -> Optional[int]:
+        return self._detections.camera_ids[self._index]
+    
+    @camera_id.setter
+    def camera_id(self, value: Optional[int]):
+        self._detections.camera_ids[self._index] = value
+    
+    @property
+    def coasting(self) -> bool:
+        """Detector output is never a coasting prediction"""
+        return False
+    
+    @property
+    def center(self) -> Tuple[int, int]:
+        """Get center point of bounding box"""
+        center_x, center_y = self._detections.centers[self._index].tolist()
+        return (center_x, center_y)
+    
+    @property
+    def width(self) -> int:
+        """Get width of bounding box"""
+        return int(self._detections.widths[self._index])
+    
+    @property
+    def height(self) -> int:
+        """Get height of bounding box"""
+        return int(self._detections.heights[self._index])
+    
+    @property
+    def area(self) -> int:
+        """Get area of bounding box"""
+        return int(self._detections.areas[self._index])
+    
+    def to_box(self) -> PersonBoundingBox:
+        """Get a detached PersonBoundingBox with the same values"""
+        return PersonBoundingBox(x1=self.x1, y1=self.y1, x2=self.x2, y2=self.y2,
+                                 confidence=self.confidence, person_id=self.person_id,
+                                 camera_id=self.camera_id)
+    
+    def __copy__(self) -> PersonBoundingBox:
+        return self.to_box()
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (PersonBoundingBox, PersonView)):
+            return NotImplemented
+        return ((self.x1, self.y1, self.x2, self.y2, self.confidence, self.person_id, self.camera_id) ==
+                (other.x1, other.y1, other.x2, other.y2, other.confidence, other.person_id, other.camera_id))
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return (f"PersonView(x1={self.x1}, y1={self.y1}, x2={self.x2}, y2={self.y2}, "
+                f"confidence={self.confidence}, person_id={self.person_id}, camera_id={self.camera_id})")
+
+def box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Compute the IoU matrix of two box arrays
+    
+    Args:
+        boxes_a: (N, 4+) array of x1, y1, x2, y2
+        boxes_b: (M, 4+) array of x1, y1, x2, y2
+        
+    Returns:
+        (N, M) IoU matrix
+    """
+    a = boxes_a[:, None, :4]
+    b = boxes_b[None, :, :4]
+    width = np.clip(np.minimum(a[..., 2], b[..., 2]) - np.maximum(a[..., 0], b[..., 0]), 0, None)
+    height = np.clip(np.minimum(a[..., 3], b[..., 3]) - np.maximum(a[..., 1], b[..., 1]), 0, None)
+    intersection = width * height
+    area_a = (a[..., 2] - a[..., 0]) * (a[..., 3] - a[..., 1])
+    area_b = (b[..., 2] - b[..., 0]) * (b[..., 3] - b[..., 1])
+    return intersection / np.maximum(area_a + area_b - intersection, 1e-6)
+
+def match_detections(reference: List[np.ndarray],
+                     detections: List[np.ndarray],
+                     iou_threshold: float = 0.5) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Compare per-frame detections against reference boxes
+    
+    Args:
+        reference: Reference boxes of each frame
+        detections: Detected boxes of each frame
+        iou_threshold: Minimum IoU of a match
+        
+    Returns:
+        Tuple of (recall, precision); None where there are no boxes to count
+    """
+    reference_total = sum(len(boxes) for boxes in reference)
+    detection_total = sum(len(boxes) for boxes in detections)
+    reference_matched = 0
+    detection_matched = 0
+    
+    for expected, found in zip(reference, detections):
+        if len(expected) and len(found):
+            iou = box_iou(expected, found) >= iou_threshold
+            reference_matched += int(iou.any(axis=1).sum())
+            detection_matched += int(iou.any(axis=0).sum())
+    
+    recall = reference_matched / reference_total if reference_total else None
+    precision = detection_matched / detection_total if detection_total else None
+    return recall, precision
@@ -0,0 +1,214 @@
+"""
+Detector Inference Backends for Tara Robot
+
+This module runs YOLO through interchangeable backends. Besides PyTorch,
+the model can be exported once to ONNX Runtime or OpenVINO, which are
+considerably faster on CPU-only robots. Exported models are cached next to
+the original weights, keyed by model hash and input size, so later
+startups load the optimized graph directly.
+"""
+
+import os
+import hashlib
+import logging
+import importlib.util
+from typing import Dict, List, Optional, Type
+
+def model_hash(model_path: str, length: int = 12) -> str:
+    """
+    Get a short content hash of a model file
+
+    Args:
+        model_path: Path to the model weights
+        length: Number of hex digits to keep
+
+    Returns:
+        Hex digest prefix of the file's SHA-256
+    """
+    digest = hashlib.sha256()
+    with open(model_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:length]
+
+class DetectorBackend:
+    """
+    Base class for YOLO inference backends
+
+    This class provides methods to:
+    1. Resolve the model file the backend runs (exporting it if needed)
+    2. Load the model
+    3. Run inference returning Ultralytics results
+
+    The base class runs the PyTorch weights directly. Subclasses set an
+    export format and load the exported model through Ultralytics, so every
+    backend returns the same result objects.
+    """
+
+    name = "pytorch"
+    export_format: Optional[str] = None  # Ultralytics export format
+    required_module: Optional[str] = None  # Runtime package the backend needs
+
+    def __init__(self, model_path: str = "yolov8n.pt", image_size: int = 640):
+        """
+        Initialize detector backend
+
+        Args:
+            model_path: Path to the PyTorch YOLO weights
+            image_size: Model input size in pixels
+        """
+        self.model_path = model_path
+        self.image_size = image_size
+        self.model = None
+
+    def is_available(self) -> bool:
+        """Check whether the backend's runtime is installed"""
+        return self.required_module is None or importlib.util.find_spec(self.required_module) is not None
+
+    def cached_model_path(self) -> Optional[str]:
+        """
+        Get the path of the exported model in the cache
+
+        Returns:
+            Path next to the weights, or None for backends without export
+        """
+        if self.export_format is None:
+            return None
+        directory = os.path.dirname(os.path.abspath(self.model_path))
+        stem = os.path.splitext(os.path.basename(self.model_path))[0]
+        return os.path.join(directory, self._cache_name(stem, model_hash(self.model_path)))
+
+    def _cache_name(self, stem: str, digest: str) -> str:
+        """Get the file name of the exported model"""
+        raise NotImplementedError
+
+    def resolve_model_path(self) -> str:
+        """
+        Get the model file to load, exporting and caching it on first use
+
+        Returns:
+            Path of the model the backend runs
+        """
+        if self.export_format is None:
+            return self.model_path
+
+        from ultralytics import YOLO
+
+        if not os.path.exists(self.model_path):
+            # Ultralytics downloads known weights on first load
+            YOLO(self.model_path)
+
+        cached_path = self.cached_model_path()
+        if os.path.exists(cached_path):
+            logging.info(f"Using cached {self.name} model {cached_path}")
+            return cached_path
+
+        logging.info(f"Exporting {self.model_path} to {self.name} (imgsz={self.image_size}), "
+                     f"this happens once")
+        exported_path = YOLO(self.model_path).export(
+            format=self.export_format, imgsz=self.image_size, dynamic=True, verbose=False
+        )
+        os.replace(str(exported_path), cached_path)
+        logging.info(f"Cached {self.name} model at {cached_path}")
+        return cached_path
+
+    def load(self):
+        """Load the model, exporting it first if needed"""
+        if not self.is_available():
+            raise ImportError(f"{self.name} backend requires the '{self.required_module}' package")
+
+        # Imported here so listing backends does not load ultralytics and torch
+        from ultralytics import YOLO
+
+        self.model = YOLO(self.resolve_model_path(), task="detect")
+        # Suppress YOLO verbose output
+        self.model.verbose = False
+
+    def predict(self, source, **kwargs) -> list:
+        """
+        Run inference
+
+        Args:
+            source: A frame or a list of frames (BGR format)
+            **kwargs: Ultralytics predict arguments
+
+        Returns:
+            List of Ultralytics results, one per frame
+        """
+        return self.model(source, **kwargs)
+
+class PyTorchBackend(DetectorBackend):
+    """Runs the PyTorch weights through Ultralytics"""
+    name = "pytorch"
+
+class ONNXRuntimeBackend(DetectorBackend):
+    """Runs an exported ONNX graph with ONNX Runtime"""
+    name = "onnxruntime"
+    export_format = "onnx"
+    required_module = "onnxruntime"
+
+    def _cache_name(self, stem: str, digest: str) -> str:
+        return f"{stem}-{digest}-{self.image_size}.onnx"
+
+class OpenVINOBackend(DetectorBackend):
+    """Runs an exported OpenVINO IR model"""
+    name = "openvino"
+    export_format = "openvino"
+    required_module = "openvino"
+
+    def _cache_name(self, stem: str, digest: str) -> str:
+        # Ultralytics recognizes OpenVINO models by this directory suffix
+        return f"{stem}-{digest}-{self.image_size}_openvino_model"
+
+class ONNXRuntimeInt8Backend(ONNXRuntimeBackend):
+    """
+    Runs an INT8 quantized ONNX graph with ONNX Runtime
+
+    Quantization needs calibration frames, so the model is not exported
+    automatically; create it with quantize.py first.
+    """
+    name = "onnxruntime-int8"
+
+    def _cache_name(self, stem: str, digest: str) -> str:
+        return f"{stem}-{digest}-{self.image_size}-int8.onnx"
+
+    def resolve_model_path(self) -> str:
+        cached_path = self.cached_model_path()
+        if not os.path.exists(cached_path):
+            raise FileNotFoundError(f"No INT8 model at {cached_path}; run "
+                                    f"'python quantize.py --calibration <frames dir>' first")
+        logging.info(f"Using INT8 model {cached_path}")
+        return cached_path
+
+DETECTOR_BACKENDS: Dict[str, Type[DetectorBackend]] = {
+    "pytorch": PyTorchBackend,
+    "onnxruntime": ONNXRuntimeBackend,
+    "onnxruntime-int8": ONNXRuntimeInt8Backend,
+    "openvino": OpenVINOBackend
+}
+
+def list_detector_backends() -> List[str]:
+    """Get the names of all detector backends"""
+    return list(DETECTOR_BACKENDS.keys())
+
+def create_detector_backend(name: str = "pytorch",
+                            model_path: str = "yolov8n.pt",
+                            image_size: int = 640) -> DetectorBackend:
+    """
+    Create a detector backend by name
+
+    Args:
+        name: Backend name ('pytorch', 'onnxruntime', 'onnxruntime-int8' or 'openvino')
+        model_path: Path to the PyTorch YOLO weights
+        image_size: Model input size in pixels
+
+    Returns:
+        DetectorBackend instance (not yet loaded)
+
+    Raises:
+        ValueError: If the name is not a known backend
+    """
+    if name not in DETECTOR_BACKENDS:
+        raise ValueError(f"Unknown detector backend '{name}', "
+                         f"expected one of {list_detector_backends()}")
+    return DETECTOR_BACKENDS[name](model_path, image_size)
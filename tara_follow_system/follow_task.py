@@ -10,14 +10,24 @@ import numpy as np
 import time
 import logging
 import threading
-from typing import Optional, Tuple
-from dataclasses import dataclass
+import copy
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
-from .person_detector import PersonDetector, PersonBoundingBox
+from .detections import PersonBoundingBox, persons_from_array
 from .distance_estimator import DistanceEstimator, DistanceEstimate
 from .voice_handler import VoiceCommandHandler, CommandType
-from .movement_controller import MovementController, MovementState
+from .movement_controller import MovementController, MovementCommand, MovementState, ControlLoop
+from .capture import ThreadedFrameCapture, MultiCameraCapture, TimestampedFrame, FrameDropPolicy
+from .pipeline import PipelineExecutor
+from .frame_source import create_frame_source, ReplayMode
+from .video_recorder import AsyncVideoRecorder
+from .detection_scheduler import AdaptiveStrideScheduler, MotionGate, ResolutionController, RoiPlanner
+from .shared_frame_transport import InferenceProcess
+from .reidentification import AppearanceCache, appearance_signature
+from .target_selection import SelectionContext, TargetLock, WeightedTargetScorer
 
 class FollowTaskState(Enum):
     """Enumeration of follow task states"""
@@ -32,13 +42,54 @@ class FollowTaskConfig:
     """Configuration for the follow task"""
     # Camera settings
     camera_id: int = 0
+    source: Optional[str] = None  # Camera index, video file, image directory or "synthetic"
+    replay_mode: str = "realtime"  # 'realtime' or 'fast' for recorded sources
+    replay_loop: bool = False
+    camera_ids: Optional[List[int]] = None  # Several cameras batched together; first faces forward
+    camera_yaw_offsets: Optional[List[float]] = None  # Yaw of each camera in degrees (e.g. 0, 180)
+    camera_sync_window: float = 0.05  # Max capture time spread of a camera frame group (seconds)
     frame_width: int = 640
     frame_height: int = 480
     fps: int = 30
     
+    # Capture settings
+    threaded_capture: bool = True
+    capture_buffer_size: int = 2
+    capture_drop_policy: str = "drop_oldest"  # 'drop_oldest', 'drop_newest', 'block'
+    
+    # Execution settings
+    pipelined: bool = False  # Run each processing stage on its own worker
+    pipeline_queue_size: int = 2
+    multiprocess_inference: bool = False  # Run YOLO in its own process fed through shared memory
+    inference_slots: int = 3  # Shared frame buffers (frames in flight) for multiprocess inference
+    
     # Detection settings
     confidence_threshold: float = 0.5
     tracking_enabled: bool = True
+    tracker_type: str = "centroid"  # 'centroid' (greedy), 'hungarian' (optimal assignment), 'kalman'
+    target_lock: bool = False  # Keep the followed person by track ID instead of re-picking the largest
+    target_score_weights: Optional[Dict[str, float]] = None  # Scores picking a new target when the lock is lost
+    target_coast_frames: int = 10  # Frames a locked target missed by the detector is held on its prediction
+    reidentification: bool = False  # Recognize the followed person by appearance after track loss
+    reid_ttl: float = 10.0  # Seconds a track's appearance is remembered after it was last seen
+    reid_threshold: float = 0.6  # Minimum appearance similarity of a re-identification
+    inference_profile: Optional[str] = None  # 'low-latency', 'balanced', 'long-range' (None = model defaults)
+    detector_backend: str = "pytorch"  # 'pytorch', 'onnxruntime', 'onnxruntime-int8', 'openvino'
+    warmup_frames: int = 3  # Synthetic detector passes before the loop starts (0 = off)
+    background_warmup: bool = False  # Warm up while the loop already runs
+    adaptive_detection: bool = False  # Run YOLO every N frames, propagate boxes in between
+    max_detection_stride: int = 6
+    optical_flow_propagation: bool = False
+    roi_detection: bool = False  # Detect only around the target while following
+    roi_full_frame_interval: int = 15  # Detector passes between full-frame re-verifications
+    motion_gating: bool = False  # Reuse the last detections while the scene is static
+    motion_threshold: float = 0.005  # Changed pixel fraction that counts as motion
+    motion_pixel_threshold: int = 20  # Gray level difference that counts as a changed pixel
+    motion_refresh_interval: int = 30  # Maximum skipped frames before a forced detector pass
+    dynamic_resolution: bool = False  # Choose the detector input size from the target's size
+    min_image_size: int = 320
+    max_image_size: int = 960
+    detection_latency_budget: float = 0.0  # Seconds per detector pass that cap the input size (0 = no cap)
     
     # Distance settings
     safe_distance: float = 1.0
@@ -48,6 +99,7 @@ class FollowTaskConfig:
     # Movement settings
     max_linear_velocity: float = 0.5
     max_angular_velocity: float = 1.0
+    control_rate_hz: float = 0.0  # Fixed-rate control thread (0 = control once per frame)
     
     # Voice settings
     voice_enabled: bool = True
@@ -57,6 +109,25 @@ class FollowTaskConfig:
     show_display: bool = True
     save_video: bool = False
     video_filename: str = "follow_task_output.avi"
+    video_queue_size: int = 30
+    video_drop_policy: str = "drop_oldest"  # 'drop_oldest', 'drop_newest', 'block'
+    video_record_every: int = 1  # Record every Nth frame
+
+@dataclass
+class FrameContext:
+    """Per-frame data passed between processing stages"""
+    frame: np.ndarray
+    frame_id: int
+    capture_time: float
+    camera_id: Optional[int] = None
+    detection_ran: bool = True
+    target_reacquired: bool = False
+    detected_persons: List[PersonBoundingBox] = field(default_factory=list)
+    tracked_persons: List[PersonBoundingBox] = field(default_factory=list)
+    target_person: Optional[PersonBoundingBox] = None
+    distance_estimate: Optional[DistanceEstimate] = None
+    distances: Optional[List[float]] = None
+    display_frame: Optional[np.ndarray] = None
 
 class FollowPersonTask:
     """
@@ -79,12 +150,83 @@ class FollowPersonTask:
             config: Configuration object for the task
         """
         self.config = config or FollowTaskConfig()
+        self.multi_camera = bool(self.config.camera_ids) and len(self.config.camera_ids) > 1
         
-        # Initialize modules
-        self.person_detector = PersonDetector(
-            confidence_threshold=0.3,  # Lower threshold for better detection
-            tracking_enabled=self.config.tracking_enabled
-        )
+        # Inference in a separate process (single camera only)
+        self.multiprocess_inference = self.config.multiprocess_inference and not self.multi_camera
+        if self.config.multiprocess_inference and self.multi_camera:
+            logging.warning("Multiprocess inference is not available with multiple cameras")
+        self.inference = None
+        
+        # Pipelined stages run on separate workers, so the detect stage runs
+        # ahead of the track stage; feedback from tracking to detection is off
+        self.pipelined = self.config.pipelined and not self.multi_camera and not self.multiprocess_inference
+        
+        # Slow components (detector, voice, camera) are built concurrently in initialize()
+        self.person_detector = None
+        self.voice_handler = None
+        self.startup_timings: Dict[str, float] = {}
+        self.startup_lock = threading.Lock()  # Guards startup_timings and the voice handoff
+        self.shutting_down = False
+        
+        # Input size controller, created with the detector in _initialize_detector
+        self.resolution_controller = None
+        self.target_height: Optional[float] = None  # Target height of the last tracked frame
+        if self.config.dynamic_resolution and (self.multiprocess_inference or self.multi_camera):
+            logging.warning("Dynamic resolution is only available with single-camera in-process inference")
+        elif self.config.dynamic_resolution and self.pipelined:
+            logging.warning("Dynamic resolution is not available in pipelined mode")
+        
+        # Detection stride scheduler (boxes are propagated on skipped frames)
+        self.detection_scheduler = None
+        if self.config.adaptive_detection and self.multiprocess_inference:
+            logging.warning("Adaptive detection is not available with multiprocess inference")
+        elif self.config.adaptive_detection and self.pipelined:
+            logging.warning("Adaptive detection is not available in pipelined mode")
+        elif self.config.adaptive_detection and self.config.tracking_enabled:
+            self.detection_scheduler = AdaptiveStrideScheduler(
+                max_stride=self.config.max_detection_stride
+            )
+        
+        # Region-of-interest detection around the followed target
+        self.roi_planner = None
+        if self.config.roi_detection and (self.multiprocess_inference or self.multi_camera):
+            logging.warning("ROI detection is only available with single-camera in-process inference")
+        elif self.config.roi_detection and self.pipelined:
+            logging.warning("ROI detection is not available in pipelined mode")
+        elif self.config.roi_detection:
+            self.roi_planner = RoiPlanner(full_frame_interval=self.config.roi_full_frame_interval)
+        
+        # Target lock by track ID while following (single camera)
+        self.target_lock = None
+        if self.config.target_lock and self.multi_camera:
+            logging.warning("Target lock is not available with multiple cameras")
+        elif self.config.target_lock:
+            self.target_lock = TargetLock(WeightedTargetScorer(self.config.target_score_weights))
+        
+        # Appearance cache for re-identifying the followed person (single camera)
+        self.appearance_cache = None
+        self.reid_target_id: Optional[int] = None
+        self.reid_excluded_ids: Optional[set] = None  # Tracks in view when the target was lost
+        if self.config.reidentification and self.multi_camera:
+            logging.warning("Re-identification is not available with multiple cameras")
+        elif self.config.reidentification:
+            self.appearance_cache = AppearanceCache(
+                ttl=self.config.reid_ttl,
+                match_threshold=self.config.reid_threshold
+            )
+        
+        # Motion gate that skips the detector on static frames
+        self.motion_gate = None
+        self.last_detections: List[PersonBoundingBox] = []
+        if self.config.motion_gating and (self.multiprocess_inference or self.multi_camera):
+            logging.warning("Motion gating is only available with single-camera in-process inference")
+        elif self.config.motion_gating:
+            self.motion_gate = MotionGate(
+                pixel_threshold=self.config.motion_pixel_threshold,
+                motion_threshold=self.config.motion_threshold,
+                refresh_interval=self.config.motion_refresh_interval
+            )
         
         self.distance_estimator = DistanceEstimator(
             reference_height_meters=1.7  # Average human height
@@ -98,21 +240,10 @@ class FollowPersonTask:
             max_distance=self.config.max_distance
         )
         
-        # Initialize voice handler if enabled
-        self.voice_handler = None
-        if self.config.voice_enabled:
-            try:
-                self.voice_handler = VoiceCommandHandler(language=self.config.language)
-                # Test if voice handler works
-                if not self.voice_handler.test_microphone():
-                    logging.warning("Voice handler failed, voice commands disabled")
-                    self.voice_handler = None
-                else:
-                    self._setup_voice_callbacks()
-            except Exception as e:
-                logging.error(f"Voice handler initialization failed: {e}")
-                logging.info("Voice commands disabled")
-                self.voice_handler = None
+        # Optional fixed-rate control thread fed with the latest target estimate
+        self.control_loop = None
+        if self.config.control_rate_hz > 0:
+            self.control_loop = ControlLoop(self.movement_controller, rate_hz=self.config.control_rate_hz)
         
         # Task state
         self.current_state = FollowTaskState.IDLE
@@ -120,11 +251,18 @@ class FollowPersonTask:
         self.target_person = None
         
         # Video capture
-        self.cap = None
-        self.video_writer = None
+        self.frame_source = None
+        self.capture = None
+        self.video_recorder = None
+        self.pipeline = None
+        
+        # Rendering is only needed when frames are shown or recorded
+        self.render_enabled = self.config.show_display or self.config.save_video
+        self.render_stats = {"draw_calls": 0}  # Overlay panels; frame copies are counted by the detector
         
         # Performance tracking
         self.frame_count = 0
+        self._next_frame_id = 0
         self.start_time = None
         self.fps_counter = 0
         self.last_fps_time = time.time()
@@ -155,37 +293,43 @@ class FollowPersonTask:
     
     def initialize(self) -> bool:
         """
-        Initialize the task (camera, video writer, etc.)
+        Initialize the task (detector, voice, camera, video writer, etc.)
+        
+        The detector, voice handler and camera are initialized concurrently.
+        Voice commands are accepted as soon as the voice handler is ready,
+        and the task loop does not wait for microphone calibration.
         
         Returns:
             True if initialization successful, False otherwise
         """
         try:
-            # Initialize camera
-            self.cap = cv2.VideoCapture(self.config.camera_id)
-            if not self.cap.isOpened():
-                logging.error(f"Failed to open camera {self.config.camera_id}")
-                return False
+            started = time.monotonic()
+            if self.config.voice_enabled:
+                threading.Thread(target=self._timed_init, args=("voice", self._initialize_voice),
+                                 name="init-voice", daemon=True).start()
             
-            # Set camera properties
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.config.frame_width)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.config.frame_height)
-            self.cap.set(cv2.CAP_PROP_FPS, self.config.fps)
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="init") as pool:
+                camera = pool.submit(self._timed_init, "camera", self._initialize_camera)
+                detector = pool.submit(self._timed_init, "detector", self._initialize_detector, camera)
+                camera_ready, detector_ready = camera.result(), detector.result()
+            with self.startup_lock:
+                self.startup_timings["total"] = time.monotonic() - started
+            self._log_startup_timings()
+            
+            if not camera_ready or not detector_ready:
+                return False
             
-            # Initialize video writer if needed
+            # Initialize background video recorder if needed
             if self.config.save_video:
-                fourcc = cv2.VideoWriter_fourcc(*'XVID')
-                self.video_writer = cv2.VideoWriter(
+                self.video_recorder = AsyncVideoRecorder(
                     self.config.video_filename,
-                    fourcc,
                     self.config.fps,
-                    (self.config.frame_width, self.config.frame_height)
+                    self.frame_source.frame_size,
+                    queue_size=self.config.video_queue_size,
+                    drop_policy=FrameDropPolicy(self.config.video_drop_policy),
+                    record_every=self.config.video_record_every
                 )
-            
-            # Test voice handler if enabled
-            if self.voice_handler:
-                if not self.voice_handler.test_microphone():
-                    logging.warning("Microphone test failed, voice commands may not work")
+                self.video_recorder.start()
             
             logging.info("Task initialization completed successfully")
             return True
@@ -194,6 +338,228 @@ class FollowPersonTask:
             logging.error(f"Task initialization failed: {e}")
             return False
     
+    def _timed_init(self, name: str, function: Callable, *args) -> bool:
+        """
+        Run a component initializer and record how long it took
+        
+        Args:
+            name: Component name used in the startup breakdown
+            function: Initializer returning True on success
+            *args: Arguments for the initializer
+            
+        Returns:
+            Result of the initializer (False if it raised)
+        """
+        started = time.monotonic()
+        try:
+            return function(*args)
+        except Exception as e:
+            logging.error(f"{name.capitalize()} initialization failed: {e}")
+            return False
+        finally:
+            with self.startup_lock:
+                self.startup_timings[name] = time.monotonic() - started
+    
+    def _log_startup_timings(self):
+        """Log the per-component startup breakdown"""
+        with self.startup_lock:
+            timings = dict(self.startup_timings)
+        components = {name: seconds for name, seconds in timings.items() if name != "total"}
+        breakdown = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in components.items())
+        if self.config.voice_enabled and "voice" not in components:
+            breakdown += ", voice still calibrating"
+        logging.info(f"Startup: {breakdown}; total {timings['total']:.2f}s "
+                     f"(sequential {sum(components.values()):.2f}s)")
+    
+    def _initialize_detector(self, camera: Future) -> bool:
+        """
+        Load the person detector (and start the inference process)
+        
+        Args:
+            camera: Future of the camera initializer; multiprocess inference
+                needs the frame size before its shared ring can be created
+            
+        Returns:
+            True if the detector is ready
+        """
+        # Imported here so ultralytics/torch load concurrently with the camera and voice
+        from .person_detector import PersonDetector
+        
+        # With multiprocess inference this instance only tracks and draws
+        self.person_detector = PersonDetector(
+            confidence_threshold=0.3,  # Lower threshold for better detection
+            tracking_enabled=self.config.tracking_enabled,
+            optical_flow_enabled=self.config.optical_flow_propagation,
+            load_model=not self.multiprocess_inference,
+            profile=self.config.inference_profile,
+            backend=self.config.detector_backend,
+            tracker_type=self.config.tracker_type
+        )
+        
+        if not self.multiprocess_inference:
+            if self.config.dynamic_resolution and not self.multi_camera and not self.pipelined:
+                self.resolution_controller = ResolutionController(
+                    min_size=self.config.min_image_size,
+                    max_size=self.config.max_image_size,
+                    search_size=self.person_detector.image_size,
+                    latency_budget=self.config.detection_latency_budget or None
+                )
+            self.person_detector.warmup(
+                (self.config.frame_width, self.config.frame_height),
+                self.config.warmup_frames,
+                background=self.config.background_warmup
+            )
+            return True
+        if not camera.result():
+            return False
+        
+        # Start the inference process; frames are passed at the source's size
+        width, height = self.frame_source.frame_size
+        self.inference = InferenceProcess(
+            (height, width, 3),
+            num_slots=self.config.inference_slots,
+            detector_kwargs={"confidence_threshold": 0.3, "tracking_enabled": False,
+                             "profile": self.config.inference_profile,
+                             "backend": self.config.detector_backend},
+            warmup_frames=self.config.warmup_frames
+        )
+        return self.inference.start()
+    
+    def _initialize_voice(self) -> bool:
+        """
+        Create, test and start the voice handler
+        
+        Listening starts right away, so "follow me" is accepted before the
+        detector and camera are ready.
+        
+        Returns:
+            True if voice commands are available
+        """
+        try:
+            voice_handler = VoiceCommandHandler(language=self.config.language)
+            # Test if voice handler works
+            if not voice_handler.test_microphone():
+                logging.warning("Voice handler failed, voice commands disabled")
+                return False
+        except Exception as e:
+            logging.error(f"Voice handler initialization failed: {e}")
+            logging.info("Voice commands disabled")
+            return False
+        
+        with self.startup_lock:
+            # Camera or detector initialization may have failed meanwhile
+            if self.shutting_down:
+                logging.info("Task shut down during voice initialization, voice commands disabled")
+                return False
+            self.voice_handler = voice_handler
+            self._setup_voice_callbacks()
+            self.voice_handler.start_listening()
+        logging.info("Voice commands ready")
+        return True
+    
+    def _initialize_camera(self) -> bool:
+        """
+        Open the configured camera(s) or replay source
+        
+        Returns:
+            True if frames can be captured
+        """
+        if self.multi_camera:
+            return self._initialize_cameras()
+        return self._initialize_frame_source()
+    
+    def _initialize_frame_source(self) -> bool:
+        """
+        Open the single frame source and its threaded capture
+        
+        Returns:
+            True if the source was opened
+        """
+        # Initialize frame source (live camera or replay)
+        self.frame_source = create_frame_source(
+            self.config.source,
+            camera_id=self.config.camera_id,
+            width=self.config.frame_width,
+            height=self.config.frame_height,
+            fps=self.config.fps,
+            replay_mode=self.config.replay_mode,
+            loop=self.config.replay_loop
+        )
+        if not self.frame_source.open():
+            logging.error(f"Failed to open frame source {self.config.source or self.config.camera_id}")
+            return False
+        
+        # Read frames on a background thread so inference never blocks the camera
+        if self.config.threaded_capture:
+            drop_policy = FrameDropPolicy(self.config.capture_drop_policy)
+            if (not self.frame_source.is_live and
+                    self.frame_source.replay_mode == ReplayMode.FAST):
+                # Fast replays must not skip frames or runs are not reproducible
+                drop_policy = FrameDropPolicy.BLOCK
+            self.capture = ThreadedFrameCapture(
+                self.frame_source,
+                buffer_size=self.config.capture_buffer_size,
+                drop_policy=drop_policy,
+                max_read_failures=self.max_errors
+            )
+        return True
+    
+    def _initialize_cameras(self) -> bool:
+        """
+        Open every configured camera with its own threaded capture
+        
+        Returns:
+            True if all cameras were opened
+        """
+        captures = {}
+        for camera_id in self.config.camera_ids:
+            source = create_frame_source(
+                str(camera_id),
+                width=self.config.frame_width,
+                height=self.config.frame_height,
+                fps=self.config.fps
+            )
+            if not source.open():
+                logging.error(f"Failed to open camera {camera_id}")
+                for capture in captures.values():
+                    capture.release()
+                return False
+            
+            # The forward camera sizes the recording
+            if self.frame_source is None:
+                self.frame_source = source
+            
+            captures[camera_id] = ThreadedFrameCapture(
+                source,
+                buffer_size=self.config.capture_buffer_size,
+                drop_policy=FrameDropPolicy(self.config.capture_drop_policy),
+                max_read_failures=self.max_errors
+            )
+        
+        self.capture = MultiCameraCapture(captures, sync_window=self.config.camera_sync_window)
+        logging.info(f"Opened {len(captures)} cameras: {list(captures.keys())}")
+        return True
+    
+    def _camera_heading_offset(self, camera_id: Optional[int]) -> float:
+        """
+        Get the yaw of a camera relative to the forward camera
+        
+        Args:
+            camera_id: Camera ID (None for single-camera operation)
+            
+        Returns:
+            Heading offset in frame widths, as used by the movement controller
+        """
+        if camera_id is None or not self.config.camera_yaw_offsets:
+            return 0.0
+        
+        index = self.config.camera_ids.index(camera_id)
+        if index >= len(self.config.camera_yaw_offsets):
+            return 0.0
+        
+        yaw_degrees = self.config.camera_yaw_offsets[index]
+        return yaw_degrees / self.distance_estimator.camera_fov_horizontal
+    
     def start_following(self):
         """Start following mode"""
         if self.current_state == FollowTaskState.FOLLOWING:
@@ -202,12 +568,24 @@ class FollowPersonTask:
         
         self.current_state = FollowTaskState.FOLLOWING
         self.movement_controller.start_following()
+        if self.target_lock:
+            self.target_lock.release()
         
         logging.info("Started following mode")
     
     def stop_following(self):
         """Stop following mode"""
         self.current_state = FollowTaskState.STOPPED
+        if self.control_loop:
+            self.control_loop.clear_estimate()
+        if self.roi_planner:
+            self.roi_planner.reset()
+        if self.appearance_cache:
+            self.appearance_cache.clear()
+            self.reid_target_id = None
+            self.reid_excluded_ids = None
+        if self.target_lock:
+            self.target_lock.release()
         self.movement_controller.stop_following()
         self.target_person = None
         
@@ -227,154 +605,649 @@ class FollowPersonTask:
         """
         if not self.initialize():
             logging.error("Failed to initialize task")
+            self._cleanup()
             return
         
-        # Start voice handler if enabled
-        if self.voice_handler:
-            self.voice_handler.start_listening()
-        
         self.is_running = True
         self.start_time = time.time()
         
+        if self.capture:
+            self.capture.start()
+        
+        if self.control_loop:
+            self.control_loop.start()
+        
         logging.info("Starting follow person task loop")
         
+        try:
+            if self.multi_camera:
+                if self.config.pipelined:
+                    logging.warning("Pipelined mode is not available with multiple cameras")
+                self._run_multi_camera()
+            elif self.multiprocess_inference:
+                if self.config.pipelined:
+                    logging.warning("Pipelined mode is not available with multiprocess inference")
+                self._run_multiprocess()
+            elif self.config.pipelined:
+                self._run_pipelined()
+            else:
+                self._run_sequential()
+                
+        except KeyboardInterrupt:
+            logging.info("Task interrupted by user")
+        except Exception as e:
+            logging.error(f"Error in task loop: {e}")
+        finally:
+            self._cleanup()
+    
+    def _run_sequential(self):
+        """Run all processing stages back to back on the calling thread"""
+        while self.is_running:
+            # Capture frame
+            packet = self._read_frame()
+            if packet is None:
+                if not self._on_capture_failure():
+                    break
+                continue
+            
+            # Process frame
+            context = self._process_frame(packet)
+            
+            if not self._finish_frame(context):
+                break
+    
+    def _run_pipelined(self):
+        """
+        Run processing stages on separate workers connected by bounded queues
+        
+        Capture keeps running on its own thread while detection, tracking,
+        distance estimation, control and rendering each run on a dedicated
+        worker. Frames complete in capture order and display, recording and
+        key handling stay on the calling thread.
+        """
+        stages = [
+            ("detect", self._detect_stage),
+            ("track", self._track_stage),
+            ("distance", self._distance_stage),
+            ("control", self._control_stage)
+        ]
+        if self.render_enabled:
+            stages.append(("render", self._render_stage))
+        
+        self.pipeline = PipelineExecutor(stages, queue_size=self.config.pipeline_queue_size)
+        self.pipeline.start()
+        
         try:
             while self.is_running:
-                # Capture frame
-                ret, frame = self.cap.read()
-                if not ret:
-                    logging.error("Failed to capture frame")
-                    self.error_count += 1
-                    if self.error_count > self.max_errors:
-                        logging.error("Too many capture errors, stopping task")
+                packet = self._read_frame()
+                if packet is None:
+                    if not self._on_capture_failure():
                         break
                     continue
                 
-                # Process frame
-                self._process_frame(frame)
-                
-                # Handle voice commands
-                if self.voice_handler:
-                    self._handle_voice_commands()
-                
-                # Update display
-                if self.config.show_display:
-                    self._update_display(frame)
-                
-                # Save video if enabled
-                if self.video_writer:
-                    self.video_writer.write(frame)
+                context = FrameContext(packet.frame, packet.frame_id, packet.capture_time)
                 
-                # Update performance metrics
-                self._update_performance_metrics()
+                # Backpressure: wait for room in the first stage while draining results
+                while not self.pipeline.submit(context, timeout=0.005):
+                    if not self._drain_pipeline():
+                        return
                 
-                # Check for exit conditions
-                if self.config.show_display:
-                    key = cv2.waitKey(1) & 0xFF
-                    if key == ord('q') or key == 27:  # 'q' or ESC
+                if not self._drain_pipeline():
+                    return
+        finally:
+            self.pipeline.stop()
+    
+    def _run_multiprocess(self):
+        """
+        Run YOLO inference in a separate process fed through shared memory
+        
+        Capture, tracking, control and rendering stay in this process. Frames
+        are copied into a shared-memory ring that the inference process reads,
+        and only small detection records come back. Up to inference_slots
+        frames are in flight, so capture continues while a frame is detected.
+        """
+        in_flight: Dict[int, TimestampedFrame] = {}
+        slots = self.config.inference_slots
+        
+        while self.is_running:
+            if len(in_flight) < slots:
+                packet = self._read_frame()
+                if packet is None:
+                    if not self._on_capture_failure():
                         break
-                    elif key == ord('f'):  # 'f' for follow
-                        self.start_following()
-                    elif key == ord('s'):  # 's' for stop
-                        self.stop_following()
+                elif self._submit_inference(packet):
+                    in_flight[packet.frame_id] = packet
+            
+            # Wait for a result only when every slot is busy
+            timeout = 0.1 if len(in_flight) >= slots else 0.0
+            if not self._drain_inference(in_flight, timeout):
+                return
+        
+        # Finish frames still being detected, e.g. at the end of a replay
+        deadline = time.monotonic() + 5.0
+        while in_flight and time.monotonic() < deadline:
+            if not self._drain_inference(in_flight, 0.1):
+                return
+    
+    def _submit_inference(self, packet: TimestampedFrame) -> bool:
+        """
+        Pass a frame to the inference process
+        
+        Args:
+            packet: Captured frame with its metadata
+            
+        Returns:
+            True if the frame was submitted
+        """
+        frame_shape = self.inference.frame_shape
+        if packet.frame.shape != frame_shape:
+            # The shared ring has a fixed shape; track and draw on the resized frame too
+            packet.frame = cv2.resize(packet.frame, (frame_shape[1], frame_shape[0]))
+        return self.inference.submit(packet.frame, packet.frame_id, packet.capture_time, timeout=0.1)
+    
+    def _drain_inference(self, in_flight: Dict[int, TimestampedFrame], timeout: float) -> bool:
+        """
+        Finish every frame whose detections have come back
+        
+        Args:
+            in_flight: Submitted frames by frame ID; finished frames are removed
+            timeout: Maximum time to wait for the first result
+            
+        Returns:
+            False if the task should stop, True otherwise
+        """
+        if not self.inference.process.is_alive():
+            logging.error("Inference process exited, stopping task")
+            return False
+        
+        record = self.inference.get_result(timeout=timeout)
+        while record is not None:
+            packet = in_flight.pop(record.frame_id)
+            context = FrameContext(packet.frame, packet.frame_id, packet.capture_time)
+            context.detected_persons = persons_from_array(record.boxes)
+            
+            try:
+                self._track_stage(context)
+                self._distance_stage(context)
+                self._control_stage(context)
+                if self.render_enabled:
+                    self._render_stage(context)
                 
-        except KeyboardInterrupt:
-            logging.info("Task interrupted by user")
+                # Reset error count on successful processing
+                self.error_count = 0
+                
+            except Exception as e:
+                logging.error(f"Error processing frame: {e}")
+                self.error_count += 1
+            
+            if not self._finish_frame(context):
+                return False
+            record = self.inference.get_result()
+        return self.is_running
+    
+    def _run_multi_camera(self):
+        """Process synchronized frame groups from several cameras"""
+        while self.is_running:
+            group = self.capture.read(timeout=1.0)
+            if not group:
+                if not self._on_capture_failure():
+                    break
+                continue
+            
+            context = self._process_camera_group(group)
+            
+            if not self._finish_frame(context):
+                break
+    
+    def _process_camera_group(self, group: Dict[int, TimestampedFrame]) -> "FrameContext":
+        """
+        Process frames captured around the same time by several cameras
+        
+        All frames go through YOLO in one batched call, are tracked per camera,
+        and the target is then selected across cameras.
+        
+        Args:
+            group: Mapping of camera ID to captured frame
+            
+        Returns:
+            FrameContext of the camera holding the target (or the first camera)
+        """
+        contexts = [
+            FrameContext(packet.frame, packet.frame_id, packet.capture_time, camera_id=camera_id)
+            for camera_id, packet in group.items()
+        ]
+        context = contexts[0]
+        
+        try:
+            scheduler = self.detection_scheduler
+            capture_time = max(item.capture_time for item in contexts)
+            if scheduler and not scheduler.should_detect(capture_time):
+                for item in contexts:
+                    item.detection_ran = False
+            else:
+                started = time.monotonic()
+                # One YOLO call for the whole group keeps the cameras in step
+                detections = self.person_detector.detect_persons_batch(
+                    [item.frame for item in contexts], batch_size=len(contexts)
+                )
+                if scheduler:
+                    scheduler.record_inference(time.monotonic() - started)
+                for item, detected_persons in zip(contexts, detections):
+                    item.detected_persons = detected_persons
+            
+            for item in contexts:
+                self._track_stage(item)
+            
+            # Select the target across cameras (largest/closest)
+            candidates = [item for item in contexts if item.target_person]
+            if candidates:
+                context = max(candidates, key=lambda item: item.target_person.area)
+            
+            self._distance_stage(context)
+            self._control_stage(context)
+            if self.render_enabled:
+                self._render_stage(context)
+            
+            # Reset error count on successful processing
+            self.error_count = 0
+            
         except Exception as e:
-            logging.error(f"Error in task loop: {e}")
-        finally:
-            self._cleanup()
+            logging.error(f"Error processing camera frames: {e}")
+            self.error_count += 1
+        
+        return context
+    
+    def _drain_pipeline(self) -> bool:
+        """
+        Finish every frame that has left the pipeline
+        
+        Returns:
+            False if the task should stop, True otherwise
+        """
+        context = self.pipeline.get_result()
+        while context is not None:
+            self.error_count = 0
+            if not self._finish_frame(context):
+                return False
+            context = self.pipeline.get_result()
+        return self.is_running
+    
+    def _on_capture_failure(self) -> bool:
+        """
+        Record a failed frame capture
+        
+        Returns:
+            False if the source is finished or too many errors occurred
+        """
+        if self.frame_source.exhausted:
+            logging.info("Replay finished, stopping task")
+            return False
+        
+        logging.error("Failed to capture frame")
+        self.error_count += 1
+        if self.error_count > self.max_errors:
+            logging.error("Too many capture errors, stopping task")
+            return False
+        return True
     
-    def _process_frame(self, frame: np.ndarray):
+    def _finish_frame(self, context: "FrameContext") -> bool:
         """
-        Process a single video frame
+        Handle voice commands, display, recording and metrics for a processed frame
         
         Args:
-            frame: Input video frame
+            context: Processed frame context
+            
+        Returns:
+            False if the user requested exit, True otherwise
         """
+        output_frame = context.display_frame if context.display_frame is not None else context.frame
+        
+        # Handle voice commands
+        if self.voice_handler:
+            self._handle_voice_commands()
+        
+        # Update display
+        if self.config.show_display:
+            self._update_display(output_frame)
+        
+        # Save video if enabled
+        if self.video_recorder:
+            self.video_recorder.write(output_frame)
+        
+        # Update performance metrics
+        self._update_performance_metrics()
+        
+        # Check for exit conditions
+        if self.config.show_display:
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord('q') or key == 27:  # 'q' or ESC
+                return False
+            elif key == ord('f'):  # 'f' for follow
+                self.start_following()
+            elif key == ord('s'):  # 's' for stop
+                self.stop_following()
+        
+        return True
+    
+    def _read_frame(self) -> Optional[TimestampedFrame]:
+        """
+        Read the next frame from the threaded capture or the camera directly
+        
+        Returns:
+            TimestampedFrame or None if capture failed
+        """
+        if self.capture:
+            return self.capture.read(timeout=1.0)
+        
+        ret, frame = self.frame_source.read()
+        if not ret:
+            return None
+        packet = TimestampedFrame(frame, self._next_frame_id, time.monotonic())
+        self._next_frame_id += 1
+        return packet
+    
+    def _process_frame(self, packet: TimestampedFrame) -> "FrameContext":
+        """
+        Process a single video frame through every stage sequentially
+        
+        Args:
+            packet: Captured frame with its metadata
+            
+        Returns:
+            FrameContext with detection, tracking and rendering results
+        """
+        context = FrameContext(packet.frame, packet.frame_id, packet.capture_time)
+        
         try:
-            # Detect persons in frame
-            detected_persons = self.person_detector.detect_persons(frame)
+            self._detect_stage(context)
+            self._track_stage(context)
+            self._distance_stage(context)
+            self._control_stage(context)
+            if self.render_enabled:
+                self._render_stage(context)
             
+            # Reset error count on successful processing
+            self.error_count = 0
+            
+        except Exception as e:
+            logging.error(f"Error processing frame: {e}")
+            self.error_count += 1
+        
+        return context
+    
+    def _detect_stage(self, context: "FrameContext") -> "FrameContext":
+        """Detect persons in the frame, unless the scheduler skips this frame"""
+        scheduler = self.detection_scheduler
+        if scheduler and not scheduler.should_detect(context.capture_time):
+            context.detection_ran = False
+            return context
+        
+        if self.motion_gate and not self.motion_gate.should_detect(context.frame):
+            # Static scene: feed the tracker copies of the last detections
+            context.detected_persons = [copy.copy(person) for person in self.last_detections]
+            return context
+        
+        started = time.monotonic()
+        roi = None
+        if self.roi_planner and self.current_state == FollowTaskState.FOLLOWING:
+            roi = self.roi_planner.plan(context.frame_id, context.frame.shape)
+        if roi:
+            context.detected_persons = self.person_detector.detect_persons_roi(context.frame, roi)
+        elif self.resolution_controller:
+            image_size = self.resolution_controller.select(self.target_height, context.frame.shape)
+            context.detected_persons = self.person_detector.detect_persons(context.frame, image_size)
+            self.resolution_controller.record_latency(image_size, time.monotonic() - started)
+        else:
+            context.detected_persons = self.person_detector.detect_persons(context.frame)
+        if self.motion_gate:
+            self.last_detections = [copy.copy(person) for person in context.detected_persons]
+        if scheduler:
+            scheduler.record_inference(time.monotonic() - started)
+        return context
+    
+    def _track_stage(self, context: "FrameContext") -> "FrameContext":
+        """Track detected persons and select the target person"""
+        if context.detection_ran:
             # Track persons if tracking is enabled
-            tracked_persons = self.person_detector.track_persons(frame, detected_persons)
+            context.tracked_persons = self.person_detector.track_persons(
+                context.frame, context.detected_persons, context.frame_id, context.camera_id
+            )
+        else:
+            # Propagate tracked boxes on frames without a detector pass
+            context.tracked_persons = self.person_detector.propagate_persons(
+                context.frame, context.frame_id, context.camera_id
+            )
+        
+        if context.camera_id is not None:
+            for person in context.tracked_persons:
+                person.camera_id = context.camera_id
+        
+        following = self.current_state in (FollowTaskState.FOLLOWING, FollowTaskState.SEARCHING)
+        locked = self.target_lock is not None and following and context.camera_id is None
+        if locked:
+            context.target_person = self._select_locked_target(context)
+        else:
+            # Get the target person (largest/closest)
+            context.target_person = self.person_detector.get_largest_person(context.tracked_persons)
+        
+        # Keep the followed person across track losses by appearance
+        if self.appearance_cache and following:
+            self._reidentify_target(context)
+        
+        if locked:
+            if context.target_person:
+                self.target_lock.lock(context.target_person.person_id)
+                self.movement_controller.target_person_id = context.target_person.person_id
+            else:
+                self.target_lock.release()
+        
+        # The next input size is chosen from the target's height
+        if self.resolution_controller:
+            self.target_height = context.target_person.height if context.target_person else None
+        
+        # Faster targets need more frequent detector passes
+        if self.detection_scheduler and context.target_person:
+            vx, vy = self.person_detector.get_track_velocity(
+                context.target_person.person_id, context.camera_id
+            )
+            self.detection_scheduler.update_motion(np.hypot(vx, vy), context.target_person.width)
+        
+        # The next ROI window follows the target found by this detector pass
+        if self.roi_planner and context.detection_ran and context.camera_id is None:
+            velocity = (0.0, 0.0)
+            if context.target_person:
+                velocity = self.person_detector.get_track_velocity(context.target_person.person_id)
+            self.roi_planner.update(context.target_person, context.frame_id, velocity)
+        return context
+    
+    def _select_locked_target(self, context: "FrameContext") -> Optional[PersonBoundingBox]:
+        """
+        Get the locked target, or score the persons in view when the lock is lost
+        
+        Args:
+            context: Frame context with tracked persons
             
-            # Optional debug output (commented out for clean output)
-            # if self.frame_count % 30 == 0:
-            #     logging.info(f"Frame {self.frame_count}: {len(detected_persons)} raw detections, "
-            #                f"{len(tracked_persons)} tracked persons")
+        Returns:
+            Target person, or None if nobody is in view
+        """
+        # Constant-time lookup in the tracker's ID index; a briefly missed
+        # target is kept on its predicted box, clipped to the frame
+        target = self.target_lock.find(lambda person_id: self.person_detector.get_tracked_person(
+            person_id, max_coast_frames=self.config.target_coast_frames, frame_shape=context.frame.shape
+        ))
+        if target is not None:
+            return target
+        
+        appearance = None
+        if self.appearance_cache and self.reid_target_id is not None:
+            appearance = self.appearance_cache.get(self.reid_target_id, context.capture_time)
+        selection = SelectionContext(context.frame, self.person_detector.get_track_age, appearance)
+        return self.target_lock.select(context.tracked_persons, selection)
+    
+    def _reidentify_target(self, context: "FrameContext"):
+        """
+        Select the followed person again after their track was lost
+        
+        While following, the appearance signature of every person in view
+        is cached on detector passes. When the target's track disappears,
+        persons that were not in view at that moment are compared with its
+        signature, and the best match that does not look more like another
+        cached person becomes the target. Until a match is found or the
+        signature expires, nobody else is taken as the target.
+        
+        Args:
+            context: Frame context with tracked persons and the default target
+        """
+        target_id = self.reid_target_id
+        now = context.capture_time
+        if context.detection_ran:
+            # Only detected boxes; a coasting target's predicted box would blend in background
+            for person in context.tracked_persons:
+                self.appearance_cache.update(person.person_id, appearance_signature(context.frame, person), now)
+        
+        target = next((p for p in context.tracked_persons if p.person_id == target_id), None)
+        if target is None and context.target_person and context.target_person.person_id == target_id:
+            # A locked target coasting on its predicted box has not been lost
+            target = context.target_person
+        if target is not None and self.reid_excluded_ids is not None:
+            # The target's own track is back after being lost
+            logging.info(f"Target track {target_id} reappeared")
+            context.target_person = target
+            context.target_reacquired = True
+        elif target_id is not None and target is None:
+            if self.reid_excluded_ids is None:
+                # Whoever is still in view when the target vanishes is someone else
+                self.reid_excluded_ids = {p.person_id for p in context.tracked_persons}
+            candidates = [p for p in context.tracked_persons if p.person_id not in self.reid_excluded_ids]
             
-            # Get the target person (largest/closest)
-            target_person = self.person_detector.get_largest_person(tracked_persons)
+            match = self.appearance_cache.match(target_id, context.frame, candidates, now)
+            if match is not None:
+                logging.info(f"Re-identified target {target_id} as track {match.person_id}")
+                self.appearance_cache.reassign(target_id, match.person_id, now)
+                context.target_person = match
+                context.target_reacquired = True
+            elif self.appearance_cache.get(target_id, now) is not None:
+                context.target_person = None
+                return
+        
+        if context.target_person:
+            self.reid_target_id = context.target_person.person_id
+            self.reid_excluded_ids = None
+    
+    def _distance_stage(self, context: "FrameContext") -> "FrameContext":
+        """Estimate distances to the target and to every tracked person"""
+        if not context.target_person:
+            return context
+        
+        frame_height, frame_width = context.frame.shape[:2]
+        
+        # Estimate distance to target person
+        context.distance_estimate = self.distance_estimator.estimate_distance_combined(
+            context.target_person, frame_width, frame_height
+        )
+        
+        # Distances for every person are only used by the detection overlay
+        if not self.render_enabled:
+            return context
+        
+        context.distances = []
+        for person in context.tracked_persons:
+            person_distance = self.distance_estimator.estimate_distance_combined(
+                person, frame_width, frame_height
+            )
+            context.distances.append(person_distance.distance_meters)
+        
+        return context
+    
+    def _control_stage(self, context: "FrameContext") -> "FrameContext":
+        """Update task state and robot movement from the target estimate"""
+        frame_height, frame_width = context.frame.shape[:2]
+        target_person = context.target_person
+        heading_offset = self._camera_heading_offset(context.camera_id)
+        
+        if target_person:
+            self.target_person = target_person
+            distance_estimate = context.distance_estimate
             
-            if target_person:
-                self.target_person = target_person
-                
-                # Estimate distance to target person
-                distance_estimate = self.distance_estimator.estimate_distance_combined(
-                    target_person, 
-                    frame.shape[1],  # frame width
-                    frame.shape[0]   # frame height
-                )
-                
-                # Optional debug output (commented out for clean output)
-                # if self.frame_count % 30 == 0:
-                #     logging.info(f"Target person found: ID={target_person.person_id}, "
-                #                f"distance={distance_estimate.distance_meters:.2f}m, "
-                #                f"confidence={distance_estimate.confidence:.2f}")
-                
-                # Update movement based on target
-                if self.current_state == FollowTaskState.FOLLOWING:
+            # A re-identified target is followed again without a new command
+            if context.target_reacquired and self.current_state == FollowTaskState.SEARCHING:
+                self.current_state = FollowTaskState.FOLLOWING
+                self.movement_controller.start_following(target_person.person_id)
+            
+            # A coasting target is only a prediction: hold position instead of chasing it
+            if self.current_state == FollowTaskState.FOLLOWING and target_person.coasting:
+                if self.control_loop:
+                    self.control_loop.clear_estimate()
+                else:
+                    self.movement_controller.execute_command(MovementCommand(0.0, 0.0, 0.0))
+            
+            # Update movement based on target
+            elif self.current_state == FollowTaskState.FOLLOWING:
+                if self.control_loop:
+                    # The control thread consumes the estimate at its own rate
+                    self.control_loop.update_estimate(
+                        self.movement_controller.compute_angular_error(target_person, frame_width),
+                        distance_estimate.distance_meters,
+                        context.capture_time,
+                        target_person.person_id,
+                        heading_offset
+                    )
+                else:
                     movement_command = self.movement_controller.update_target(
                         target_person,
                         distance_estimate,
-                        frame.shape[1],  # frame width
-                        frame.shape[0]   # frame height
+                        frame_width,
+                        frame_height,
+                        heading_offset
                     )
                     self.movement_controller.execute_command(movement_command)
-                    
-                    # Update state based on distance
-                    distance_category = self.distance_estimator.get_distance_category(
-                        distance_estimate.distance_meters
-                    )
-                    
-                    if distance_category == "very_far":
-                        self.current_state = FollowTaskState.SEARCHING
-                        self.movement_controller.start_search_behavior()
                 
-                # Draw detections on frame with distance information
-                distances = []
-                for person in tracked_persons:
-                    person_distance = self.distance_estimator.estimate_distance_combined(
-                        person, frame.shape[1], frame.shape[0]
-                    )
-                    distances.append(person_distance.distance_meters)
-                
-                # Draw bounding boxes with distances
-                frame = self.person_detector.draw_detections(frame, tracked_persons, distances)
+                # Update state based on distance
+                distance_category = self.distance_estimator.get_distance_category(
+                    distance_estimate.distance_meters
+                )
                 
-                # Draw additional distance information for target person
-                self._draw_target_distance_info(frame, distance_estimate, target_person)
+                if distance_category == "very_far":
+                    self._start_searching()
+        
+        else:
+            if self.control_loop:
+                self.control_loop.clear_estimate()
             
-            else:
-                # No person detected - draw empty frame
-                frame = self.person_detector.draw_detections(frame, [])
-                
-                if self.current_state == FollowTaskState.FOLLOWING:
-                    self.current_state = FollowTaskState.SEARCHING
-                    self.movement_controller.start_search_behavior()
-                
-                # Update search behavior
-                if self.current_state == FollowTaskState.SEARCHING:
-                    search_command = self.movement_controller.update_search_behavior()
-                    self.movement_controller.execute_command(search_command)
+            if self.current_state == FollowTaskState.FOLLOWING:
+                self._start_searching()
             
-            # Reset error count on successful processing
-            self.error_count = 0
+            # Update search behavior
+            if self.current_state == FollowTaskState.SEARCHING:
+                search_command = self.movement_controller.update_search_behavior()
+                self.movement_controller.execute_command(search_command)
+        
+        return context
+    
+    def _start_searching(self):
+        """Switch from following to searching for the target"""
+        self.current_state = FollowTaskState.SEARCHING
+        if self.control_loop:
+            # The control thread must not keep driving toward the dropped target
+            self.control_loop.clear_estimate()
+        self.movement_controller.start_search_behavior()
+    
+    def _render_stage(self, context: "FrameContext") -> "FrameContext":
+        """Draw detections and target information onto a display frame"""
+        if context.target_person:
+            # Draw bounding boxes with distances
+            context.display_frame = self.person_detector.draw_detections(
+                context.frame, context.tracked_persons, context.distances
+            )
             
-        except Exception as e:
-            logging.error(f"Error processing frame: {e}")
-            self.error_count += 1
+            # Draw additional distance information for target person
+            self._draw_target_distance_info(
+                context.display_frame, context.distance_estimate, context.target_person
+            )
+        else:
+            # No person detected - draw empty frame
+            context.display_frame = self.person_detector.draw_detections(context.frame, [])
+        return context
     
     def _handle_voice_commands(self):
         """Handle pending voice commands"""
@@ -400,6 +1273,8 @@ class FollowPersonTask:
             distance_estimate: Distance estimate information
             person: Person bounding box
         """
+        self.render_stats["draw_calls"] += 1
+        
         # Draw target person info box
         info_box_height = 120
         info_box_width = 300
@@ -473,9 +1348,19 @@ class FollowPersonTask:
             cv2.putText(frame, instruction, (10, y_offset + i * 20), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
         
+        self.render_stats["draw_calls"] += 1
+        
         # Display frame
         cv2.imshow("Tara Follow Person Task", frame)
     
+    def _get_render_stats(self) -> dict:
+        """Get frame copies and draw calls made by the detector and the overlay panels"""
+        detector_stats = self.person_detector.render_stats if self.person_detector else {}
+        return {
+            "frame_copies": detector_stats.get("frame_copies", 0),
+            "draw_calls": detector_stats.get("draw_calls", 0) + self.render_stats["draw_calls"]
+        }
+    
     def _update_performance_metrics(self):
         """Update performance metrics"""
         self.frame_count += 1
@@ -494,23 +1379,46 @@ class FollowPersonTask:
         
         self.is_running = False
         
-        # Stop voice handler
+        # Stop voice handler; one still initializing sees the flag and never starts listening
+        with self.startup_lock:
+            self.shutting_down = True
         if self.voice_handler:
             self.voice_handler.cleanup()
         
         # Stop movement
+        if self.control_loop:
+            self.control_loop.stop()
+            stats = self.control_loop.get_stats()
+            logging.info(f"Control loop: {stats['measured_rate_hz']:.1f} Hz measured, "
+                        f"jitter mean {stats['jitter_mean_ms']:.2f} ms, "
+                        f"p95 {stats['jitter_p95_ms']:.2f} ms, {stats['overruns']} overruns")
         self.movement_controller.cleanup()
         
-        # Clean up person detector
-        self.person_detector.cleanup()
+        # Clean up person detector and the inference process
+        if self.person_detector:
+            self.person_detector.cleanup()
+        if self.inference:
+            stats = self.inference.get_stats()
+            self.inference.stop()
+            logging.info(f"Inference process: {stats['frames_completed']} frames, "
+                        f"avg inference {stats['avg_inference_ms']:.1f} ms, "
+                        f"{stats['frames_dropped']} dropped")
         
         # Release camera
-        if self.cap:
-            self.cap.release()
+        if self.capture:
+            self.capture.release()
+            stats = self.capture.get_stats()
+            camera_stats = stats["cameras"] if self.multi_camera else {self.config.camera_id: stats}
+            for camera_id, stats in camera_stats.items():
+                logging.info(f"Capture stats (camera {camera_id}): {stats['frames_captured']} captured, "
+                            f"{stats['frames_dropped']} dropped, "
+                            f"max queue depth {stats['max_queue_depth']}")
+        elif self.frame_source:
+            self.frame_source.release()
         
-        # Release video writer
-        if self.video_writer:
-            self.video_writer.release()
+        # Flush and release video recorder (logs written/dropped frame stats)
+        if self.video_recorder:
+            self.video_recorder.release()
         
         # Close display
         if self.config.show_display:
@@ -523,6 +1431,38 @@ class FollowPersonTask:
             logging.info(f"Task completed. Total frames: {self.frame_count}, "
                         f"Total time: {total_time:.2f}s, Average FPS: {avg_fps:.2f}")
         
+        if self.roi_planner:
+            stats = self.roi_planner.get_stats()
+            logging.info(f"ROI detection: {stats['roi_passes']} ROI passes, "
+                        f"{stats['full_passes']} full-frame passes, "
+                        f"{stats['target_misses']} target misses")
+        
+        if self.resolution_controller:
+            stats = self.resolution_controller.get_stats()
+            latencies = ", ".join(f"{size}: {ms:.1f} ms" for size, ms in stats["latency_ms"].items())
+            logging.info(f"Dynamic resolution: final input size {stats['image_size']}, "
+                        f"{stats['switches']} switches ({latencies})")
+        
+        if self.motion_gate:
+            stats = self.motion_gate.get_stats()
+            logging.info(f"Motion gate: {stats['frames_skipped']} static frames skipped "
+                        f"({stats['skip_rate']:.0%}), {stats['forced_refreshes']} forced refreshes")
+        
+        if not self.render_enabled:
+            stats = self._get_render_stats()
+            logging.info(f"Headless run: {stats['frame_copies']} frame copies, "
+                        f"{stats['draw_calls']} draw calls")
+        
+        if self.pipeline:
+            stats = self.pipeline.get_stats()
+            for stage in self.pipeline.stages:
+                stage_stats = stats[stage.name]
+                logging.info(f"Pipeline stage '{stage.name}': "
+                            f"{stage_stats['throughput_fps']:.1f} FPS, "
+                            f"{stage_stats['avg_latency_ms']:.1f} ms/frame, "
+                            f"utilization {stage_stats['utilization']:.0%}")
+            logging.info(f"Pipeline bottleneck stage: {stats['bottleneck']}")
+        
         logging.info("Task cleanup completed")
     
     def get_status(self) -> dict:
@@ -532,11 +1472,30 @@ class FollowPersonTask:
         Returns:
             Dictionary with task status information
         """
+        # The voice initializer may still be adding its timing
+        with self.startup_lock:
+            startup_timings = dict(self.startup_timings)
+        
         return {
             "state": self.current_state.value,
             "is_running": self.is_running,
             "target_person": self.target_person.person_id if self.target_person else None,
             "frame_count": self.frame_count,
             "error_count": self.error_count,
-            "movement_state": self.movement_controller.get_current_state().value
+            "movement_state": self.movement_controller.get_current_state().value,
+            "capture": self.capture.get_stats() if self.capture else None,
+            "pipeline": self.pipeline.get_stats() if self.pipeline else None,
+            "inference": self.inference.get_stats() if self.inference else None,
+            "control": self.control_loop.get_stats() if self.control_loop else None,
+            "detection": self.detection_scheduler.get_stats() if self.detection_scheduler else None,
+            "roi": self.roi_planner.get_stats() if self.roi_planner else None,
+            "motion": self.motion_gate.get_stats() if self.motion_gate else None,
+            "reid": self.appearance_cache.get_stats() if self.appearance_cache else None,
+            "target_lock": self.target_lock.get_stats() if self.target_lock else None,
+            "resolution": self.resolution_controller.get_stats() if self.resolution_controller else None,
+            "startup": startup_timings,
+            "warmup": self.person_detector.warmup_stats if self.person_detector else None,
+            "recording": self.video_recorder.get_stats() if self.video_recorder else None,
+            "headless": not self.render_enabled,
+            "render": self._get_render_stats()
         }
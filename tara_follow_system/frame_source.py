@@ -0,0 +1,443 @@
+"""
+Frame Sources for Tara Robot
+
+This module provides interchangeable frame sources for the follow task:
+1. Live camera
+2. Video file replay
+3. Image directory replay
+4. In-memory synthetic frames
+
+Replays can run as fast as possible or at their original timing, which
+makes FPS and latency measurements reproducible without a camera.
+"""
+
+import os
+import time
+import logging
+from enum import Enum
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+class ReplayMode(Enum):
+    """Enumeration of replay timing modes"""
+    FAST = "fast"          # Deliver frames as fast as they are consumed
+    REALTIME = "realtime"  # Deliver frames at their original timing
+
+class FrameSource:
+    """
+    Base class for frame sources
+
+    Sources expose the same read()/release() interface as cv2.VideoCapture
+    so they can be used directly or wrapped by ThreadedFrameCapture.
+    """
+
+    # Live sources produce frames on their own clock and cannot be replayed
+    is_live = False
+
+    def __init__(self,
+                 replay_mode: ReplayMode = ReplayMode.REALTIME,
+                 loop: bool = False):
+        """
+        Initialize frame source
+
+        Args:
+            replay_mode: Timing mode for recorded sources
+            loop: Whether recorded sources restart when they reach the end
+        """
+        self.replay_mode = ReplayMode(replay_mode)
+        self.loop = loop
+
+        # Set once a recorded source has delivered its last frame
+        self.exhausted = False
+        self.frames_read = 0
+
+        # Replay pacing
+        self._replay_start = None
+        self._timestamp_offset = 0.0
+        self._last_timestamp = 0.0
+
+    def open(self) -> bool:
+        """
+        Open the source
+
+        Returns:
+            True if the source is ready to deliver frames
+        """
+        raise NotImplementedError
+
+    def _read_next(self) -> Tuple[bool, Optional[np.ndarray], float]:
+        """
+        Read the next frame with its media timestamp
+
+        Returns:
+            Tuple of (success, frame, timestamp in seconds)
+        """
+        raise NotImplementedError
+
+    def _rewind(self) -> bool:
+        """
+        Restart a recorded source from the beginning
+
+        Returns:
+            True if the source was rewound
+        """
+        return False
+
+    @property
+    def frame_size(self) -> Tuple[int, int]:
+        """Get (width, height) of delivered frames"""
+        raise NotImplementedError
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Read the next frame, applying replay timing and looping
+
+        Returns:
+            Tuple of (success, frame)
+        """
+        if self.exhausted:
+            return False, None
+
+        ret, frame, timestamp = self._read_next()
+
+        if not ret and not self.is_live:
+            if self.loop and self.frames_read > 0 and self._rewind():
+                # Continue the media clock across loop iterations
+                self._timestamp_offset = self._last_timestamp
+                ret, frame, timestamp = self._read_next()
+            if not ret:
+                self.exhausted = True
+                logging.info(f"Frame source finished after {self.frames_read} frames")
+                return False, None
+
+        if ret:
+            self.frames_read += 1
+            if not self.is_live:
+                self._last_timestamp = self._timestamp_offset + timestamp
+                self._pace(self._last_timestamp)
+
+        return ret, frame
+
+    def _pace(self, timestamp: float):
+        """
+        Sleep until the frame's original presentation time
+
+        Args:
+            timestamp: Media timestamp of the frame in seconds
+        """
+        if self.replay_mode != ReplayMode.REALTIME:
+            return
+
+        now = time.monotonic()
+        if self._replay_start is None:
+            self._replay_start = now - timestamp
+            return
+
+        delay = self._replay_start + timestamp - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def release(self):
+        """Release the source"""
+        pass
+
+class CameraSource(FrameSource):
+    """Live camera frame source"""
+
+    is_live = True
+
+    def __init__(self, camera_id: int = 0, width: int = 640, height: int = 480, fps: int = 30):
+        """
+        Initialize camera source
+
+        Args:
+            camera_id: Camera device ID
+            width: Requested frame width
+            height: Requested frame height
+            fps: Requested frame rate
+        """
+        super().__init__()
+        self.camera_id = camera_id
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.cap = None
+
+    def open(self) -> bool:
+        """Open the camera and apply capture properties"""
+        self.cap = cv2.VideoCapture(self.camera_id)
+        if not self.cap.isOpened():
+            logging.error(f"Failed to open camera {self.camera_id}")
+            return False
+
+        # Set camera properties
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+
+        logging.info(f"Camera {self.camera_id} opened")
+        return True
+
+    def _read_next(self) -> Tuple[bool, Optional[np.ndarray], float]:
+        ret, frame = self.cap.read()
+        return ret, frame, 0.0
+
+    @property
+    def frame_size(self) -> Tuple[int, int]:
+        if self.cap is None:
+            return self.width, self.height
+        return (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or self.width,
+                int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or self.height)
+
+    def release(self):
+        if self.cap:
+            self.cap.release()
+
+class VideoFileSource(FrameSource):
+    """Recorded video file frame source"""
+
+    def __init__(self,
+                 path: str,
+                 replay_mode: ReplayMode = ReplayMode.REALTIME,
+                 loop: bool = False):
+        """
+        Initialize video file source
+
+        Args:
+            path: Path to the video file
+            replay_mode: Timing mode for replay
+            loop: Whether to restart at the end of the file
+        """
+        super().__init__(replay_mode, loop)
+        self.path = path
+        self.cap = None
+        self.fps = 30.0
+
+    def open(self) -> bool:
+        """Open the video file"""
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            logging.error(f"Failed to open video file {self.path}")
+            return False
+
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        frame_total = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        logging.info(f"Replaying {self.path} ({frame_total} frames at {self.fps:.1f} FPS, "
+                     f"{self.replay_mode.value} mode)")
+        return True
+
+    def _read_next(self) -> Tuple[bool, Optional[np.ndarray], float]:
+        ret, frame = self.cap.read()
+        if not ret:
+            return False, None, 0.0
+
+        # Prefer container timestamps; fall back to the nominal frame rate
+        timestamp = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        if timestamp <= 0 and self.frames_read > 0:
+            timestamp = self.frames_read / self.fps
+        return True, frame, timestamp
+
+    def _rewind(self) -> bool:
+        return self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    @property
+    def frame_size(self) -> Tuple[int, int]:
+        return (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+
+    def release(self):
+        if self.cap:
+            self.cap.release()
+
+class ImageDirectorySource(FrameSource):
+    """Directory of still images replayed as a sequence"""
+
+    def __init__(self,
+                 directory: str,
+                 fps: float = 30.0,
+                 replay_mode: ReplayMode = ReplayMode.REALTIME,
+                 loop: bool = False):
+        """
+        Initialize image directory source
+
+        Args:
+            directory: Directory containing images, replayed in sorted order
+            fps: Frame rate used for realtime replay
+            replay_mode: Timing mode for replay
+            loop: Whether to restart after the last image
+        """
+        super().__init__(replay_mode, loop)
+        self.directory = directory
+        self.fps = fps
+        self.image_paths: List[str] = []
+        self.index = 0
+        self._frame_size = (0, 0)
+
+    def open(self) -> bool:
+        """Collect the image files in the directory"""
+        if not os.path.isdir(self.directory):
+            logging.error(f"Image directory not found: {self.directory}")
+            return False
+
+        self.image_paths = sorted(
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        if not self.image_paths:
+            logging.error(f"No images found in {self.directory}")
+            return False
+
+        first = cv2.imread(self.image_paths[0])
+        if first is not None:
+            self._frame_size = (first.shape[1], first.shape[0])
+
+        logging.info(f"Replaying {len(self.image_paths)} images from {self.directory} "
+                     f"({self.replay_mode.value} mode)")
+        return True
+
+    def _read_next(self) -> Tuple[bool, Optional[np.ndarray], float]:
+        while self.index < len(self.image_paths):
+            path = self.image_paths[self.index]
+            timestamp = self.index / self.fps
+            self.index += 1
+
+            frame = cv2.imread(path)
+            if frame is not None:
+                return True, frame, timestamp
+            logging.warning(f"Skipping unreadable image {path}")
+
+        return False, None, 0.0
+
+    def _rewind(self) -> bool:
+        self.index = 0
+        return True
+
+    @property
+    def frame_size(self) -> Tuple[int, int]:
+        return self._frame_size
+
+class SyntheticSource(FrameSource):
+    """
+    In-memory frame source for benchmarks and camera-less runs
+
+    Frames are either taken from a provided sequence or produced by a
+    generator function. By default a person-sized block walks across a
+    textured background.
+    """
+
+    def __init__(self,
+                 width: int = 640,
+                 height: int = 480,
+                 fps: float = 30.0,
+                 num_frames: int = 300,
+                 frames: Optional[Sequence[np.ndarray]] = None,
+                 generator: Optional[Callable[[int], np.ndarray]] = None,
+                 replay_mode: ReplayMode = ReplayMode.FAST,
+                 loop: bool = False):
+        """
+        Initialize synthetic source
+
+        Args:
+            width: Frame width for generated frames
+            height: Frame height for generated frames
+            fps: Frame rate used for realtime replay
+            num_frames: Number of frames to generate
+            frames: Optional preloaded frames to replay instead
+            generator: Optional function mapping frame index to a frame
+            replay_mode: Timing mode for replay
+            loop: Whether to restart after the last frame
+        """
+        super().__init__(replay_mode, loop)
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.frames = list(frames) if frames is not None else None
+        self.num_frames = len(self.frames) if self.frames is not None else num_frames
+        self.generator = generator or self._default_generator
+        self.index = 0
+        self._background = None
+
+    def open(self) -> bool:
+        """Prepare the synthetic background"""
+        rng = np.random.default_rng(0)
+        self._background = rng.integers(60, 120, (self.height, self.width, 3), dtype=np.uint8)
+        logging.info(f"Synthetic source ready ({self.num_frames} frames, "
+                     f"{self.width}x{self.height})")
+        return True
+
+    def _default_generator(self, index: int) -> np.ndarray:
+        """Draw a person-sized block walking across the background"""
+        frame = self._background.copy()
+        box_width = self.width // 8
+        box_height = self.height // 2
+        period = max(1, self.width - box_width)
+        x1 = (index * 4) % period
+        y1 = self.height // 4
+        frame[y1:y1 + box_height, x1:x1 + box_width] = (40, 40, 200)
+        return frame
+
+    def _read_next(self) -> Tuple[bool, Optional[np.ndarray], float]:
+        if self.index >= self.num_frames:
+            return False, None, 0.0
+
+        if self.frames is not None:
+            frame = self.frames[self.index]
+        else:
+            frame = self.generator(self.index)
+        timestamp = self.index / self.fps
+        self.index += 1
+        return True, frame, timestamp
+
+    def _rewind(self) -> bool:
+        self.index = 0
+        return True
+
+    @property
+    def frame_size(self) -> Tuple[int, int]:
+        if self.frames:
+            return self.frames[0].shape[1], self.frames[0].shape[0]
+        return self.width, self.height
+
+def create_frame_source(source: Optional[str] = None,
+                        camera_id: int = 0,
+                        width: int = 640,
+                        height: int = 480,
+                        fps: int = 30,
+                        replay_mode: str = "realtime",
+                        loop: bool = False) -> FrameSource:
+    """
+    Create a frame source from a source specification
+
+    Args:
+        source: None or a camera index for the live camera, "synthetic" or
+            "synthetic:<frames>" for generated frames, a directory of images,
+            or a video file path
+        camera_id: Camera device ID used when source is None
+        width: Frame width for camera and synthetic sources
+        height: Frame height for camera and synthetic sources
+        fps: Frame rate for camera, image directory and synthetic sources
+        replay_mode: 'realtime' or 'fast' for recorded sources
+        loop: Whether recorded sources restart at the end
+
+    Returns:
+        FrameSource instance (not yet opened)
+    """
+    mode = ReplayMode(replay_mode)
+
+    if source is None:
+        return CameraSource(camera_id, width, height, fps)
+    if source.isdigit():
+        return CameraSource(int(source), width, height, fps)
+    if source == "synthetic" or source.startswith("synthetic:"):
+        _, _, count = source.partition(":")
+        return SyntheticSource(width, height, fps,
+                               num_frames=int(count) if count else 300,
+                               replay_mode=mode, loop=loop)
+    if os.path.isdir(source):
+        return ImageDirectorySource(source, fps, mode, loop)
+    return VideoFileSource(source, mode, loop)
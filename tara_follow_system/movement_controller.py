@@ -10,6 +10,7 @@ import time
 import logging
 from typing import Tuple, Optional, Dict
 from dataclasses import dataclass
+from collections import deque
 from enum import Enum
 import threading
 
@@ -29,6 +30,17 @@ class MovementCommand:
     duration: float  # seconds
     priority: int = 1  # 1=normal, 2=high (stop commands)
 
+@dataclass
+class TargetEstimate:
+    """Data class for the latest vision estimate of the target"""
+    angular_error: float  # normalized horizontal offset from frame center
+    distance_meters: float
+    timestamp: float  # time.monotonic() when the frame was captured
+    person_id: Optional[int] = None
+    heading_offset: float = 0.0  # yaw of the observing camera in frame widths
+    angular_rate: float = 0.0  # angular_error change per second
+    distance_rate: float = 0.0  # m/s
+
 class PIDController:
     """
     Proportional-Integral-Derivative controller for smooth movement
@@ -49,21 +61,23 @@ class PIDController:
         
         self.previous_error = 0.0
         self.integral = 0.0
-        self.last_time = time.time()
+        self.last_time = time.monotonic()
     
-    def compute(self, setpoint: float, current_value: float) -> float:
+    def compute(self, setpoint: float, current_value: float, dt: Optional[float] = None) -> float:
         """
         Compute PID output
         
         Args:
             setpoint: Desired value
             current_value: Current measured value
+            dt: Time step in seconds (measured on the monotonic clock if None)
             
         Returns:
             PID controller output
         """
-        current_time = time.time()
-        dt = current_time - self.last_time
+        current_time = time.monotonic()
+        if dt is None:
+            dt = current_time - self.last_time
         
         if dt <= 0:
             dt = 0.01  # Prevent division by zero
@@ -94,7 +108,7 @@ class PIDController:
         """Reset PID controller state"""
         self.previous_error = 0.0
         self.integral = 0.0
-        self.last_time = time.time()
+        self.last_time = time.monotonic()
 
 class MovementController:
     """
@@ -143,12 +157,16 @@ class MovementController:
         
         # Movement parameters
         self.current_velocity = (0.0, 0.0)  # (linear, angular)
-        self.last_command_time = time.time()
+        self.last_command_time = time.monotonic()
         
         # Search behavior
         self.search_direction = 1  # 1 for clockwise, -1 for counterclockwise
         self.search_start_time = None
         
+        # Acceleration limits
+        self.max_linear_acceleration = 1.0  # m/s^2
+        self.max_angular_acceleration = 2.0  # rad/s^2
+        
         # Safety parameters
         self.emergency_stop_distance = 0.3  # meters
         self.command_timeout = 2.0  # seconds
@@ -157,6 +175,9 @@ class MovementController:
         self.movement_thread: Optional[threading.Thread] = None
         self.is_running = False
         
+        # Serializes commands and PID state between the vision, voice and control threads
+        self.command_lock = threading.RLock()
+        
         logging.info("MovementController initialized successfully")
     
     def start_following(self, person_id: Optional[int] = None):
@@ -166,24 +187,26 @@ class MovementController:
         Args:
             person_id: ID of person to follow (None for any person)
         """
-        self.is_following = True
-        self.target_person_id = person_id
-        self.current_state = MovementState.FOLLOWING
-        
-        # Reset PID controllers
-        self.distance_pid.reset()
-        self.angle_pid.reset()
+        with self.command_lock:
+            self.is_following = True
+            self.target_person_id = person_id
+            self.current_state = MovementState.FOLLOWING
+            
+            # Reset PID controllers
+            self.distance_pid.reset()
+            self.angle_pid.reset()
         
         logging.info(f"Started following mode for person {person_id}")
     
     def stop_following(self):
         """Stop following mode and halt movement"""
-        self.is_following = False
-        self.target_person_id = None
-        self.current_state = MovementState.STOPPED
-        
-        # Stop immediately
-        self._execute_movement_command(0.0, 0.0)
+        with self.command_lock:
+            self.is_following = False
+            self.target_person_id = None
+            self.current_state = MovementState.STOPPED
+            
+            # Stop immediately; no command computed before this can be sent after it
+            self._execute_movement_command(0.0, 0.0)
         
         logging.info("Stopped following mode")
     
@@ -191,7 +214,8 @@ class MovementController:
                      person_bbox, 
                      distance_estimate,
                      frame_width: int, 
-                     frame_height: int) -> MovementCommand:
+                     frame_height: int,
+                     heading_offset: float = 0.0) -> MovementCommand:
         """
         Update movement based on target person position and distance
         
@@ -200,6 +224,8 @@ class MovementController:
             distance_estimate: DistanceEstimate object
             frame_width: Width of video frame
             frame_height: Height of video frame
+            heading_offset: Yaw of the camera that saw the target relative to
+                the robot's forward camera, in frame widths
             
         Returns:
             MovementCommand for robot movement
@@ -208,48 +234,95 @@ class MovementController:
             return MovementCommand(0.0, 0.0, 0.0)
         
         try:
-            # Get person position in frame
-            person_center_x, person_center_y = person_bbox.center
-            frame_center_x = frame_width // 2
-            frame_center_y = frame_height // 2
-            
             # Calculate angular error (how far off center)
-            angular_error = (person_center_x - frame_center_x) / frame_width
-            
-            # Calculate distance error
-            distance_error = distance_estimate.distance_meters - self.safe_distance
-            
-            # Safety check - emergency stop if too close
-            if distance_estimate.distance_meters < self.emergency_stop_distance:
-                logging.warning("Emergency stop - person too close!")
-                return MovementCommand(0.0, 0.0, 0.0, priority=2)
-            
-            # PID control for distance
-            linear_velocity = self.distance_pid.compute(0.0, distance_error)
-            
-            # PID control for angle
-            angular_velocity = self.angle_pid.compute(0.0, angular_error)
-            
-            # Limit velocities
-            linear_velocity = np.clip(linear_velocity, -self.max_linear_velocity, self.max_linear_velocity)
-            angular_velocity = np.clip(angular_velocity, -self.max_angular_velocity, self.max_angular_velocity)
+            angular_error = self.compute_angular_error(person_bbox, frame_width)
             
-            # Apply smooth acceleration/deceleration
-            linear_velocity, angular_velocity = self._apply_smooth_control(linear_velocity, angular_velocity)
-            
-            # Update state based on distance
-            self._update_movement_state(distance_estimate.distance_meters)
-            
-            return MovementCommand(
-                linear_velocity=linear_velocity,
-                angular_velocity=angular_velocity,
-                duration=0.1
-            )
+            return self.compute_command(angular_error, distance_estimate.distance_meters,
+                                        heading_offset=heading_offset)
             
         except Exception as e:
             logging.error(f"Error updating movement target: {e}")
             return MovementCommand(0.0, 0.0, 0.0)
     
+    def compute_angular_error(self, person_bbox, frame_width: int) -> float:
+        """
+        Get the normalized horizontal offset of a person from the frame center
+        
+        Args:
+            person_bbox: PersonBoundingBox of target person
+            frame_width: Width of video frame
+            
+        Returns:
+            Offset in frame widths (-0.5 to 0.5, positive to the right)
+        """
+        person_center_x, _ = person_bbox.center
+        frame_center_x = frame_width // 2
+        return (person_center_x - frame_center_x) / frame_width
+    
+    def compute_command(self, 
+                        angular_error: float, 
+                        distance_meters: float,
+                        dt: Optional[float] = None,
+                        heading_offset: float = 0.0) -> MovementCommand:
+        """
+        Compute a movement command from angular and distance errors
+        
+        Args:
+            angular_error: Normalized horizontal offset of the target
+            distance_meters: Distance to the target in meters
+            dt: Control time step in seconds (None measures wall time per update)
+            heading_offset: Yaw of the target's camera in frame widths; a
+                non-zero offset turns the robot in place towards the target
+            
+        Returns:
+            MovementCommand for robot movement
+        """
+        with self.command_lock:
+            return self._compute_command(angular_error, distance_meters, dt, heading_offset)
+    
+    def _compute_command(self, 
+                         angular_error: float, 
+                         distance_meters: float,
+                         dt: Optional[float],
+                         heading_offset: float) -> MovementCommand:
+        """Compute a movement command; the caller holds command_lock"""
+        if not self.is_following:
+            return MovementCommand(0.0, 0.0, 0.0)
+        
+        # Calculate distance error
+        distance_error = distance_meters - self.safe_distance
+        
+        # Safety check - emergency stop if too close
+        if distance_meters < self.emergency_stop_distance:
+            logging.warning("Emergency stop - person too close!")
+            return MovementCommand(0.0, 0.0, 0.0, priority=2)
+        
+        # PID control for distance
+        linear_velocity = self.distance_pid.compute(0.0, distance_error, dt)
+        
+        # PID control for angle
+        angular_velocity = self.angle_pid.compute(0.0, angular_error + heading_offset, dt)
+        
+        # Target seen by a side or rear camera: turn towards it before driving
+        if heading_offset:
+            linear_velocity = 0.0
+        
+        # Limit velocities
+        linear_velocity = np.clip(linear_velocity, -self.max_linear_velocity, self.max_linear_velocity)
+        angular_velocity = np.clip(angular_velocity, -self.max_angular_velocity, self.max_angular_velocity)
+        
+        # Apply smooth acceleration/deceleration
+        linear_velocity, angular_velocity = self._apply_smooth_control(linear_velocity, angular_velocity, dt)
+        
+        # Update state based on distance
+        self._update_movement_state(distance_meters)
+        
+        return MovementCommand(
+            linear_velocity=linear_velocity,
+            angular_velocity=angular_velocity,
+            duration=dt if dt is not None else 0.1
+        )
+    
     def start_search_behavior(self):
         """Start search behavior when person is lost"""
         self.current_state = MovementState.SEARCHING
@@ -285,13 +358,15 @@ class MovementController:
     
     def _apply_smooth_control(self, 
                             target_linear: float, 
-                            target_angular: float) -> Tuple[float, float]:
+                            target_angular: float,
+                            dt: Optional[float] = None) -> Tuple[float, float]:
         """
         Apply smooth acceleration/deceleration to movement commands
         
         Args:
             target_linear: Target linear velocity
             target_angular: Target angular velocity
+            dt: Time step in seconds (None assumes a 0.1 s update)
             
         Returns:
             Smoothed (linear, angular) velocities
@@ -300,8 +375,9 @@ class MovementController:
         current_linear, current_angular = self.current_velocity
         
         # Maximum acceleration (change per update)
-        max_acceleration = 0.1  # m/s per update
-        max_angular_acceleration = 0.2  # rad/s per update
+        step = dt if dt is not None else 0.1
+        max_acceleration = self.max_linear_acceleration * step  # m/s per update
+        max_angular_acceleration = self.max_angular_acceleration * step  # rad/s per update
         
         # Calculate smooth transitions
         linear_diff = target_linear - current_linear
@@ -356,16 +432,21 @@ class MovementController:
                          f"angular={angular_velocity:.3f} rad/s")
         
         # Update last command time
-        self.last_command_time = time.time()
+        self.last_command_time = time.monotonic()
     
     def execute_command(self, command: MovementCommand):
         """
         Execute a movement command
         
+        Commands computed before following stopped are dropped.
+        
         Args:
             command: MovementCommand to execute
         """
-        self._execute_movement_command(command.linear_velocity, command.angular_velocity)
+        with self.command_lock:
+            if not self.is_following:
+                return
+            self._execute_movement_command(command.linear_velocity, command.angular_velocity)
     
     def get_current_state(self) -> MovementState:
         """
@@ -442,3 +523,196 @@ class MovementController:
         """Clean up resources and stop movement"""
         self.stop_following()
         logging.info("MovementController cleaned up")
+
+
+class ControlLoop:
+    """
+    Fixed-rate control thread decoupled from the vision frame rate
+    
+    This class provides methods to:
+    1. Run the movement controller at a fixed rate on a monotonic clock
+    2. Consume the latest target estimate published by the vision loop
+    3. Extrapolate the target with its velocity when vision is late
+    4. Report control loop timing jitter
+    """
+    
+    def __init__(self, 
+                 controller: MovementController,
+                 rate_hz: float = 50.0,
+                 max_extrapolation: float = 0.3,  # seconds
+                 stale_timeout: float = 1.0):  # seconds
+        """
+        Initialize control loop
+        
+        Args:
+            controller: MovementController computing and executing commands
+            rate_hz: Control rate in Hz
+            max_extrapolation: Maximum time a target estimate is extrapolated
+            stale_timeout: Age after which an estimate is discarded
+        """
+        self.controller = controller
+        self.rate_hz = rate_hz
+        self.period = 1.0 / rate_hz
+        self.max_extrapolation = max_extrapolation
+        self.stale_timeout = stale_timeout
+        
+        # Latest target estimate shared with the vision loop
+        self._estimate: Optional[TargetEstimate] = None
+        self._lock = threading.Lock()
+        self._halted = True  # Whether the last command sent was a stop
+        
+        # Threading and control
+        self.is_running = False
+        self.control_thread: Optional[threading.Thread] = None
+        
+        # Statistics
+        self.ticks = 0
+        self.extrapolated_ticks = 0
+        self.overruns = 0
+        self._periods = deque(maxlen=500)  # measured tick periods in seconds
+    
+    def update_estimate(self, 
+                        angular_error: float, 
+                        distance_meters: float,
+                        timestamp: float,
+                        person_id: Optional[int] = None,
+                        heading_offset: float = 0.0):
+        """
+        Publish a new target estimate from the vision loop
+        
+        Args:
+            angular_error: Normalized horizontal offset of the target
+            distance_meters: Distance to the target in meters
+            timestamp: Monotonic capture time of the frame
+            person_id: Tracked ID of the target
+            heading_offset: Yaw of the observing camera in frame widths
+        """
+        with self._lock:
+            previous = self._estimate
+            estimate = TargetEstimate(angular_error, distance_meters, timestamp, person_id,
+                                      heading_offset)
+            
+            # Estimate target velocity from consecutive observations of the same person
+            if (previous is not None and previous.person_id == person_id and
+                    previous.heading_offset == heading_offset and
+                    timestamp > previous.timestamp):
+                dt = timestamp - previous.timestamp
+                estimate.angular_rate = (0.5 * previous.angular_rate +
+                                         0.5 * (angular_error - previous.angular_error) / dt)
+                estimate.distance_rate = (0.5 * previous.distance_rate +
+                                          0.5 * (distance_meters - previous.distance_meters) / dt)
+            
+            self._estimate = estimate
+    
+    def clear_estimate(self):
+        """Forget the current target estimate (target lost or following stopped)"""
+        with self._lock:
+            self._estimate = None
+    
+    def start(self):
+        """Start the control thread"""
+        if self.is_running:
+            logging.warning("Control loop is already running")
+            return
+        
+        self.is_running = True
+        self.control_thread = threading.Thread(target=self._control_loop, daemon=True)
+        self.control_thread.start()
+        
+        logging.info(f"Control loop started at {self.rate_hz:.0f} Hz")
+    
+    def stop(self):
+        """Stop the control thread"""
+        if not self.is_running:
+            return
+        
+        self.is_running = False
+        if self.control_thread and self.control_thread.is_alive():
+            self.control_thread.join(timeout=1.0)
+        
+        logging.info("Control loop stopped")
+    
+    def _control_loop(self):
+        """Main control loop running in separate thread"""
+        next_tick = time.monotonic()
+        last_tick = None
+        
+        while self.is_running:
+            now = time.monotonic()
+            if last_tick is not None:
+                with self._lock:
+                    self._periods.append(now - last_tick)
+            last_tick = now
+            
+            try:
+                self._tick(now)
+            except Exception as e:
+                logging.error(f"Error in control loop: {e}")
+            
+            next_tick += self.period
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Missed a deadline; restart the schedule instead of bursting
+                self.overruns += 1
+                next_tick = time.monotonic()
+    
+    def _tick(self, now: float):
+        """
+        Run one control step
+        
+        Args:
+            now: Monotonic time of this tick
+        """
+        self.ticks += 1
+        
+        with self._lock:
+            estimate = self._estimate
+        
+        if estimate is None or now - estimate.timestamp > self.stale_timeout:
+            # Vision stalled or the target was dropped: halt once instead of
+            # leaving the last velocity on the base
+            if not self._halted:
+                self.controller.execute_command(MovementCommand(0.0, 0.0, 0.0))
+                self._halted = True
+            return
+        
+        # Extrapolate the target when the latest vision result is late
+        age = now - estimate.timestamp
+        horizon = min(age, self.max_extrapolation)
+        if horizon > self.period:
+            self.extrapolated_ticks += 1
+        angular_error = estimate.angular_error + estimate.angular_rate * horizon
+        distance = estimate.distance_meters + estimate.distance_rate * horizon
+        
+        # Following may stop between computing and sending; both happen under the lock
+        with self.controller.command_lock:
+            if not self.controller.is_following:
+                return
+            command = self.controller.compute_command(angular_error, distance, dt=self.period,
+                                                      heading_offset=estimate.heading_offset)
+            self.controller.execute_command(command)
+            self._halted = False
+    
+    def get_stats(self) -> dict:
+        """
+        Get control loop timing statistics
+        
+        Returns:
+            Dictionary with rate and jitter statistics
+        """
+        with self._lock:
+            periods = list(self._periods)
+        periods = np.array(periods) if periods else np.array([self.period])
+        jitter = np.abs(periods - self.period)
+        return {
+            "rate_hz": self.rate_hz,
+            "measured_rate_hz": 1.0 / float(np.mean(periods)),
+            "jitter_mean_ms": float(np.mean(jitter)) * 1000.0,
+            "jitter_p95_ms": float(np.percentile(jitter, 95)) * 1000.0,
+            "jitter_max_ms": float(np.max(jitter)) * 1000.0,
+            "ticks": self.ticks,
+            "extrapolated_ticks": self.extrapolated_ticks,
+            "overruns": self.overruns
+        }
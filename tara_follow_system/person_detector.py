@@ -7,49 +7,56 @@ It provides bounding box information for distance estimation and movement contro
 
 import cv2
 import numpy as np
-from typing import List, Tuple, Optional, Dict
+from typing import Hashable, List, Tuple, Optional, Dict, Union
 import logging
-from dataclasses import dataclass
-from ultralytics import YOLO
-import mediapipe as mp
+from dataclasses import dataclass, field
 import os
+import time
+import threading
+
+from .detections import DetectionArray, PersonBoundingBox, persons_from_array
+from .tracking import CentroidTracker, create_tracker, list_trackers, shift_box
+from .inference_profiles import InferenceProfile, get_inference_profile
+from .detector_backends import DetectorBackend, create_detector_backend
 
 # Suppress YOLO verbose output globally
 os.environ['YOLO_VERBOSE'] = 'False'
 
+# YOLO input size when no inference profile is set
+DEFAULT_IMAGE_SIZE = 640
+
+# Input sizes must be multiples of the largest YOLO stride
+MODEL_STRIDE = 32
+
+# Inference memory per image relative to its float32 input tensor
+BATCH_ACTIVATION_FACTOR = 16
+
+def _available_memory() -> Optional[int]:
+    """Get available physical memory in bytes, or None if unknown"""
+    # MemAvailable counts reclaimable page cache; free pages alone undercount it
+    try:
+        with open('/proc/meminfo') as meminfo:
+            for line in meminfo:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
 @dataclass
-class PersonBoundingBox:
-    """Data class for person bounding box information"""
-    x1: int
-    y1: int
-    x2: int
-    y2: int
-    confidence: float
-    person_id: Optional[int] = None
-    
-    @property
-    def center(self) -> Tuple[int, int]:
-        """Get center point of bounding box"""
-        return ((self.x1 + self.x2) // 2, (self.y1 + self.y2) // 2)
-    
-    @property
-    def width(self) -> int:
-        """Get width of bounding box"""
-        return self.x2 - self.x1
-    
-    @property
-    def height(self) -> int:
-        """Get height of bounding box"""
-        return self.y2 - self.y1
-    
-    @property
-    def area(self) -> int:
-        """Get area of bounding box"""
-        return self.width * self.height
+class TrackingStream:
+    """Tracking state of one video stream (camera)"""
+    tracker: CentroidTracker
+    frame_index: int = 0
+    previous_gray: Optional[np.ndarray] = None  # for optical flow propagation
+    last_boxes: Dict[int, PersonBoundingBox] = field(default_factory=dict)  # person_id -> latest output box
 
 class PersonDetector:
     """
-    Person detection and tracking using YOLO and MediaPipe
+    Person detection and tracking using YOLO, with optional MediaPipe pose
     
     This class provides methods to:
     1. Detect people in video frames
@@ -61,7 +68,13 @@ class PersonDetector:
     def __init__(self, 
                  model_path: str = "yolov8n.pt",
                  confidence_threshold: float = 0.5,
-                 tracking_enabled: bool = True):
+                 tracking_enabled: bool = True,
+                 optical_flow_enabled: bool = False,
+                 load_model: bool = True,
+                 profile: Optional[Union[str, InferenceProfile]] = None,
+                 backend: str = "pytorch",
+                 pose_enabled: bool = False,
+                 tracker_type: str = "centroid"):
         """
         Initialize person detector
         
@@ -69,167 +82,571 @@ class PersonDetector:
             model_path: Path to YOLO model weights
             confidence_threshold: Minimum confidence for person detection
             tracking_enabled: Whether to enable person tracking
+            optical_flow_enabled: Propagate boxes between detections with optical
+                flow instead of the tracker's constant-velocity model
+            load_model: Load the YOLO model; disable when inference runs in
+                another process and this instance only tracks and draws
+            profile: Inference profile name or instance (None uses the model defaults)
+            backend: Inference backend ('pytorch', 'onnxruntime', 'onnxruntime-int8'
+                or 'openvino'); ONNX and OpenVINO models are exported once and cached,
+                the INT8 model is created by quantize.py
+            pose_enabled: Allow MediaPipe pose estimation; the pose model is
+                only built on the first detect_pose_keypoints() call
+            tracker_type: Tracker used per stream ('centroid' for greedy nearest
+                centroid matching, 'hungarian' for optimal one-to-one assignment,
+                'kalman' for Hungarian matching with a Kalman filter per track)
         """
         self.confidence_threshold = confidence_threshold
         self.tracking_enabled = tracking_enabled
+        if tracker_type not in list_trackers():
+            raise ValueError(f"Unknown tracker '{tracker_type}', expected one of {list_trackers()}")
+        self.tracker_type = tracker_type
+        self.optical_flow_enabled = optical_flow_enabled
+        self.profile = get_inference_profile(profile) if profile is not None else None
+        self.image_size = self.profile.image_size if self.profile else DEFAULT_IMAGE_SIZE
         
         # Initialize YOLO model with verbose=False to suppress logs
-        try:
-            self.yolo_model = YOLO(model_path)
-            # Suppress YOLO verbose output
-            self.yolo_model.verbose = False
-            logging.info(f"YOLO model loaded successfully from {model_path}")
-        except Exception as e:
-            logging.error(f"Failed to load YOLO model: {e}")
-            raise
+        self.backend: Optional[DetectorBackend] = None
+        if load_model:
+            self.backend = self._load_backend(backend, model_path, self.image_size)
+        
+        # Drawing work, counted where it happens so headless runs can verify none is done
+        self.render_stats = {"frame_copies": 0, "draw_calls": 0}
+        
+        # MediaPipe pose (backup) is opt-in and built on first use
+        self.pose_enabled = pose_enabled
+        self.pose = None
         
-        # Initialize MediaPipe for pose detection (backup)
-        self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
-            static_image_mode=False,
-            model_complexity=1,
-            enable_segmentation=False,
-            min_detection_confidence=0.5
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
-        
-        # Tracking variables
-        self.tracked_persons = {}  # person_id -> PersonBoundingBox
-        self.next_person_id = 1
+        # Tracking state per stream; single-camera use goes through stream None
         self.max_disappeared = 30  # frames before considering person lost
-        self.disappeared_count = {}  # person_id -> count
+        self.streams: Dict[Hashable, TrackingStream] = {}
         
         # Person class ID in COCO dataset
         self.PERSON_CLASS_ID = 0
         
+        # Automatic batch sizing for detect_persons_batch
+        self.max_batch_size = 16
+        self.batch_latency_target = 0.25  # seconds per YOLO call
+        self.batch_memory_budget = 512 * 1024 * 1024  # bytes of inference memory per call
+        self.image_latency: Optional[float] = None  # smoothed seconds per image in a batch
+        
+        # Warm-up state; the lock serializes inference with a background warm-up
+        self._inference_lock = threading.Lock()
+        self.warmup_thread: Optional[threading.Thread] = None
+        self.warmup_stats: Optional[Dict[str, float]] = None
+        
+        # Arguments of every YOLO call
+        self.predict_kwargs = {"conf": self.confidence_threshold, "verbose": False}
+        if self.profile:
+            self.predict_kwargs.update(self.profile.predict_kwargs(self.PERSON_CLASS_ID))
+            if self.profile.num_threads and self.backend is not None and self.backend.name == "pytorch":
+                # Imported here so other backends and tracking-only detectors never load torch
+                import torch
+                torch.set_num_threads(self.profile.num_threads)
+            logging.info(f"Inference profile '{self.profile.name}': "
+                         f"imgsz={self.profile.image_size}, max_det={self.profile.max_detections}")
+        
         logging.info("PersonDetector initialized successfully")
     
-    def detect_persons(self, frame: np.ndarray) -> List[PersonBoundingBox]:
+    def _load_backend(self, name: str, model_path: str, image_size: int) -> DetectorBackend:
+        """
+        Load the inference backend, falling back to PyTorch if its runtime is missing
+        
+        Args:
+            name: Backend name
+            model_path: Path to the PyTorch YOLO weights
+            image_size: Model input size in pixels
+            
+        Returns:
+            Loaded DetectorBackend
+        """
+        backend = create_detector_backend(name, model_path, image_size)
+        if not backend.is_available():
+            logging.warning(f"{backend.name} runtime is not installed, using PyTorch backend")
+            backend = create_detector_backend("pytorch", model_path, image_size)
+        
+        try:
+            backend.load()
+            logging.info(f"YOLO model loaded successfully from {model_path} ({backend.name} backend)")
+        except Exception as e:
+            logging.error(f"Failed to load YOLO model: {e}")
+            raise
+        return backend
+    
+    def _predict(self, source, **overrides) -> list:
+        """
+        Run the backend with the detector's predict arguments
+        
+        Args:
+            source: A frame or a list of frames (BGR format)
+            **overrides: Predict arguments replacing the defaults for this call
+            
+        Returns:
+            List of Ultralytics results, one per frame
+        """
+        with self._inference_lock:
+            return self.backend.predict(source, **{**self.predict_kwargs, **overrides})
+    
+    def warmup(self, 
+               frame_size: Tuple[int, int] = (640, 480), 
+               iterations: int = 3,
+               background: bool = False) -> Optional[Dict[str, float]]:
+        """
+        Run the detector on synthetic frames so later calls run at steady-state speed
+        
+        The first inference calls build graphs, allocate buffers and select
+        kernels, which makes them much slower than later ones.
+        
+        Args:
+            frame_size: (width, height) of the frames the detector will see
+            iterations: Number of warm-up inferences
+            background: Warm up on a background thread and return immediately
+            
+        Returns:
+            Dictionary with cold and warm latency, or None when run in the background
+        """
+        if self.backend is None or iterations <= 0:
+            return None
+        
+        if background:
+            self.warmup_thread = threading.Thread(
+                target=self.warmup, args=(frame_size, iterations), daemon=True
+            )
+            self.warmup_thread.start()
+            return None
+        
+        width, height = frame_size
+        frame = np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+        latencies = []
+        for _ in range(iterations):
+            started = time.monotonic()
+            self._predict(frame)
+            latencies.append(time.monotonic() - started)
+        
+        self.warmup_stats = {
+            "iterations": iterations,
+            "cold_ms": latencies[0] * 1000.0,
+            "warm_ms": latencies[-1] * 1000.0,
+            "total_ms": sum(latencies) * 1000.0
+        }
+        logging.info(f"Detector warm-up: cold {self.warmup_stats['cold_ms']:.0f} ms, "
+                     f"warm {self.warmup_stats['warm_ms']:.0f} ms ({iterations} frames)")
+        return self.warmup_stats
+    
+    def detect_persons(self, 
+                       frame: np.ndarray, 
+                       image_size: Optional[int] = None) -> List[PersonBoundingBox]:
         """
         Detect persons in a video frame
         
         Args:
             frame: Input video frame (BGR format)
+            image_size: Model input size for this frame (None uses the detector's size)
             
         Returns:
             List of PersonBoundingBox objects for detected persons
         """
+        return persons_from_array(self.detect_persons_array(frame, image_size))
+    
+    def detect_persons_array(self, 
+                             frame: np.ndarray, 
+                             image_size: Optional[int] = None) -> np.ndarray:
+        """
+        Detect persons in a video frame, returning a compact array
+        
+        Args:
+            frame: Input video frame (BGR format)
+            image_size: Model input size for this frame (None uses the detector's size)
+            
+        Returns:
+            (N, 5) float32 array of x1, y1, x2, y2, confidence
+        """
+        overrides = {"imgsz": image_size} if image_size else {}
         try:
             # Run YOLO inference with verbose=False to suppress logs
-            results = self.yolo_model(frame, conf=self.confidence_threshold, verbose=False)
-            
-            persons = []
-            
-            for result in results:
-                boxes = result.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        # Check if detection is a person
-                        if int(box.cls) == self.PERSON_CLASS_ID:
-                            x1, y1, x2, y2 = box.xyxy[0].cpu().numpy().astype(int)
-                            confidence = float(box.conf[0])
-                            
-                            person_bbox = PersonBoundingBox(
-                                x1=x1, y1=y1, x2=x2, y2=y2,
-                                confidence=confidence
-                            )
-                            persons.append(person_bbox)
+            results = self._predict(frame, **overrides)
             
-            return persons
+            arrays = [self._decode_result_array(result) for result in results]
+            if len(arrays) == 1:
+                return arrays[0]
+            return np.concatenate(arrays) if arrays else np.empty((0, 5), dtype=np.float32)
             
         except Exception as e:
             logging.error(f"Error in person detection: {e}")
+            return np.empty((0, 5), dtype=np.float32)
+    
+    def detect_persons_roi(self, 
+                           frame: np.ndarray, 
+                           roi: Tuple[int, int, int, int]) -> List[PersonBoundingBox]:
+        """
+        Detect persons inside a region of interest
+        
+        Args:
+            frame: Input video frame (BGR format)
+            roi: (x1, y1, x2, y2) window in frame coordinates
+            
+        Returns:
+            List of PersonBoundingBox objects in frame coordinates
+        """
+        return persons_from_array(self.detect_persons_roi_array(frame, roi))
+    
+    def detect_persons_roi_array(self, 
+                                 frame: np.ndarray, 
+                                 roi: Tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Detect persons inside a region of interest, returning a compact array
+        
+        The crop is run at the smallest stride-aligned input size that holds
+        it, so inference cost scales with the crop area instead of the frame.
+        
+        Args:
+            frame: Input video frame (BGR format)
+            roi: (x1, y1, x2, y2) window in frame coordinates
+            
+        Returns:
+            (N, 5) float32 array of x1, y1, x2, y2, confidence in frame coordinates
+        """
+        x1, y1, x2, y2 = roi
+        crop = frame[y1:y2, x1:x2]
+        image_size = min(self.image_size, int(np.ceil(max(crop.shape[:2]) / MODEL_STRIDE)) * MODEL_STRIDE)
+        
+        try:
+            results = self._predict(crop, imgsz=image_size)
+            persons = np.concatenate([self._decode_result_array(result) for result in results])
+            persons[:, [0, 2]] += x1
+            persons[:, [1, 3]] += y1
+            return persons
+            
+        except Exception as e:
+            logging.error(f"Error in ROI person detection: {e}")
+            return np.empty((0, 5), dtype=np.float32)
+    
+    def detect_persons_batch(self, 
+                             frames, 
+                             batch_size: Optional[int] = None) -> List[List[PersonBoundingBox]]:
+        """
+        Detect persons in several frames with batched YOLO calls
+        
+        Args:
+            frames: List of frames or a stacked (N, H, W, 3) array (BGR format)
+            batch_size: Frames per YOLO call (None picks it from memory and latency targets)
+            
+        Returns:
+            List with the detected persons of each frame, in input order
+        """
+        return [persons_from_array(boxes) for boxes in self.detect_persons_batch_array(frames, batch_size)]
+    
+    def detect_persons_batch_array(self, 
+                                   frames, 
+                                   batch_size: Optional[int] = None) -> List[np.ndarray]:
+        """
+        Detect persons in several frames, returning one compact array per frame
+        
+        Args:
+            frames: List of frames or a stacked (N, H, W, 3) array (BGR format)
+            batch_size: Frames per YOLO call (None picks it from memory and latency targets)
+            
+        Returns:
+            List of (N, 5) float32 arrays of x1, y1, x2, y2, confidence, in input order
+        """
+        # Iterating a stacked array yields per-frame views without copying
+        frames = list(frames)
+        if not frames:
             return []
+        
+        detections = []
+        start = 0
+        while start < len(frames):
+            size = batch_size or self.get_auto_batch_size()
+            batch = frames[start:start + size]
+            start += len(batch)
+            
+            try:
+                started = time.monotonic()
+                results = self._predict(batch)
+                self._record_batch_latency(time.monotonic() - started, len(batch))
+                detections.extend(self._decode_result_array(result) for result in results)
+                
+            except Exception as e:
+                logging.error(f"Error in batched person detection: {e}")
+                detections.extend(np.empty((0, 5), dtype=np.float32) for _ in batch)
+        
+        return detections
+    
+    def get_auto_batch_size(self) -> int:
+        """
+        Pick a batch size that fits the memory budget and latency target
+        
+        Frames are letterboxed to the model input size, so memory depends
+        on the inference profile rather than the camera resolution.
+        
+        Returns:
+            Number of frames per YOLO call
+        """
+        # Memory: network input plus activations scale with the input area
+        image_memory = self.image_size * self.image_size * 3 * 4 * BATCH_ACTIVATION_FACTOR
+        memory_budget = self.batch_memory_budget
+        available_memory = _available_memory()
+        if available_memory:
+            memory_budget = min(memory_budget, available_memory // 2)
+        memory_limit = max(1, int(memory_budget // image_memory))
+        
+        # Latency: the first batch is small until the per-image cost is known
+        latency_limit = 4
+        if self.image_latency:
+            latency_limit = max(1, int(self.batch_latency_target / self.image_latency))
+        
+        return max(1, min(self.max_batch_size, memory_limit, latency_limit))
+    
+    def _record_batch_latency(self, latency: float, batch_size: int):
+        """Update the smoothed per-image inference latency"""
+        sample = latency / batch_size
+        if self.image_latency is None:
+            self.image_latency = sample
+        else:
+            self.image_latency = 0.8 * self.image_latency + 0.2 * sample
+    
+    def _decode_result(self, result) -> List[PersonBoundingBox]:
+        """
+        Convert one YOLO result into person bounding boxes
+        
+        Args:
+            result: Ultralytics result for a single image
+            
+        Returns:
+            List of PersonBoundingBox objects for detected persons
+        """
+        return persons_from_array(self._decode_result_array(result))
+    
+    def _decode_result_array(self, result) -> np.ndarray:
+        """
+        Convert one YOLO result into a person detection array
+        
+        All boxes are moved off the device in a single transfer and filtered
+        by class with a NumPy mask, instead of one transfer per box.
+        
+        Args:
+            result: Ultralytics result for a single image
+            
+        Returns:
+            (N, 5) float32 array of x1, y1, x2, y2, confidence
+        """
+        boxes = result.boxes
+        if boxes is None or len(boxes) == 0:
+            return np.empty((0, 5), dtype=np.float32)
+        
+        # Columns: x1, y1, x2, y2, confidence, class
+        data = boxes.data.cpu().numpy()
+        persons = data[data[:, 5] == self.PERSON_CLASS_ID, :5]
+        return persons.astype(np.float32, copy=False)
+    
+    def _get_stream(self, stream_id: Hashable = None) -> TrackingStream:
+        """
+        Get the tracking state of a stream, creating it on first use
+        
+        Args:
+            stream_id: Stream (camera) key, None for the default stream
+            
+        Returns:
+            TrackingStream for the stream
+        """
+        stream = self.streams.get(stream_id)
+        if stream is None:
+            stream = TrackingStream(self._create_tracker())
+            self.streams[stream_id] = stream
+        return stream
+    
+    def _create_tracker(self) -> CentroidTracker:
+        """Create the tracker used for a new stream"""
+        return create_tracker(self.tracker_type, max_disappeared=self.max_disappeared)
+    
+    @property
+    def tracker(self) -> CentroidTracker:
+        """Get the tracker of the default stream"""
+        return self._get_stream().tracker
     
     def track_persons(self, 
                      frame: np.ndarray, 
-                     detected_persons: List[PersonBoundingBox]) -> List[PersonBoundingBox]:
+                     detected_persons: List[PersonBoundingBox],
+                     frame_index: Optional[int] = None,
+                     stream_id: Hashable = None) -> List[PersonBoundingBox]:
         """
         Track detected persons across frames
         
         Args:
             frame: Current video frame
             detected_persons: List of newly detected persons
+            frame_index: Index of the current frame (defaults to one past the last call)
+            stream_id: Camera the frame came from (each camera is tracked separately)
             
         Returns:
             List of PersonBoundingBox objects with tracking IDs
         """
+        stream = self._get_stream(stream_id)
+        stream.frame_index = frame_index if frame_index is not None else stream.frame_index + 1
+        
         if not self.tracking_enabled:
             # Assign temporary IDs if tracking is disabled
             for i, person in enumerate(detected_persons):
                 person.person_id = i
             return detected_persons
         
-        # Update disappeared count for existing tracked persons
-        for person_id in list(self.disappeared_count.keys()):
-            self.disappeared_count[person_id] += 1
+        tracked_persons = stream.tracker.update(detected_persons, stream.frame_index)
+        
+        stream.last_boxes = {person.person_id: person for person in tracked_persons}
+        if self.optical_flow_enabled:
+            stream.previous_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        
+        return tracked_persons
+    
+    def propagate_persons(self, 
+                          frame: np.ndarray, 
+                          frame_index: Optional[int] = None,
+                          stream_id: Hashable = None) -> List[PersonBoundingBox]:
+        """
+        Estimate person boxes on a frame where the detector was not run
+        
+        Boxes are moved by the tracker's constant-velocity model, or by the
+        median optical flow inside each box when optical flow is enabled.
+        Track state is only updated by real detections.
+        
+        Args:
+            frame: Current video frame
+            frame_index: Index of the current frame (defaults to one past the last call)
+            stream_id: Camera the frame came from
             
-            # Remove person if disappeared too long
-            if self.disappeared_count[person_id] > self.max_disappeared:
-                if person_id in self.tracked_persons:
-                    del self.tracked_persons[person_id]
-                del self.disappeared_count[person_id]
+        Returns:
+            List of propagated PersonBoundingBox objects with tracking IDs
+        """
+        stream = self._get_stream(stream_id)
+        stream.frame_index = frame_index if frame_index is not None else stream.frame_index + 1
         
-        # Assign IDs to new detections
-        tracked_persons = []
+        if not self.tracking_enabled:
+            return []
         
-        for detected_person in detected_persons:
-            person_id = self._assign_person_id(detected_person)
-            detected_person.person_id = person_id
+        if self.optical_flow_enabled and stream.previous_gray is not None:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            persons = self._propagate_with_optical_flow(stream.last_boxes, stream.previous_gray, gray)
+            stream.previous_gray = gray
+        else:
+            persons = stream.tracker.predict(stream.frame_index)
+        
+        stream.last_boxes = {person.person_id: person for person in persons}
+        return persons
+    
+    def _propagate_with_optical_flow(self, 
+                                     last_boxes: Dict[int, PersonBoundingBox],
+                                     previous_gray: np.ndarray, 
+                                     gray: np.ndarray) -> List[PersonBoundingBox]:
+        """
+        Move the latest boxes by the sparse optical flow measured inside them
+        
+        Args:
+            last_boxes: Latest output box per track
+            previous_gray: Grayscale previous frame
+            gray: Grayscale current frame
+            
+        Returns:
+            List of moved PersonBoundingBox objects
+        """
+        persons = []
+        for person in last_boxes.values():
+            # Sample a coarse grid of points inside the box
+            xs = np.linspace(person.x1, person.x2, 5, dtype=np.float32)[1:-1]
+            ys = np.linspace(person.y1, person.y2, 7, dtype=np.float32)[1:-1]
+            points = np.array([[x, y] for y in ys for x in xs], dtype=np.float32).reshape(-1, 1, 2)
             
-            # Update tracking information
-            self.tracked_persons[person_id] = detected_person
-            self.disappeared_count[person_id] = 0
+            new_points, status, _ = cv2.calcOpticalFlowPyrLK(previous_gray, gray, points, None)
+            valid = status.reshape(-1) == 1
+            if not np.any(valid):
+                persons.append(person)
+                continue
             
-            tracked_persons.append(detected_person)
+            shift = np.median((new_points - points).reshape(-1, 2)[valid], axis=0)
+            persons.append(shift_box(person, shift[0], shift[1]))
+        return persons
+    
+    def get_track_velocity(self, person_id: int, stream_id: Hashable = None) -> Tuple[float, float]:
+        """
+        Get the tracked velocity of a person
         
-        return tracked_persons
+        Args:
+            person_id: Track ID
+            stream_id: Camera the track belongs to
+            
+        Returns:
+            (vx, vy) in pixels per frame
+        """
+        return self._get_stream(stream_id).tracker.get_velocity(person_id)
     
-    def _assign_person_id(self, detected_person: PersonBoundingBox) -> int:
+    def get_track_age(self, person_id: int, stream_id: Hashable = None) -> int:
         """
-        Assign ID to detected person based on proximity to existing tracked persons
+        Get the number of frames since a person's track started
         
         Args:
-            detected_person: Newly detected person
+            person_id: Track ID
+            stream_id: Camera the track belongs to
             
         Returns:
-            Person ID (existing or new)
+            Track age in frames
         """
-        if not self.tracked_persons:
-            return self.next_person_id
+        return self._get_stream(stream_id).tracker.get_track_age(person_id)
+    
+    def get_tracked_person(self, 
+                           person_id: int, 
+                           stream_id: Hashable = None,
+                           max_coast_frames: Optional[int] = None,
+                           frame_shape: Optional[Tuple[int, ...]] = None) -> Optional[PersonBoundingBox]:
+        """
+        Look up a live track by ID
         
-        # Find closest existing person
-        min_distance = float('inf')
-        closest_id = None
+        A track missed by the latest detector pass is still returned at its
+        predicted position for up to max_coast_frames frames, clipped to the
+        frame.
         
-        for person_id, tracked_person in self.tracked_persons.items():
-            # Calculate distance between centers
-            center1 = detected_person.center
-            center2 = tracked_person.center
-            distance = np.sqrt((center1[0] - center2[0])**2 + (center1[1] - center2[1])**2)
+        Args:
+            person_id: Track ID
+            stream_id: Camera the track belongs to
+            max_coast_frames: Frames a missed track is predicted for (None
+                until the tracker expires it)
+            frame_shape: Shape of the frame predicted boxes are clipped to
             
-            if distance < min_distance:
-                min_distance = distance
-                closest_id = person_id
-        
-        # If closest person is within threshold, use their ID
-        if min_distance < 100:  # pixels
-            return closest_id
+        Returns:
+            Latest box of the person, a predicted box marked as coasting, or
+            None if the track has coasted too long or left the frame
+        """
+        stream = self._get_stream(stream_id)
+        person = stream.last_boxes.get(person_id)
+        if person is not None:
+            return person
         
-        # Otherwise, assign new ID
-        self.next_person_id += 1
-        return self.next_person_id
+        person = stream.tracker.get_track(person_id, stream.frame_index, max_coast_frames)
+        if person is None:
+            return None
+        person.coasting = True
+        if frame_shape is None:
+            return person
+        height, width = frame_shape[:2]
+        person.x1, person.x2 = max(0, person.x1), min(width, person.x2)
+        person.y1, person.y2 = max(0, person.y1), min(height, person.y2)
+        if person.x2 <= person.x1 or person.y2 <= person.y1:
+            return None
+        return person
     
-    def get_largest_person(self, persons: List[PersonBoundingBox]) -> Optional[PersonBoundingBox]:
+    def get_largest_person(self, 
+                           persons: Union[List[PersonBoundingBox], DetectionArray]) -> Optional[PersonBoundingBox]:
         """
         Get the largest (closest) person from the detection list
         
         Args:
-            persons: List of detected persons
+            persons: List of detected persons, or a DetectionArray (searched
+                on its area column)
             
         Returns:
             PersonBoundingBox of the largest person, or None if no persons detected
         """
+        if isinstance(persons, DetectionArray):
+            return persons.largest()
         if not persons:
             return None
         
@@ -252,6 +669,8 @@ class PersonDetector:
             Frame with drawn bounding boxes and labels
         """
         frame_copy = frame.copy()
+        self.render_stats["frame_copies"] += 1
+        self.render_stats["draw_calls"] += 1
         
         for i, person in enumerate(persons):
             # Choose color based on distance (if available)
@@ -327,8 +746,70 @@ class PersonDetector:
         return (abs(center_x - frame_center_x) < tolerance_x and 
                 abs(center_y - frame_center_y) < tolerance_y)
     
+    def _get_pose(self):
+        """
+        Get the MediaPipe pose model, building it on first use
+        
+        Returns:
+            MediaPipe Pose instance, or None if pose estimation is disabled
+        """
+        if not self.pose_enabled:
+            return None
+        
+        if self.pose is None:
+            # Imported here so detection-only runs never load mediapipe
+            import mediapipe as mp
+            
+            started = time.monotonic()
+            self.pose = mp.solutions.pose.Pose(
+                static_image_mode=False,
+                model_complexity=1,
+                enable_segmentation=False,
+                min_detection_confidence=0.5
+            )
+            logging.info(f"MediaPipe pose initialized in {time.monotonic() - started:.2f}s")
+        return self.pose
+    
+    def detect_pose_keypoints(self, 
+                              frame: np.ndarray, 
+                              person: Optional[PersonBoundingBox] = None) -> Optional[np.ndarray]:
+        """
+        Estimate body keypoints with MediaPipe pose
+        
+        Args:
+            frame: Input video frame (BGR format)
+            person: Restrict estimation to this person's box (None uses the whole frame)
+            
+        Returns:
+            (33, 3) array of x, y in frame pixels and visibility, or None if
+            pose estimation is disabled or no pose was found
+        """
+        pose = self._get_pose()
+        if pose is None:
+            logging.warning("Pose keypoints requested but pose estimation is disabled")
+            return None
+        
+        x_offset, y_offset = 0, 0
+        image = frame
+        if person is not None:
+            x_offset, y_offset = max(0, person.x1), max(0, person.y1)
+            image = frame[y_offset:max(y_offset, person.y2), x_offset:max(x_offset, person.x2)]
+            if image.size == 0:
+                return None
+        
+        results = pose.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+        if not results.pose_landmarks:
+            return None
+        
+        height, width = image.shape[:2]
+        return np.array([
+            (landmark.x * width + x_offset, landmark.y * height + y_offset, landmark.visibility)
+            for landmark in results.pose_landmarks.landmark
+        ], dtype=np.float32)
+    
     def cleanup(self):
         """Clean up resources"""
-        if hasattr(self, 'pose'):
+        if self.pose is not None:
             self.pose.close()
+            self.pose = None
         logging.info("PersonDetector cleaned up")
@@ -0,0 +1,234 @@
+"""
+Pipelined Stage Executor for Tara Robot
+
+This module runs a chain of processing stages on separate worker threads
+connected by bounded queues. Stage latencies overlap instead of adding up,
+so end-to-end throughput is limited by the slowest stage.
+"""
+
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+
+# Sentinel pushed through the queues to stop the workers
+_STOP = object()
+
+class PipelineStage:
+    """
+    A single pipeline stage running on its own worker thread
+
+    The stage function receives an item, may modify it, and returns the
+    item to pass downstream. Returning None drops the item.
+    """
+
+    def __init__(self, name: str, function: Callable[[Any], Any]):
+        """
+        Initialize pipeline stage
+
+        Args:
+            name: Stage name used in statistics and logs
+            function: Callable processing one item
+        """
+        self.name = name
+        self.function = function
+
+        # Filled in by the executor
+        self.input_queue: Optional[queue.Queue] = None
+        self.output_queue: Optional[queue.Queue] = None
+        self.worker: Optional[threading.Thread] = None
+
+        # Statistics
+        self.items_processed = 0
+        self.items_dropped = 0
+        self.busy_time = 0.0
+        self.errors = 0
+        self.start_time = None
+
+    def run(self):
+        """Worker loop processing items until the stop sentinel arrives"""
+        self.start_time = time.monotonic()
+
+        while True:
+            item = self.input_queue.get()
+            if item is _STOP:
+                self.output_queue.put(_STOP)
+                break
+
+            started = time.monotonic()
+            try:
+                result = self.function(item)
+            except Exception as e:
+                logging.error(f"Error in pipeline stage '{self.name}': {e}")
+                self.errors += 1
+                result = None
+            self.busy_time += time.monotonic() - started
+
+            if result is None:
+                self.items_dropped += 1
+                continue
+
+            self.items_processed += 1
+            # Blocking put gives backpressure to the upstream stages
+            self.output_queue.put(result)
+
+    def get_stats(self) -> dict:
+        """
+        Get stage throughput statistics
+
+        Returns:
+            Dictionary with stage counters and rates
+        """
+        elapsed = time.monotonic() - self.start_time if self.start_time else 0.0
+        return {
+            "processed": self.items_processed,
+            "dropped": self.items_dropped,
+            "errors": self.errors,
+            "throughput_fps": self.items_processed / elapsed if elapsed > 0 else 0.0,
+            "avg_latency_ms": (self.busy_time / self.items_processed * 1000.0
+                               if self.items_processed else 0.0),
+            "utilization": self.busy_time / elapsed if elapsed > 0 else 0.0,
+            "queue_depth": self.input_queue.qsize() if self.input_queue else 0
+        }
+
+class PipelineExecutor:
+    """
+    Multi-stage executor with bounded queues and backpressure
+
+    This class provides methods to:
+    1. Run each stage on a dedicated worker thread
+    2. Connect stages with bounded FIFO queues so frame order is preserved
+    3. Apply backpressure when a downstream stage falls behind
+    4. Report per-stage throughput statistics
+    """
+
+    def __init__(self, stages: List[Tuple[str, Callable[[Any], Any]]], queue_size: int = 2):
+        """
+        Initialize pipeline executor
+
+        Args:
+            stages: Ordered list of (name, function) pairs
+            queue_size: Capacity of each inter-stage queue
+        """
+        self.stages = [PipelineStage(name, function) for name, function in stages]
+        self.queue_size = max(1, queue_size)
+
+        # Stage i reads queues[i] and writes queues[i + 1]
+        self.queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        for i, stage in enumerate(self.stages):
+            stage.input_queue = self.queues[i]
+            stage.output_queue = self.queues[i + 1]
+
+        self.is_running = False
+        self.items_submitted = 0
+        self.items_completed = 0
+
+    def start(self):
+        """Start all stage workers"""
+        if self.is_running:
+            logging.warning("Pipeline is already running")
+            return
+
+        self.is_running = True
+        for stage in self.stages:
+            stage.worker = threading.Thread(target=stage.run, name=f"pipeline-{stage.name}",
+                                            daemon=True)
+            stage.worker.start()
+
+        logging.info(f"Pipeline started with stages: {[stage.name for stage in self.stages]}")
+
+    def submit(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Submit an item to the first stage
+
+        Args:
+            item: Item to process
+            timeout: Maximum time to wait for queue space (None blocks)
+
+        Returns:
+            True if the item was accepted, False if the pipeline is full
+        """
+        if not self.is_running:
+            return False
+
+        try:
+            self.queues[0].put(item, timeout=timeout)
+        except queue.Full:
+            return False
+
+        self.items_submitted += 1
+        return True
+
+    def get_result(self, timeout: Optional[float] = 0.0) -> Optional[Any]:
+        """
+        Get the next completed item in submission order
+
+        Args:
+            timeout: Maximum time to wait (0 returns immediately)
+
+        Returns:
+            Completed item or None if none is available
+        """
+        try:
+            if timeout == 0.0:
+                item = self.queues[-1].get_nowait()
+            else:
+                item = self.queues[-1].get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+        if item is _STOP:
+            return None
+
+        self.items_completed += 1
+        return item
+
+    def stop(self, timeout: float = 2.0):
+        """
+        Stop all workers after draining in-flight items
+
+        Args:
+            timeout: Maximum total time to wait for the workers
+        """
+        if not self.is_running:
+            return
+
+        self.is_running = False
+
+        # Keep draining the final queue while the sentinel propagates so no stage blocks
+        deadline = time.monotonic() + timeout
+        stop_sent = False
+        while time.monotonic() < deadline:
+            if not stop_sent:
+                try:
+                    self.queues[0].put_nowait(_STOP)
+                    stop_sent = True
+                except queue.Full:
+                    pass
+            try:
+                item = self.queues[-1].get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if item is _STOP:
+                break
+
+        for stage in self.stages:
+            if stage.worker and stage.worker.is_alive():
+                stage.worker.join(timeout=max(0.0, deadline - time.monotonic()))
+
+        logging.info("Pipeline stopped")
+
+    def get_stats(self) -> dict:
+        """
+        Get per-stage throughput statistics
+
+        Returns:
+            Dictionary mapping stage name to its statistics
+        """
+        stats = {stage.name: stage.get_stats() for stage in self.stages}
+        # The stage with the highest per-item latency limits end-to-end FPS
+        stats["bottleneck"] = max(
+            self.stages, key=lambda stage: stats[stage.name]["avg_latency_ms"]
+        ).name if self.stages else None
+        return stats
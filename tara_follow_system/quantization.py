@@ -0,0 +1,184 @@
+"""
+INT8 Quantization for the Tara Person Detector
+
+This module produces an INT8 ONNX model from a directory of calibration
+frames with ONNX Runtime static quantization, and validates it against the
+FP32 model on a replay set. The quantized model is stored next to the
+weights, where the 'onnxruntime-int8' detector backend loads it.
+"""
+
+import re
+import time
+import logging
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+try:
+    import onnx
+    from onnxruntime.quantization import (CalibrationDataReader, QuantFormat, QuantType,
+                                          quantize_static)
+except ImportError as e:
+    raise ImportError("INT8 quantization requires the optional 'onnx' and 'onnxruntime' packages "
+                      "(pip install onnx onnxruntime)") from e
+
+from .detections import match_detections
+from .detector_backends import ONNXRuntimeBackend, ONNXRuntimeInt8Backend
+from .frame_source import ImageDirectorySource, ReplayMode
+from .person_detector import PersonDetector
+
+def letterbox(frame: np.ndarray, image_size: int) -> np.ndarray:
+    """
+    Convert a BGR frame into a YOLO input tensor
+
+    The frame is resized keeping its aspect ratio and padded to a square,
+    as Ultralytics does before inference.
+
+    Args:
+        frame: Input frame (BGR format)
+        image_size: Model input size in pixels
+
+    Returns:
+        (1, 3, image_size, image_size) float32 tensor in [0, 1], RGB order
+    """
+    height, width = frame.shape[:2]
+    scale = min(image_size / height, image_size / width)
+    new_width, new_height = int(round(width * scale)), int(round(height * scale))
+    resized = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
+
+    padded = np.full((image_size, image_size, 3), 114, dtype=np.uint8)
+    top = (image_size - new_height) // 2
+    left = (image_size - new_width) // 2
+    padded[top:top + new_height, left:left + new_width] = resized
+
+    tensor = padded[:, :, ::-1].transpose(2, 0, 1).astype(np.float32) / 255.0
+    return tensor[np.newaxis]
+
+class CalibrationFrameReader(CalibrationDataReader):
+    """Feeds frames from an image directory to ONNX Runtime calibration"""
+
+    def __init__(self, directory: str, input_name: str, image_size: int, max_frames: int = 200):
+        """
+        Initialize calibration frame reader
+
+        Args:
+            directory: Directory of calibration images
+            input_name: Name of the model input
+            image_size: Model input size in pixels
+            max_frames: Maximum number of frames used for calibration
+        """
+        self.source = ImageDirectorySource(directory, replay_mode=ReplayMode.FAST)
+        if not self.source.open():
+            raise FileNotFoundError(f"No calibration images in {directory}")
+        self.input_name = input_name
+        self.image_size = image_size
+        self.max_frames = max_frames
+        self.frames_read = 0
+
+    def get_next(self) -> Optional[dict]:
+        if self.frames_read >= self.max_frames:
+            return None
+        ret, frame = self.source.read()
+        if not ret:
+            return None
+        self.frames_read += 1
+        return {self.input_name: letterbox(frame, self.image_size)}
+
+def _detection_head_nodes(model: onnx.ModelProto) -> List[str]:
+    """
+    Get the nodes of the YOLO detection head
+
+    The head decodes box coordinates in pixels, which lose too much
+    precision in INT8, so it stays in FP32.
+
+    Args:
+        model: Exported YOLO ONNX model
+
+    Returns:
+        Names of the nodes in the last model layer
+    """
+    layers = {}
+    for node in model.graph.node:
+        match = re.match(r"^/model\.(\d+)/", node.name)
+        if match:
+            layers.setdefault(int(match.group(1)), []).append(node.name)
+    return layers[max(layers)] if layers else []
+
+def quantize_detector(calibration_dir: str,
+                      model_path: str = "yolov8n.pt",
+                      image_size: int = 640,
+                      max_frames: int = 200) -> str:
+    """
+    Create the INT8 model used by the 'onnxruntime-int8' backend
+
+    Args:
+        calibration_dir: Directory of frames representative of deployment
+        model_path: Path to the PyTorch YOLO weights
+        image_size: Model input size in pixels
+        max_frames: Maximum number of calibration frames
+
+    Returns:
+        Path of the INT8 model
+    """
+    # Reuses (or creates) the cached FP32 ONNX export
+    fp32_path = ONNXRuntimeBackend(model_path, image_size).resolve_model_path()
+    int8_path = ONNXRuntimeInt8Backend(model_path, image_size).cached_model_path()
+
+    model = onnx.load(fp32_path)
+    input_name = model.graph.input[0].name
+    excluded_nodes = _detection_head_nodes(model)
+
+    reader = CalibrationFrameReader(calibration_dir, input_name, image_size, max_frames)
+    logging.info(f"Quantizing {fp32_path} with frames from {calibration_dir} "
+                 f"({len(excluded_nodes)} head nodes kept in FP32)")
+    started = time.monotonic()
+    quantize_static(
+        fp32_path,
+        int8_path,
+        reader,
+        quant_format=QuantFormat.QDQ,
+        per_channel=True,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        nodes_to_exclude=excluded_nodes
+    )
+    logging.info(f"INT8 model written to {int8_path} ({reader.frames_read} calibration frames, "
+                 f"{time.monotonic() - started:.1f}s)")
+    return int8_path
+
+def validate_quantized_model(frames: List[np.ndarray],
+                             model_path: str = "yolov8n.pt",
+                             profile: Optional[str] = None,
+                             reference_backend: str = "onnxruntime",
+                             confidence_threshold: float = 0.3) -> dict:
+    """
+    Compare the INT8 model with the FP32 model on a replay set
+
+    FP32 detections serve as the reference for recall and precision.
+
+    Args:
+        frames: Replay frames
+        model_path: Path to the PyTorch YOLO weights
+        profile: Inference profile used for both models
+        reference_backend: Backend running the FP32 model
+        confidence_threshold: Detection confidence threshold
+
+    Returns:
+        Dictionary with latency, speedup, recall and precision
+    """
+    report = {"frames": len(frames)}
+    detections = {}
+    for name, backend in (("fp32", reference_backend), ("int8", "onnxruntime-int8")):
+        detector = PersonDetector(model_path, confidence_threshold, tracking_enabled=False,
+                                  profile=profile, backend=backend)
+        detector.detect_persons_array(frames[0])  # Exclude warm-up from the timing
+
+        started = time.monotonic()
+        detections[name] = [detector.detect_persons_array(frame) for frame in frames]
+        report[f"{name}_ms"] = (time.monotonic() - started) / len(frames) * 1000.0
+        detector.cleanup()
+
+    report["speedup"] = report["fp32_ms"] / report["int8_ms"] if report["int8_ms"] else 0.0
+    report["recall"], report["precision"] = match_detections(detections["fp32"], detections["int8"])
+    return report
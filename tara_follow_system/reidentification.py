@@ -0,0 +1,237 @@
+"""
+Appearance Re-identification for Tara Robot
+
+This module keeps a compact appearance signature per track, a hue and
+saturation histogram of the person's torso. A followed person whose track
+was lost, for example after a long occlusion, can then be recognized when
+they reappear under a new track ID, and told apart from other people seen
+before.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .detections import PersonBoundingBox
+
+def appearance_signature(frame: np.ndarray,
+                         person: PersonBoundingBox,
+                         bins: Tuple[int, int] = (16, 8)) -> Optional[np.ndarray]:
+    """
+    Compute the appearance signature of a person
+
+    The torso (central part of the box) holds little background, and hue
+    and saturation change less with lighting than brightness does.
+
+    Args:
+        frame: Input frame (BGR format)
+        person: Person box
+        bins: Number of hue and saturation histogram bins
+
+    Returns:
+        L1-normalized float32 histogram, or None if the box is too small
+    """
+    height, width = frame.shape[:2]
+    x1 = max(0, person.x1 + person.width // 4)
+    x2 = min(width, person.x2 - person.width // 4)
+    y1 = max(0, person.y1 + person.height // 5)
+    y2 = min(height, person.y1 + person.height * 3 // 5)
+    if x2 - x1 < 4 or y2 - y1 < 4:
+        return None
+
+    hsv = cv2.cvtColor(frame[y1:y2, x1:x2], cv2.COLOR_BGR2HSV)
+    histogram = cv2.calcHist([hsv], [0, 1], None, list(bins), [0, 180, 0, 256])
+    return cv2.normalize(histogram, None, norm_type=cv2.NORM_L1).flatten()
+
+def signature_similarity(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+    """
+    Compare two appearance signatures
+
+    Args:
+        signature_a: First signature
+        signature_b: Second signature
+
+    Returns:
+        Similarity in [0, 1] (1 - Bhattacharyya distance)
+    """
+    return 1.0 - cv2.compareHist(signature_a, signature_b, cv2.HISTCMP_BHATTACHARYYA)
+
+class AppearanceCache:
+    """
+    Bounded LRU cache of appearance signatures per track
+
+    This class provides methods to:
+    1. Store a track's signature, blended over the frames it is seen
+    2. Evict signatures not updated within a time-to-live, and the least
+       recently updated ones beyond a size bound
+    3. Match candidate persons against a cached track's signature, rejecting
+       candidates that look more like another cached track
+    4. Move a signature to the new ID of a re-identified track
+    """
+
+    def __init__(self,
+                 max_entries: int = 32,
+                 ttl: float = 10.0,
+                 match_threshold: float = 0.6,
+                 smoothing: float = 0.2):
+        """
+        Initialize appearance cache
+
+        Args:
+            max_entries: Maximum number of cached tracks
+            ttl: Seconds after its last update before a signature is evicted
+            match_threshold: Minimum similarity of a re-identification
+            smoothing: Weight of a new signature when blended into the cached one
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.match_threshold = match_threshold
+        self.smoothing = smoothing
+
+        # person_id -> (signature, time of last update), least recently updated first
+        self.entries: "OrderedDict[int, Tuple[np.ndarray, float]]" = OrderedDict()
+
+        # Statistics
+        self.matches = 0
+        self.failed_matches = 0
+        self.evictions = 0
+
+    def update(self, person_id: int, signature: Optional[np.ndarray], timestamp: float):
+        """
+        Store the signature of a track seen on the current frame
+
+        Args:
+            person_id: Track ID
+            signature: Appearance signature (None is ignored)
+            timestamp: Monotonic time of the frame
+        """
+        if signature is None:
+            return
+        entry = self.entries.pop(person_id, None)
+        if entry is not None:
+            signature = (1.0 - self.smoothing) * entry[0] + self.smoothing * signature
+        self.entries[person_id] = (signature, timestamp)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, person_id: int, timestamp: float) -> Optional[np.ndarray]:
+        """
+        Get the signature of a track if it has not expired
+
+        Args:
+            person_id: Track ID
+            timestamp: Current monotonic time
+
+        Returns:
+            Cached signature, or None
+        """
+        self.evict_expired(timestamp)
+        entry = self.entries.get(person_id)
+        return entry[0] if entry is not None else None
+
+    def evict_expired(self, timestamp: float):
+        """
+        Drop signatures not updated within the time-to-live
+
+        Args:
+            timestamp: Current monotonic time
+        """
+        # Entries are ordered by update time, so expired ones are at the front
+        while self.entries:
+            person_id, (_, updated) = next(iter(self.entries.items()))
+            if timestamp - updated <= self.ttl:
+                break
+            del self.entries[person_id]
+            self.evictions += 1
+
+    def match(self,
+              person_id: int,
+              frame: np.ndarray,
+              candidates: List[PersonBoundingBox],
+              timestamp: float) -> Optional[PersonBoundingBox]:
+        """
+        Find the candidate that looks most like a cached track
+
+        Args:
+            person_id: Track ID whose signature is matched
+            frame: Current frame (BGR format)
+            candidates: Persons that may be the track
+            timestamp: Current monotonic time
+
+        Returns:
+            Best candidate above the match threshold, or None
+        """
+        signature = self.get(person_id, timestamp)
+        if signature is None or not candidates:
+            return None
+
+        best, best_similarity = None, self.match_threshold
+        for candidate in candidates:
+            candidate_signature = appearance_signature(frame, candidate)
+            if candidate_signature is None:
+                continue
+            similarity = signature_similarity(signature, candidate_signature)
+            if similarity < best_similarity:
+                continue
+            if self._resembles_other(candidate_signature, similarity, (person_id, candidate.person_id)):
+                continue
+            best, best_similarity = candidate, similarity
+
+        if best is None:
+            self.failed_matches += 1
+            return None
+        self.matches += 1
+        logging.debug(f"Track {best.person_id} matches track {person_id} (similarity {best_similarity:.2f})")
+        return best
+
+    def _resembles_other(self, signature: np.ndarray, similarity: float, excluded: Tuple[int, ...]) -> bool:
+        """
+        Check whether a signature matches another cached track better
+
+        Args:
+            signature: Candidate signature
+            similarity: Candidate's similarity to the searched track
+            excluded: Track IDs not compared (the searched track and the candidate's own)
+
+        Returns:
+            True if some other cached track is at least as similar
+        """
+        return any(signature_similarity(other, signature) >= similarity
+                   for person_id, (other, _) in self.entries.items() if person_id not in excluded)
+
+    def reassign(self, old_id: int, new_id: int, timestamp: float):
+        """
+        Move a signature to the new ID of a re-identified track
+
+        Args:
+            old_id: Previous track ID
+            new_id: Current track ID
+            timestamp: Monotonic time of the re-identification
+        """
+        entry = self.entries.pop(old_id, None)
+        if entry is not None:
+            self.entries.pop(new_id, None)
+            self.entries[new_id] = (entry[0], timestamp)
+
+    def clear(self):
+        """Forget all signatures"""
+        self.entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with cache size, matches and evictions
+        """
+        return {
+            "entries": len(self.entries),
+            "matches": self.matches,
+            "failed_matches": self.failed_matches,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,373 @@
+"""
+Shared-Memory Frame Transport for Tara Robot
+
+This module runs person detection in a separate process. Frames are passed
+through a preallocated ring of fixed-shape shared-memory buffers (zero-copy
+NumPy views) and only small detection records come back, so capture and
+inference no longer compete for the GIL of one process.
+"""
+
+import time
+import queue
+import logging
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+@dataclass
+class DetectionRecord:
+    """Data class for detections returned by the inference process"""
+    frame_id: int
+    capture_time: float
+    slot: int
+    boxes: np.ndarray  # (N, 5) float32: x1, y1, x2, y2, confidence
+    inference_time: float  # seconds spent in the detector
+
+class SharedFrameRing:
+    """
+    Ring of fixed-shape frame buffers in shared memory
+
+    The creating process owns the memory block; other processes attach by
+    name. Each slot is exposed as a NumPy view, so writing or reading a
+    frame never pickles image data.
+    """
+
+    def __init__(self,
+                 num_slots: int,
+                 frame_shape: Tuple[int, ...],
+                 dtype=np.uint8,
+                 name: Optional[str] = None):
+        """
+        Create or attach to a shared frame ring
+
+        Args:
+            num_slots: Number of frame buffers
+            frame_shape: Shape of every frame, e.g. (480, 640, 3)
+            dtype: Frame data type
+            name: Name of an existing block to attach to (None creates one)
+        """
+        self.num_slots = num_slots
+        self.frame_shape = tuple(frame_shape)
+        self.dtype = np.dtype(dtype)
+        self.frame_nbytes = int(np.prod(self.frame_shape)) * self.dtype.itemsize
+
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=self.frame_nbytes * num_slots)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+
+        self._frames = np.ndarray((num_slots,) + self.frame_shape, dtype=self.dtype,
+                                  buffer=self.shm.buf)
+
+    @property
+    def name(self) -> str:
+        """Get the shared memory block name"""
+        return self.shm.name
+
+    def slot(self, index: int) -> np.ndarray:
+        """
+        Get a zero-copy view of a slot
+
+        Args:
+            index: Slot index
+
+        Returns:
+            NumPy view backed by shared memory
+        """
+        return self._frames[index]
+
+    def write(self, index: int, frame: np.ndarray):
+        """
+        Copy a frame into a slot
+
+        Args:
+            index: Slot index
+            frame: Frame with the ring's shape and dtype
+        """
+        np.copyto(self._frames[index], frame)
+
+    def close(self):
+        """Detach from the shared memory and free it if this process owns it"""
+        # Drop the view first; the buffer cannot be closed while exported
+        self._frames = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+def _inference_worker(ring_name: str,
+                      num_slots: int,
+                      frame_shape: Tuple[int, ...],
+                      detector_kwargs: dict,
+                      warmup_frames: int,
+                      request_queue,
+                      result_queue,
+                      free_slots):
+    """
+    Inference process entry point
+
+    Args:
+        ring_name: Shared memory block of the frame ring
+        num_slots: Number of slots in the ring
+        frame_shape: Shape of every frame
+        detector_kwargs: Keyword arguments for PersonDetector
+        warmup_frames: Synthetic frames run before reporting ready
+        request_queue: Queue of (slot, frame_id, capture_time) requests
+        result_queue: Queue receiving DetectionRecord objects
+        free_slots: Queue receiving slots that may be reused
+    """
+    ring = None
+    try:
+        # Imported here so the parent process does not pay for it twice
+        from .person_detector import PersonDetector
+
+        ring = SharedFrameRing(num_slots, frame_shape, name=ring_name)
+        detector = PersonDetector(**detector_kwargs)
+        detector.warmup((frame_shape[1], frame_shape[0]), warmup_frames)
+    except Exception as e:
+        # Report why startup failed instead of letting the parent time out
+        result_queue.put(("error", f"{type(e).__name__}: {e}"))
+        if ring is not None:
+            ring.close()
+        return
+    result_queue.put("ready")
+
+    try:
+        while True:
+            request = request_queue.get()
+            if request is None:
+                break
+
+            slot, frame_id, capture_time = request
+            started = time.monotonic()
+            boxes = detector.detect_persons_array(ring.slot(slot))
+            inference_time = time.monotonic() - started
+
+            # The frame has been consumed; hand the slot back before replying
+            free_slots.put(slot)
+            result_queue.put(DetectionRecord(frame_id, capture_time, slot, boxes, inference_time))
+    finally:
+        detector.cleanup()
+        ring.close()
+
+class InferenceProcess:
+    """
+    Person detection running in a child process fed through shared memory
+
+    This class provides methods to:
+    1. Start a detector process attached to a shared frame ring
+    2. Submit frames without blocking when all slots are busy
+    3. Collect detection records as they complete
+    4. Report submitted, dropped and completed frame counts
+    """
+
+    def __init__(self,
+                 frame_shape: Tuple[int, ...],
+                 num_slots: int = 3,
+                 detector_kwargs: Optional[dict] = None,
+                 warmup_frames: int = 0):
+        """
+        Initialize inference process
+
+        Args:
+            frame_shape: Shape of every frame, e.g. (480, 640, 3)
+            num_slots: Number of shared frame buffers (frames in flight)
+            detector_kwargs: Keyword arguments for the child's PersonDetector
+            warmup_frames: Synthetic frames the child runs before it reports ready
+        """
+        self.frame_shape = tuple(frame_shape)
+        self.num_slots = num_slots
+        self.detector_kwargs = detector_kwargs or {}
+        self.warmup_frames = warmup_frames
+
+        # Spawn avoids forking a parent that already holds OpenCV/torch threads
+        self._context = mp.get_context("spawn")
+        self.ring: Optional[SharedFrameRing] = None
+        self.process = None
+        self.request_queue = None
+        self.result_queue = None
+        self.free_slots = None
+        self.is_running = False
+
+        # Statistics
+        self.frames_submitted = 0
+        self.frames_dropped = 0
+        self.frames_completed = 0
+        self.inference_time = 0.0
+
+    def start(self, timeout: float = 60.0, poll_interval: float = 0.2) -> bool:
+        """
+        Start the inference process and wait until its model is loaded and warm
+
+        Args:
+            timeout: Maximum time to wait for the child to become ready
+            poll_interval: Time between checks that the child is still alive
+
+        Returns:
+            True if the process is ready
+        """
+        self.ring = SharedFrameRing(self.num_slots, self.frame_shape)
+        self.request_queue = self._context.Queue()
+        self.result_queue = self._context.Queue()
+        self.free_slots = self._context.Queue()
+        for slot in range(self.num_slots):
+            self.free_slots.put(slot)
+
+        self.process = self._context.Process(
+            target=_inference_worker,
+            args=(self.ring.name, self.num_slots, self.frame_shape, self.detector_kwargs,
+                  self.warmup_frames, self.request_queue, self.result_queue, self.free_slots),
+            daemon=True
+        )
+        self.process.start()
+
+        ready = self._wait_ready(timeout, poll_interval)
+        if ready != "ready":
+            if isinstance(ready, tuple):
+                logging.error(f"Inference process failed to start: {ready[1]}")
+            elif not self.process.is_alive():
+                logging.error(f"Inference process exited during startup (exit code {self.process.exitcode})")
+            else:
+                logging.error(f"Inference process not ready after {timeout:.0f}s")
+            self.stop()
+            return False
+
+        self.is_running = True
+        logging.info(f"Inference process started (pid={self.process.pid}, "
+                     f"{self.num_slots} shared frame slots)")
+        return True
+
+    def _wait_ready(self, timeout: float, poll_interval: float):
+        """
+        Wait for the child's startup message, stopping early if it dies
+
+        Args:
+            timeout: Maximum time to wait
+            poll_interval: Time between liveness checks
+
+        Returns:
+            "ready", an ("error", message) tuple, or None if the child exited
+            or timed out without a message
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                return self.result_queue.get(timeout=poll_interval)
+            except queue.Empty:
+                pass
+            if not self.process.is_alive():
+                # The message may have been queued just before the child exited
+                try:
+                    return self.result_queue.get(timeout=poll_interval)
+                except queue.Empty:
+                    return None
+        return None
+
+    def submit(self,
+               frame: np.ndarray,
+               frame_id: int,
+               capture_time: float,
+               timeout: float = 0.0) -> bool:
+        """
+        Copy a frame into a free slot and queue it for inference
+
+        Args:
+            frame: Frame with the configured shape
+            frame_id: Frame identifier returned with the detections
+            capture_time: Monotonic capture time of the frame
+            timeout: Maximum time to wait for a free slot (0 returns immediately)
+
+        Returns:
+            True if submitted, False if every slot is busy (frame dropped)
+        """
+        if not self.is_running:
+            return False
+
+        if frame.shape != self.frame_shape:
+            logging.error(f"Frame shape {frame.shape} does not match ring shape {self.frame_shape}")
+            return False
+
+        try:
+            if timeout > 0:
+                slot = self.free_slots.get(timeout=timeout)
+            else:
+                slot = self.free_slots.get_nowait()
+        except queue.Empty:
+            self.frames_dropped += 1
+            return False
+
+        self.ring.write(slot, frame)
+        self.request_queue.put((slot, frame_id, capture_time))
+        self.frames_submitted += 1
+        return True
+
+    def get_result(self, timeout: float = 0.0) -> Optional[DetectionRecord]:
+        """
+        Get the next completed detection record
+
+        Args:
+            timeout: Maximum time to wait (0 returns immediately)
+
+        Returns:
+            DetectionRecord or None if none is available
+        """
+        try:
+            if timeout > 0:
+                record = self.result_queue.get(timeout=timeout)
+            else:
+                record = self.result_queue.get_nowait()
+        except queue.Empty:
+            return None
+
+        self.frames_completed += 1
+        self.inference_time += record.inference_time
+        return record
+
+    @property
+    def frames_in_flight(self) -> int:
+        """Get the number of submitted frames without a result yet"""
+        return self.frames_submitted - self.frames_completed
+
+    def get_stats(self) -> dict:
+        """
+        Get inference process statistics
+
+        Returns:
+            Dictionary with frame counters and average inference time
+        """
+        return {
+            "frames_submitted": self.frames_submitted,
+            "frames_completed": self.frames_completed,
+            "frames_dropped": self.frames_dropped,
+            "frames_in_flight": self.frames_in_flight,
+            "avg_inference_ms": (self.inference_time / self.frames_completed * 1000.0
+                                 if self.frames_completed else 0.0)
+        }
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop the inference process and free the shared memory
+
+        Args:
+            timeout: Maximum time to wait for the child to exit
+        """
+        self.is_running = False
+
+        if self.process is not None:
+            if self.process.is_alive():
+                self.request_queue.put(None)
+                self.process.join(timeout=timeout)
+            if self.process.is_alive():
+                logging.warning("Inference process did not exit, terminating")
+                self.process.terminate()
+                self.process.join(timeout=1.0)
+            self.process = None
+
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+        logging.info("Inference process stopped")
@@ -0,0 +1,175 @@
+"""
+Target Selection for Tara Robot
+
+This module keeps the followed person locked by track ID. The locked
+target is found each frame with one lookup in the tracker's ID index, so
+the cost does not grow with the number of people in view. Only when the
+lock is lost is a new target picked, by a pluggable scoring function
+combining size, centrality, track age and appearance.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from .detections import PersonBoundingBox
+from .reidentification import appearance_signature, signature_similarity
+
+@dataclass
+class SelectionContext:
+    """Frame data available to target scoring functions"""
+    frame: np.ndarray
+    track_age: Callable[[int], int]  # person_id -> frames since the track started
+    appearance: Optional[np.ndarray] = None  # Signature of the lost target, if cached
+
+TargetScorer = Callable[[PersonBoundingBox, SelectionContext], float]
+
+def size_score(person: PersonBoundingBox, context: SelectionContext) -> float:
+    """Score larger (closer) persons higher, by their share of the frame height"""
+    return min(1.0, person.height / context.frame.shape[0])
+
+def centrality_score(person: PersonBoundingBox, context: SelectionContext) -> float:
+    """Score persons near the horizontal image center higher"""
+    half_width = context.frame.shape[1] / 2
+    return max(0.0, 1.0 - abs(person.center[0] - half_width) / half_width)
+
+def track_age_score(person: PersonBoundingBox, context: SelectionContext, saturation: int = 30) -> float:
+    """Score established tracks higher than ones that just appeared"""
+    return min(1.0, context.track_age(person.person_id) / saturation)
+
+def appearance_score(person: PersonBoundingBox, context: SelectionContext) -> float:
+    """Score persons that look like the lost target higher"""
+    if context.appearance is None:
+        return 0.0
+    signature = appearance_signature(context.frame, person)
+    return signature_similarity(context.appearance, signature) if signature is not None else 0.0
+
+TARGET_SCORES: Dict[str, TargetScorer] = {
+    "size": size_score,
+    "centrality": centrality_score,
+    "track_age": track_age_score,
+    "appearance": appearance_score
+}
+
+class WeightedTargetScorer:
+    """
+    Scores target candidates by a weighted sum of named scores
+
+    This class provides methods to:
+    1. Combine the scores in TARGET_SCORES with configurable weights
+    2. Skip scores with zero weight, so unused terms cost nothing
+    """
+
+    DEFAULT_WEIGHTS = {"size": 1.0, "centrality": 0.5, "track_age": 0.25, "appearance": 1.0}
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None):
+        """
+        Initialize weighted target scorer
+
+        Args:
+            weights: Weight per score name (None uses DEFAULT_WEIGHTS)
+
+        Raises:
+            ValueError: If a weight names an unknown score
+        """
+        weights = dict(self.DEFAULT_WEIGHTS if weights is None else weights)
+        unknown = set(weights) - set(TARGET_SCORES)
+        if unknown:
+            raise ValueError(f"Unknown target scores {sorted(unknown)}, "
+                             f"expected any of {list(TARGET_SCORES)}")
+        self.weights = {name: weight for name, weight in weights.items() if weight}
+
+    def __call__(self, person: PersonBoundingBox, context: SelectionContext) -> float:
+        return sum(weight * TARGET_SCORES[name](person, context) for name, weight in self.weights.items())
+
+class TargetLock:
+    """
+    Keeps the followed person by track ID
+
+    This class provides methods to:
+    1. Find the locked target through an ID lookup in constant time
+    2. Pick a new target with a scoring function when the lock is lost
+    3. Lock and release targets
+    4. Report lock acquisitions and losses
+    """
+
+    def __init__(self, scorer: Optional[TargetScorer] = None):
+        """
+        Initialize target lock
+
+        Args:
+            scorer: Function scoring target candidates (None uses WeightedTargetScorer)
+        """
+        self.scorer = scorer or WeightedTargetScorer()
+        self.locked_id: Optional[int] = None
+
+        # Statistics
+        self.acquisitions = 0
+        self.losses = 0
+
+    def find(self, lookup: Callable[[int], Optional[PersonBoundingBox]]) -> Optional[PersonBoundingBox]:
+        """
+        Get the locked target on the current frame
+
+        Args:
+            lookup: Function returning the person with a track ID, or None
+
+        Returns:
+            The locked target, or None if nothing is locked or its track is gone
+        """
+        if self.locked_id is None:
+            return None
+        person = lookup(self.locked_id)
+        if person is None:
+            logging.info(f"Target lock on track {self.locked_id} lost")
+            self.locked_id = None
+            self.losses += 1
+        return person
+
+    def select(self,
+               candidates: List[PersonBoundingBox],
+               context: SelectionContext) -> Optional[PersonBoundingBox]:
+        """
+        Pick the best scoring candidate as the new target
+
+        Args:
+            candidates: Persons in view
+            context: Frame data for the scoring function
+
+        Returns:
+            Best candidate, or None if there are none
+        """
+        if not candidates:
+            return None
+        return max(candidates, key=lambda person: self.scorer(person, context))
+
+    def lock(self, person_id: int):
+        """
+        Lock onto a track
+
+        Args:
+            person_id: Track ID of the target
+        """
+        if person_id != self.locked_id:
+            logging.info(f"Target locked on track {person_id}")
+            self.locked_id = person_id
+            self.acquisitions += 1
+
+    def release(self):
+        """Release the lock"""
+        self.locked_id = None
+
+    def get_stats(self) -> dict:
+        """
+        Get target lock statistics
+
+        Returns:
+            Dictionary with the locked track ID, acquisitions and losses
+        """
+        return {
+            "locked_id": self.locked_id,
+            "acquisitions": self.acquisitions,
+            "losses": self.losses
+        }
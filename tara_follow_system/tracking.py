@@ -0,0 +1,722 @@
+"""
+Person Tracking Module for Tara Robot
+
+This module assigns persistent IDs to detected persons across frames and
+keeps a simple motion model per track, so boxes can be propagated on
+frames where the detector is not run. Detections are matched greedily to
+the nearest track, or optimally with the Hungarian algorithm, optionally
+with a Kalman filter per track.
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple, Type
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from .detections import PersonBoundingBox, box_iou, persons_to_array
+
+class CentroidTracker:
+    """
+    Greedy nearest-centroid tracker with per-track velocity
+
+    This class provides methods to:
+    1. Assign IDs to detections by proximity to existing tracks
+    2. Expire tracks that have not been seen for too long
+    3. Estimate per-track velocity in pixels per frame
+    4. Predict track boxes for frames without detections
+    """
+
+    def __init__(self, max_disappeared: int = 30, max_distance: float = 100.0):
+        """
+        Initialize centroid tracker
+
+        Args:
+            max_disappeared: Frames without a match before a track is dropped
+            max_distance: Maximum centroid distance in pixels for a match
+        """
+        self.max_disappeared = max_disappeared
+        self.max_distance = max_distance
+
+        # Tracking variables
+        self.tracked_persons: Dict[int, PersonBoundingBox] = {}  # person_id -> last box
+        self.last_seen: Dict[int, int] = {}  # person_id -> frame index
+        self.velocities: Dict[int, Tuple[float, float]] = {}  # person_id -> (vx, vy) px/frame
+        self.first_seen: Dict[int, int] = {}  # person_id -> frame index the track started
+        self.next_person_id = 1
+        self.frame_index = 0
+
+    def update(self,
+               detected_persons: List[PersonBoundingBox],
+               frame_index: Optional[int] = None) -> List[PersonBoundingBox]:
+        """
+        Assign track IDs to new detections
+
+        Args:
+            detected_persons: Detections from the current frame
+            frame_index: Index of the current frame (defaults to one past the last update)
+
+        Returns:
+            The detections with person_id set
+        """
+        self.frame_index = frame_index if frame_index is not None else self.frame_index + 1
+        self._expire_tracks()
+
+        # Assign IDs to new detections
+        for detected_person in detected_persons:
+            person_id = self._assign_person_id(detected_person)
+            detected_person.person_id = person_id
+
+            self._update_velocity(person_id, detected_person)
+
+            # Update tracking information
+            self.tracked_persons[person_id] = detected_person
+            self.last_seen[person_id] = self.frame_index
+            self.first_seen.setdefault(person_id, self.frame_index)
+
+        return detected_persons
+
+    def _expire_tracks(self):
+        """Remove persons that disappeared too long ago"""
+        for person_id in list(self.last_seen.keys()):
+            if self.frame_index - self.last_seen[person_id] > self.max_disappeared:
+                self._remove(person_id)
+
+    def _assign_person_id(self, detected_person: PersonBoundingBox) -> int:
+        """
+        Assign ID to detected person based on proximity to existing tracked persons
+
+        Args:
+            detected_person: Newly detected person
+
+        Returns:
+            Person ID (existing or new)
+        """
+        if not self.tracked_persons:
+            return self._new_person_id()
+
+        # Find closest existing person, compared at its predicted position
+        min_distance = float('inf')
+        closest_id = None
+        center1 = detected_person.center
+
+        for person_id, tracked_person in self.tracked_persons.items():
+            center2 = self._predicted_center(person_id)
+            distance = np.sqrt((center1[0] - center2[0])**2 + (center1[1] - center2[1])**2)
+
+            if distance < min_distance:
+                min_distance = distance
+                closest_id = person_id
+
+        # If closest person is within threshold, use their ID
+        if min_distance < self.max_distance:
+            return closest_id
+
+        # Otherwise, assign new ID
+        return self._new_person_id()
+
+    def _new_person_id(self) -> int:
+        """Allocate an ID that no earlier track has used"""
+        person_id = self.next_person_id
+        self.next_person_id += 1
+        return person_id
+
+    def _update_velocity(self, person_id: int, detected_person: PersonBoundingBox):
+        """
+        Update the velocity estimate of a track from a new observation
+
+        Args:
+            person_id: Track ID
+            detected_person: New box for the track
+        """
+        previous = self.tracked_persons.get(person_id)
+        if previous is None:
+            self.velocities[person_id] = (0.0, 0.0)
+            return
+        if self.last_seen[person_id] == self.frame_index:
+            # Second match in the same frame carries no motion information
+            return
+
+        frames = max(1, self.frame_index - self.last_seen[person_id])
+        (x_new, y_new), (x_old, y_old) = detected_person.center, previous.center
+        vx = (x_new - x_old) / frames
+        vy = (y_new - y_old) / frames
+
+        # Smooth velocity to suppress box jitter
+        old_vx, old_vy = self.velocities.get(person_id, (vx, vy))
+        self.velocities[person_id] = (0.5 * old_vx + 0.5 * vx, 0.5 * old_vy + 0.5 * vy)
+
+    def _predicted_center(self, person_id: int) -> Tuple[float, float]:
+        """Get the center of a track extrapolated to the current frame"""
+        center_x, center_y = self.tracked_persons[person_id].center
+        vx, vy = self.velocities.get(person_id, (0.0, 0.0))
+        frames = self.frame_index - self.last_seen[person_id]
+        return center_x + vx * frames, center_y + vy * frames
+
+    def predict(self, frame_index: int) -> List[PersonBoundingBox]:
+        """
+        Predict boxes of active tracks at a frame without detections
+
+        Tracks are moved by their constant-velocity model; the stored state
+        is not changed, so the next detection pass is matched normally.
+        Only tracks matched on the most recent detection pass are predicted,
+        so persons that already left the view are not reported again.
+
+        Args:
+            frame_index: Index of the frame to predict for
+
+        Returns:
+            List of predicted PersonBoundingBox objects with track IDs
+        """
+        predicted = []
+        for person_id, person in self.tracked_persons.items():
+            if self.last_seen[person_id] != self.frame_index:
+                continue
+            frames = frame_index - self.last_seen[person_id]
+            vx, vy = self.velocities.get(person_id, (0.0, 0.0))
+            predicted.append(shift_box(person, vx * frames, vy * frames))
+        return predicted
+
+    def get_track(self,
+                  person_id: int,
+                  frame_index: int,
+                  max_frames: Optional[int] = None) -> Optional[PersonBoundingBox]:
+        """
+        Get the predicted box of a live track, seen or not on the latest pass
+
+        Args:
+            person_id: Track ID
+            frame_index: Index of the frame to predict for
+            max_frames: Frames since the last match after which no box is
+                returned (None uses max_disappeared)
+
+        Returns:
+            Predicted PersonBoundingBox, or None if the track is unknown or
+            unmatched for too long
+        """
+        person = self.tracked_persons.get(person_id)
+        if person is None:
+            return None
+        frames = frame_index - self.last_seen[person_id]
+        limit = self.max_disappeared if max_frames is None else min(max_frames, self.max_disappeared)
+        if frames > limit:
+            return None
+        vx, vy = self.velocities.get(person_id, (0.0, 0.0))
+        return shift_box(person, vx * frames, vy * frames)
+
+    def get_velocity(self, person_id: int) -> Tuple[float, float]:
+        """
+        Get the velocity of a track
+
+        Args:
+            person_id: Track ID
+
+        Returns:
+            (vx, vy) in pixels per frame
+        """
+        return self.velocities.get(person_id, (0.0, 0.0))
+
+    def get_track_age(self, person_id: int) -> int:
+        """
+        Get the number of frames since a track started
+
+        Args:
+            person_id: Track ID
+
+        Returns:
+            Track age in frames (0 for unknown tracks)
+        """
+        first_seen = self.first_seen.get(person_id)
+        return self.frame_index - first_seen if first_seen is not None else 0
+
+    def _remove(self, person_id: int):
+        """Forget a track"""
+        self.tracked_persons.pop(person_id, None)
+        self.last_seen.pop(person_id, None)
+        self.velocities.pop(person_id, None)
+        self.first_seen.pop(person_id, None)
+
+    def reset(self):
+        """Forget all tracks"""
+        self.tracked_persons.clear()
+        self.last_seen.clear()
+        self.velocities.clear()
+        self.first_seen.clear()
+        logging.debug("Tracker reset")
+
+class HungarianTracker(CentroidTracker):
+    """
+    Tracker with optimal one-to-one assignment of detections to tracks
+
+    This class provides methods to:
+    1. Build the detection-to-track cost matrix from IoU and centroid
+       distance in one vectorized step
+    2. Solve it with the Hungarian algorithm, so no two detections share an ID
+    3. Gate matches by a distance that scales with the track's box size
+    4. Estimate velocity and predict boxes like CentroidTracker
+    """
+
+    # Cost of pairs outside the gate; never chosen over a feasible pair
+    INFEASIBLE_COST = 1e6
+
+    def __init__(self,
+                 max_disappeared: int = 30,
+                 gate_scale: float = 0.5,
+                 min_gate: float = 20.0,
+                 iou_weight: float = 1.0):
+        """
+        Initialize Hungarian tracker
+
+        Args:
+            max_disappeared: Frames without a match before a track is dropped
+            gate_scale: Maximum centroid distance for a match, as a fraction
+                of the track's box height
+            min_gate: Lower bound of the gate in pixels, for small boxes
+            iou_weight: Weight of (1 - IoU) relative to the normalized
+                centroid distance in the matching cost
+        """
+        super().__init__(max_disappeared=max_disappeared)
+        self.gate_scale = gate_scale
+        self.min_gate = min_gate
+        self.iou_weight = iou_weight
+
+    def update(self,
+               detected_persons: List[PersonBoundingBox],
+               frame_index: Optional[int] = None) -> List[PersonBoundingBox]:
+        """
+        Assign track IDs to new detections
+
+        Args:
+            detected_persons: Detections from the current frame
+            frame_index: Index of the current frame (defaults to one past the last update)
+
+        Returns:
+            The detections with person_id set
+        """
+        self.frame_index = frame_index if frame_index is not None else self.frame_index + 1
+        self._expire_tracks()
+        if not detected_persons:
+            return detected_persons
+
+        assignments = self._match(detected_persons)
+        for index, detected_person in enumerate(detected_persons):
+            person_id = assignments.get(index)
+            if person_id is None:
+                person_id = self._new_person_id()
+            detected_person.person_id = person_id
+
+            self._update_velocity(person_id, detected_person)
+
+            # Update tracking information
+            self.tracked_persons[person_id] = detected_person
+            self.last_seen[person_id] = self.frame_index
+            self.first_seen.setdefault(person_id, self.frame_index)
+
+        return detected_persons
+
+    def _match(self, detected_persons: List[PersonBoundingBox]) -> Dict[int, int]:
+        """
+        Match detections to tracks one-to-one
+
+        Args:
+            detected_persons: Detections from the current frame
+
+        Returns:
+            Mapping of detection index to matched person ID
+        """
+        if not self.tracked_persons:
+            return {}
+
+        track_ids = list(self.tracked_persons.keys())
+        detections = persons_to_array(detected_persons)[:, :4]
+        tracks = self._predicted_boxes(track_ids)
+
+        cost, feasible = self._cost_matrix(detections, tracks)
+        rows, cols = linear_sum_assignment(np.where(feasible, cost, self.INFEASIBLE_COST))
+        return {row: track_ids[col] for row, col in zip(rows, cols) if feasible[row, col]}
+
+    def _predicted_boxes(self, track_ids: List[int]) -> np.ndarray:
+        """Get the boxes of tracks extrapolated to the current frame as an (M, 4) array"""
+        boxes = np.array([(p.x1, p.y1, p.x2, p.y2) for p in
+                          (self.tracked_persons[person_id] for person_id in track_ids)], dtype=np.float32)
+        velocities = np.array([self.velocities.get(person_id, (0.0, 0.0)) for person_id in track_ids],
+                              dtype=np.float32)
+        frames = np.array([self.frame_index - self.last_seen[person_id] for person_id in track_ids],
+                          dtype=np.float32)
+        return boxes + np.tile(velocities * frames[:, None], 2)
+
+    def _cost_matrix(self, detections: np.ndarray, tracks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute matching costs of every detection-track pair
+
+        Args:
+            detections: (N, 4) detection boxes
+            tracks: (M, 4) predicted track boxes
+
+        Returns:
+            Tuple of the (N, M) cost matrix and the (N, M) mask of pairs inside the gate
+        """
+        detection_centers = (detections[:, :2] + detections[:, 2:]) / 2
+        track_centers = (tracks[:, :2] + tracks[:, 2:]) / 2
+        distance = np.linalg.norm(detection_centers[:, None, :] - track_centers[None, :, :], axis=2)
+
+        # Close (large) persons move more pixels per frame than distant ones
+        gate = np.maximum(self.min_gate, self.gate_scale * (tracks[:, 3] - tracks[:, 1]))
+        normalized_distance = distance / gate[None, :]
+
+        cost = normalized_distance + self.iou_weight * (1.0 - box_iou(detections, tracks))
+        return cost, normalized_distance <= 1.0
+
+class KalmanTracker(HungarianTracker):
+    """
+    SORT-style tracker with a constant-velocity Kalman filter per track
+
+    This class provides methods to:
+    1. Predict every track forward with one batched Kalman step
+    2. Match detections to predicted boxes with the Hungarian algorithm
+    3. Correct matched tracks with a batched Kalman update
+    4. Confirm tracks after several hits and age out unmatched ones
+
+    Track state lives in stacked arrays rather than per-track objects.
+    The state of a track is its box center, width and height, followed by
+    their velocities in pixels per frame. Noise scales with box height.
+    """
+
+    STATE_SIZE = 8
+
+    def __init__(self,
+                 max_disappeared: int = 30,
+                 min_hits: int = 3,
+                 gate_scale: float = 0.5,
+                 min_gate: float = 20.0,
+                 iou_weight: float = 1.0,
+                 position_noise: float = 1.0 / 20,
+                 velocity_noise: float = 1.0 / 160,
+                 measurement_noise: float = 1.0 / 20):
+        """
+        Initialize Kalman tracker
+
+        Args:
+            max_disappeared: Maximum age in frames since the last match
+                before a confirmed track is dropped
+            min_hits: Matches needed before a track is confirmed and reported;
+                unconfirmed tracks are dropped on their first miss
+            gate_scale: Maximum centroid distance for a match, as a fraction
+                of the track's box height
+            min_gate: Lower bound of the gate in pixels, for small boxes
+            iou_weight: Weight of (1 - IoU) in the matching cost
+            position_noise: Process noise of the box, as a fraction of its height
+            velocity_noise: Process noise of the velocity, as a fraction of the box height
+            measurement_noise: Detection noise, as a fraction of the box height
+        """
+        super().__init__(max_disappeared=max_disappeared, gate_scale=gate_scale,
+                         min_gate=min_gate, iou_weight=iou_weight)
+        self.min_hits = min_hits
+        self.position_noise = position_noise
+        self.velocity_noise = velocity_noise
+        self.measurement_noise = measurement_noise
+
+        # Stacked track state, one row per track
+        self.ids = np.empty(0, dtype=np.int64)
+        self.means = np.empty((0, self.STATE_SIZE))
+        self.covariances = np.empty((0, self.STATE_SIZE, self.STATE_SIZE))
+        self.hits = np.empty(0, dtype=np.int64)
+        self.last_seen_frames = np.empty(0, dtype=np.int64)
+        self.first_seen_frames = np.empty(0, dtype=np.int64)
+        self.confidences = np.empty(0)
+        self.rows: Dict[int, int] = {}  # person_id -> row index, rebuilt when rows are added or removed
+        self.state_frame = 0  # Frame the means and covariances refer to
+        self.updates = 0
+
+    def update(self,
+               detected_persons: List[PersonBoundingBox],
+               frame_index: Optional[int] = None) -> List[PersonBoundingBox]:
+        """
+        Predict all tracks to the current frame and correct them with detections
+
+        Args:
+            detected_persons: Detections from the current frame
+            frame_index: Index of the current frame (defaults to one past the last update)
+
+        Returns:
+            Filtered boxes of the confirmed tracks matched on this frame (the
+            detections themselves get their track ID set)
+        """
+        self.frame_index = frame_index if frame_index is not None else self.frame_index + 1
+        self.updates += 1
+        self._predict_state(self.frame_index)
+
+        records = persons_to_array(detected_persons).astype(np.float64)
+        detections, confidences = records[:, :4], records[:, 4]
+        matched_tracks = np.empty(0, dtype=np.int64)
+        matched_detections = np.empty(0, dtype=np.int64)
+        if len(detections) and len(self.ids):
+            cost, feasible = self._cost_matrix(detections, self._boxes(self.means))
+            rows, cols = linear_sum_assignment(np.where(feasible, cost, self.INFEASIBLE_COST))
+            keep = feasible[rows, cols]
+            matched_detections, matched_tracks = rows[keep], cols[keep]
+
+        self._correct(matched_tracks, detections[matched_detections], confidences[matched_detections])
+
+        # Age out tracks: unconfirmed ones on their first miss, confirmed ones after max_disappeared
+        missed = np.ones(len(self.ids), dtype=bool)
+        missed[matched_tracks] = False
+        age = self.frame_index - self.last_seen_frames
+        expired = missed & ((self.hits < self.min_hits) | (age > self.max_disappeared))
+
+        matched_ids = self.ids[matched_tracks]
+        self._remove_rows(expired)
+
+        unmatched = np.setdiff1d(np.arange(len(detections)), matched_detections)
+        new_rows = self._add_tracks(detections[unmatched], confidences[unmatched])
+
+        # Detections carry their track ID, as with the other trackers
+        detection_ids = np.empty(len(detections), dtype=np.int64)
+        detection_ids[matched_detections] = matched_ids
+        detection_ids[unmatched] = self.ids[new_rows]
+        for detected_person, person_id in zip(detected_persons, detection_ids.tolist()):
+            detected_person.person_id = person_id
+
+        rows = np.concatenate([np.flatnonzero(np.isin(self.ids, matched_ids)), new_rows])
+        rows = rows[self._confirmed(rows)]
+        return self._to_persons(self.means[rows, :4], rows)
+
+    def _predict_state(self, frame_index: int):
+        """Advance every track to a frame with one batched Kalman predict step"""
+        frames = frame_index - self.state_frame
+        self.state_frame = frame_index
+        if frames <= 0 or not len(self.ids):
+            return
+
+        transition = np.eye(self.STATE_SIZE)
+        transition[:4, 4:] = np.eye(4) * frames
+        self.means = self.means @ transition.T
+
+        heights = self.means[:, 3:4]
+        std = np.hstack([np.repeat(self.position_noise * heights, 4, axis=1),
+                         np.repeat(self.velocity_noise * heights, 4, axis=1)])
+        process_noise = (std ** 2 * frames)[:, :, None] * np.eye(self.STATE_SIZE)
+        self.covariances = transition @ self.covariances @ transition.T + process_noise
+
+    def _correct(self, tracks: np.ndarray, measurements: np.ndarray, confidences: np.ndarray):
+        """
+        Correct matched tracks with one batched Kalman update step
+
+        Args:
+            tracks: Row indices of the matched tracks
+            measurements: (K, 4) matched detection boxes as x1, y1, x2, y2
+            confidences: (K,) matched detection confidences
+        """
+        if not len(tracks):
+            return
+        observed = self._states(measurements)
+        means = self.means[tracks]
+        covariances = self.covariances[tracks]
+
+        std = self.measurement_noise * means[:, 3:4]
+        measurement_noise = (np.repeat(std, 4, axis=1) ** 2)[:, :, None] * np.eye(4)
+        innovation_covariance = covariances[:, :4, :4] + measurement_noise
+        gain = covariances[:, :, :4] @ np.linalg.inv(innovation_covariance)
+
+        innovation = observed - means[:, :4]
+        self.means[tracks] = means + (gain @ innovation[:, :, None])[:, :, 0]
+        self.covariances[tracks] = covariances - gain @ covariances[:, :4, :]
+        self.hits[tracks] += 1
+        self.last_seen_frames[tracks] = self.frame_index
+        self.confidences[tracks] = confidences
+
+    def _add_tracks(self, boxes: np.ndarray, confidences: np.ndarray) -> np.ndarray:
+        """Start tentative tracks for unmatched detections, returning their row indices"""
+        count = len(boxes)
+        if not count:
+            return np.empty(0, dtype=np.int64)
+        states = self._states(boxes)
+        means = np.hstack([states, np.zeros((count, 4))])
+
+        heights = states[:, 3:4]
+        std = np.hstack([np.repeat(2 * self.position_noise * heights, 4, axis=1),
+                         np.repeat(10 * self.velocity_noise * heights, 4, axis=1)])
+        covariances = (std ** 2)[:, :, None] * np.eye(self.STATE_SIZE)
+
+        ids = np.arange(self.next_person_id, self.next_person_id + count)
+        self.next_person_id += count
+        self.ids = np.concatenate([self.ids, ids])
+        self.means = np.concatenate([self.means, means])
+        self.covariances = np.concatenate([self.covariances, covariances])
+        self.hits = np.concatenate([self.hits, np.ones(count, dtype=np.int64)])
+        self.last_seen_frames = np.concatenate([self.last_seen_frames,
+                                                np.full(count, self.frame_index, dtype=np.int64)])
+        self.first_seen_frames = np.concatenate([self.first_seen_frames,
+                                                 np.full(count, self.frame_index, dtype=np.int64)])
+        self.confidences = np.concatenate([self.confidences, confidences])
+        self.rows.update(zip(ids.tolist(), range(len(self.ids) - count, len(self.ids))))
+        return np.arange(len(self.ids) - count, len(self.ids))
+
+    def _remove_rows(self, mask: np.ndarray):
+        """Drop the tracks selected by a boolean mask"""
+        keep = ~mask
+        self.ids = self.ids[keep]
+        self.means = self.means[keep]
+        self.covariances = self.covariances[keep]
+        self.hits = self.hits[keep]
+        self.last_seen_frames = self.last_seen_frames[keep]
+        self.first_seen_frames = self.first_seen_frames[keep]
+        self.confidences = self.confidences[keep]
+        if not keep.all():
+            self.rows = {person_id: row for row, person_id in enumerate(self.ids.tolist())}
+
+    def _confirmed(self, rows: np.ndarray) -> np.ndarray:
+        """Get the mask of rows reported as tracks; all are during the first updates"""
+        if self.updates <= self.min_hits:
+            return np.ones(len(rows), dtype=bool)
+        return self.hits[rows] >= self.min_hits
+
+    @staticmethod
+    def _states(boxes: np.ndarray) -> np.ndarray:
+        """Convert x1, y1, x2, y2 boxes to center x, center y, width, height"""
+        return np.hstack([(boxes[:, :2] + boxes[:, 2:4]) / 2, boxes[:, 2:4] - boxes[:, :2]])
+
+    @staticmethod
+    def _boxes(states: np.ndarray) -> np.ndarray:
+        """Convert center x, center y, width, height states to x1, y1, x2, y2 boxes"""
+        half = states[:, 2:4] / 2
+        return np.hstack([states[:, :2] - half, states[:, :2] + half])
+
+    def _to_persons(self, states: np.ndarray, rows: np.ndarray) -> List[PersonBoundingBox]:
+        """Create boxes for track rows from their (center, size) states"""
+        boxes = np.rint(self._boxes(states)).astype(int).tolist()
+        return [
+            PersonBoundingBox(x1=x1, y1=y1, x2=x2, y2=y2, confidence=float(confidence), person_id=int(person_id))
+            for (x1, y1, x2, y2), confidence, person_id in
+            zip(boxes, self.confidences[rows].tolist(), self.ids[rows].tolist())
+        ]
+
+    def predict(self, frame_index: int) -> List[PersonBoundingBox]:
+        """
+        Predict boxes of confirmed tracks at a frame without detections
+
+        The filter state is not changed, so the next detection pass is
+        predicted and matched normally. Only tracks matched on the most
+        recent detection pass are predicted.
+
+        Args:
+            frame_index: Index of the frame to predict for
+
+        Returns:
+            List of predicted PersonBoundingBox objects with track IDs
+        """
+        frames = frame_index - self.state_frame
+        rows = np.flatnonzero(self._confirmed(np.arange(len(self.ids))) &
+                              (self.last_seen_frames == self.frame_index))
+        states = self.means[rows, :4] + frames * self.means[rows, 4:]
+        return self._to_persons(states, rows)
+
+    def get_track(self,
+                  person_id: int,
+                  frame_index: int,
+                  max_frames: Optional[int] = None) -> Optional[PersonBoundingBox]:
+        """
+        Get the predicted box of a live track, seen or not on the latest pass
+
+        Args:
+            person_id: Track ID
+            frame_index: Index of the frame to predict for
+            max_frames: Frames since the last match after which no box is
+                returned (None uses max_disappeared)
+
+        Returns:
+            Predicted PersonBoundingBox, or None if the track is unknown or
+            unmatched for too long
+        """
+        row = self.rows.get(person_id)
+        limit = self.max_disappeared if max_frames is None else min(max_frames, self.max_disappeared)
+        if row is None or frame_index - self.last_seen_frames[row] > limit:
+            return None
+        rows = np.array([row])
+        frames = frame_index - self.state_frame
+        states = self.means[rows, :4] + frames * self.means[rows, 4:]
+        return self._to_persons(states, rows)[0]
+
+    def get_velocity(self, person_id: int) -> Tuple[float, float]:
+        """
+        Get the filtered velocity of a track
+
+        Args:
+            person_id: Track ID
+
+        Returns:
+            (vx, vy) in pixels per frame
+        """
+        row = self.rows.get(person_id)
+        if row is None:
+            return (0.0, 0.0)
+        vx, vy = self.means[row, 4:6]
+        return float(vx), float(vy)
+
+    def get_track_age(self, person_id: int) -> int:
+        """
+        Get the number of frames since a track started
+
+        Args:
+            person_id: Track ID
+
+        Returns:
+            Track age in frames (0 for unknown tracks)
+        """
+        row = self.rows.get(person_id)
+        return int(self.frame_index - self.first_seen_frames[row]) if row is not None else 0
+
+    def reset(self):
+        """Forget all tracks"""
+        self._remove_rows(np.ones(len(self.ids), dtype=bool))
+        self.updates = 0
+        logging.debug("Tracker reset")
+
+def shift_box(person: PersonBoundingBox, dx: float, dy: float) -> PersonBoundingBox:
+    """
+    Create a copy of a box moved by an offset
+
+    Args:
+        person: Box to move
+        dx: Horizontal offset in pixels
+        dy: Vertical offset in pixels
+
+    Returns:
+        New PersonBoundingBox with the same ID and confidence
+    """
+    dx, dy = int(round(dx)), int(round(dy))
+    return PersonBoundingBox(
+        x1=person.x1 + dx, y1=person.y1 + dy,
+        x2=person.x2 + dx, y2=person.y2 + dy,
+        confidence=person.confidence,
+        person_id=person.person_id,
+        camera_id=person.camera_id
+    )
+
+TRACKERS: Dict[str, Type[CentroidTracker]] = {
+    "centroid": CentroidTracker,
+    "hungarian": HungarianTracker,
+    "kalman": KalmanTracker
+}
+
+def list_trackers() -> List[str]:
+    """Get the names of all tracker types"""
+    return list(TRACKERS.keys())
+
+def create_tracker(name: str = "centroid", max_disappeared: int = 30) -> CentroidTracker:
+    """
+    Create a tracker by name
+
+    Args:
+        name: Tracker type ('centroid', 'hungarian' or 'kalman')
+        max_disappeared: Frames without a match before a track is dropped
+
+    Returns:
+        Tracker instance
+
+    Raises:
+        ValueError: If the name is not a known tracker type
+    """
+    if name not in TRACKERS:
+        raise ValueError(f"Unknown tracker '{name}', expected one of {list_trackers()}")
+    return TRACKERS[name](max_disappeared=max_disappeared)
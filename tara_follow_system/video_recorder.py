@@ -0,0 +1,188 @@
+"""
+Asynchronous Video Recorder for Tara Robot
+
+This module encodes recorded frames on a background thread with a bounded
+queue, so video encoding time never adds to the follow loop's latency.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .capture import FrameDropPolicy
+
+class AsyncVideoRecorder:
+    """
+    Background video writer with a bounded frame queue
+
+    This class provides methods to:
+    1. Queue frames for encoding without blocking the caller
+    2. Apply a drop policy when the encoder falls behind
+    3. Record only every Nth frame (decimation)
+    4. Report written and dropped frame statistics
+    """
+
+    def __init__(self,
+                 filename: str,
+                 fps: float,
+                 frame_size: Tuple[int, int],
+                 codec: str = 'XVID',
+                 queue_size: int = 30,
+                 drop_policy: FrameDropPolicy = FrameDropPolicy.DROP_OLDEST,
+                 record_every: int = 1):
+        """
+        Initialize asynchronous video recorder
+
+        Args:
+            filename: Output video filename
+            fps: Frame rate of the incoming frames
+            frame_size: (width, height) of recorded frames
+            codec: FourCC codec code
+            queue_size: Maximum number of frames waiting to be encoded
+            drop_policy: Policy applied when the queue is full
+            record_every: Record only every Nth submitted frame
+        """
+        self.filename = filename
+        self.frame_size = frame_size
+        self.queue_size = max(1, queue_size)
+        self.drop_policy = FrameDropPolicy(drop_policy)
+        self.record_every = max(1, record_every)
+
+        # Output frame rate matches the decimated stream
+        fourcc = cv2.VideoWriter_fourcc(*codec)
+        self.writer = cv2.VideoWriter(filename, fourcc, fps / self.record_every, frame_size)
+
+        # Frame queue guarded by a condition variable
+        self._queue = deque()
+        self._condition = threading.Condition()
+
+        # Threading and control
+        self.is_running = False
+        self.writer_thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.frames_submitted = 0
+        self.frames_skipped = 0  # Skipped by decimation
+        self.frames_dropped = 0  # Dropped by the queue policy
+        self.frames_written = 0
+        self.write_time = 0.0
+        self.max_queue_depth = 0
+
+    def start(self):
+        """Start the background writer thread"""
+        if self.is_running:
+            logging.warning("Video recorder is already running")
+            return
+
+        if not self.writer.isOpened():
+            logging.error(f"Failed to open video writer for {self.filename}")
+            return
+
+        self.is_running = True
+        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.writer_thread.start()
+
+        logging.info(f"Recording to {self.filename} (queue={self.queue_size}, "
+                     f"policy={self.drop_policy.value}, every {self.record_every} frame(s))")
+
+    def write(self, frame: np.ndarray):
+        """
+        Queue a frame for recording
+
+        The caller must not modify the frame after submitting it.
+
+        Args:
+            frame: Frame to record
+        """
+        if not self.is_running:
+            return
+
+        self.frames_submitted += 1
+        if (self.frames_submitted - 1) % self.record_every:
+            self.frames_skipped += 1
+            return
+
+        with self._condition:
+            if len(self._queue) >= self.queue_size:
+                if self.drop_policy == FrameDropPolicy.DROP_NEWEST:
+                    self.frames_dropped += 1
+                    return
+                elif self.drop_policy == FrameDropPolicy.BLOCK:
+                    while len(self._queue) >= self.queue_size and self.is_running:
+                        self._condition.wait(timeout=0.1)
+                else:
+                    self._queue.popleft()
+                    self.frames_dropped += 1
+
+            self._queue.append(frame)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+            self._condition.notify_all()
+
+    def _writer_loop(self):
+        """Encode queued frames until stopped and the queue is empty"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or not self.is_running)
+                if not self._queue:
+                    break
+                frame = self._queue.popleft()
+                self._condition.notify_all()
+
+            started = time.monotonic()
+            if (frame.shape[1], frame.shape[0]) != self.frame_size:
+                # The writer silently drops frames of any other size
+                frame = cv2.resize(frame, self.frame_size)
+            self.writer.write(frame)
+            self.write_time += time.monotonic() - started
+            self.frames_written += 1
+
+    def get_stats(self) -> dict:
+        """
+        Get recording statistics
+
+        Returns:
+            Dictionary with recorder counters
+        """
+        return {
+            "frames_submitted": self.frames_submitted,
+            "frames_written": self.frames_written,
+            "frames_skipped": self.frames_skipped,
+            "frames_dropped": self.frames_dropped,
+            "queue_depth": len(self._queue),
+            "max_queue_depth": self.max_queue_depth,
+            "avg_write_ms": (self.write_time / self.frames_written * 1000.0
+                             if self.frames_written else 0.0)
+        }
+
+    def release(self, timeout: float = 5.0):
+        """
+        Flush queued frames, stop the writer thread and close the file
+
+        Args:
+            timeout: Maximum time to wait for queued frames to be encoded
+        """
+        with self._condition:
+            self.is_running = False
+            self._condition.notify_all()
+
+        if self.writer_thread and self.writer_thread.is_alive():
+            self.writer_thread.join(timeout=timeout)
+            if self.writer_thread.is_alive():
+                # Abandon the backlog so the file can still be finalized
+                logging.warning("Video recorder did not finish flushing in time")
+                with self._condition:
+                    self.frames_dropped += len(self._queue)
+                    self._queue.clear()
+                self.writer_thread.join(timeout=1.0)
+
+        self.writer.release()
+
+        stats = self.get_stats()
+        logging.info(f"Recording finished: {stats['frames_written']} written, "
+                     f"{stats['frames_dropped']} dropped, {stats['frames_skipped']} skipped "
+                     f"by decimation, avg encode {stats['avg_write_ms']:.1f} ms")